@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 import logging
 from typing import Dict, Any, Optional
 from app.agents.schema.resume_create_agent import ResumeAgentState
+from app.utils.llm_admission import LLMOverloadedError, PRIORITY_DEFAULT
+from app.utils.vllm_gateway import LLMCircuitOpenError
 
 
 class BaseNode(ABC):
@@ -44,6 +46,9 @@ class BaseNode(ABC):
 
             return result_state
 
+        except LLMOverloadedError:
+            # 과부하 거절은 상태에 기록하지 않고 API 레이어로 전달
+            raise
         except Exception as e:
             self.logger.error(f"❌ {node_name} 실행 실패: {str(e)}")
             # 에러 발생시 원본 상태에 에러 정보 추가
@@ -157,11 +162,17 @@ class LLMBaseNode(BaseNode):
 
             self.llm = create_llm_client(temperature=0.3)
         else:
-            # 기존 ChatOpenAI 객체인 경우 래핑
-            if hasattr(llm, "model_name") or hasattr(llm, "model"):
-                from app.utils.llm_client import ChatLLM
+            from app.utils.llm_client import ChatLLM, LLMClient
 
-                self.llm = ChatLLM(temperature=getattr(llm, "temperature", 0.3))
+            if isinstance(llm, (LLMClient, ChatLLM)):
+                # 통합 클라이언트는 그대로 사용 (생성 시 지정한 대기열 우선순위 유지)
+                self.llm = llm
+            # 기존 ChatOpenAI 객체인 경우 래핑
+            elif hasattr(llm, "model_name") or hasattr(llm, "model"):
+                self.llm = ChatLLM(
+                    temperature=getattr(llm, "temperature", 0.3),
+                    priority=getattr(llm, "priority", PRIORITY_DEFAULT),
+                )
             else:
                 self.llm = llm
 
@@ -177,15 +188,18 @@ class LLMBaseNode(BaseNode):
         prompt: str,
         system_prompt: str = None,
         fallback_response: str = "처리 중 오류가 발생했습니다.",
+        max_tokens: Optional[int] = None,
     ) -> str:
         """
         안전한 LLM 호출 - 에러 핸들링 포함
+        - max_tokens: 생성 토큰 상한 (LLMClient/ChatLLM에서만 적용, 미지정 시 클라이언트 기본값)
         """
+        extra = {"max_tokens": max_tokens} if max_tokens else {}
         try:
             # LLM 클라이언트 타입에 따른 호출 방식 결정
             if hasattr(self.llm, "client") and hasattr(self.llm.client, "ainvoke"):
                 # 새로운 LLMClient 또는 ChatLLM 사용
-                response = await self.llm.ainvoke(prompt, system_prompt)
+                response = await self.llm.ainvoke(prompt, system_prompt, **extra)
             elif hasattr(self.llm, "ainvoke"):
                 # 직접 LLMClient 사용하거나 기존 ChatOpenAI
                 if system_prompt:
@@ -194,7 +208,8 @@ class LLMBaseNode(BaseNode):
 
                     sig = inspect.signature(self.llm.ainvoke)
                     if len(sig.parameters) > 1:  # self 제외하고 2개 이상 파라미터
-                        response = await self.llm.ainvoke(prompt, system_prompt)
+                        kwargs = extra if "max_tokens" in sig.parameters else {}
+                        response = await self.llm.ainvoke(prompt, system_prompt, **kwargs)
                     else:
                         # system_prompt를 지원하지 않으면 prompt에 합침
                         full_prompt = f"{system_prompt}\n\n{prompt}"
@@ -211,6 +226,9 @@ class LLMBaseNode(BaseNode):
             else:
                 return str(response).strip()
 
+        except (LLMOverloadedError, LLMCircuitOpenError):
+            # 노드별 fallback은 execute에서 처리
+            raise
         except Exception as e:
             self.logger.error(f"LLM 호출 실패: {str(e)}")
             return fallback_response
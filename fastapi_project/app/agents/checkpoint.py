@@ -0,0 +1,63 @@
+import os
+import logging
+from contextlib import AsyncExitStack
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 세션 모드 에이전트 상태 저장소: sqlite(기본) / redis / memory
+AGENT_CHECKPOINTER = os.getenv("AGENT_CHECKPOINTER", "sqlite").lower()
+AGENT_CHECKPOINT_SQLITE_PATH = os.getenv("AGENT_CHECKPOINT_SQLITE_PATH", "cache/agent_checkpoints.sqlite3")
+AGENT_CHECKPOINT_REDIS_URL = os.getenv("AGENT_CHECKPOINT_REDIS_URL", "redis://localhost:6379")
+
+_stack: Optional[AsyncExitStack] = None
+_checkpointer = None
+
+
+async def init_checkpointer() -> None:
+    """FastAPI startup 시 체크포인터 생성 (backend 패키지는 선택한 경우에만 import)"""
+    global _stack, _checkpointer
+    if _checkpointer is not None:
+        return
+
+    stack = AsyncExitStack()
+    if AGENT_CHECKPOINTER == "sqlite":
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+        directory = os.path.dirname(AGENT_CHECKPOINT_SQLITE_PATH)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        saver = await stack.enter_async_context(
+            AsyncSqliteSaver.from_conn_string(AGENT_CHECKPOINT_SQLITE_PATH)
+        )
+    elif AGENT_CHECKPOINTER == "redis":
+        # 여러 인스턴스가 세션을 공유할 때 (pip install langgraph-checkpoint-redis)
+        from langgraph.checkpoint.redis.aio import AsyncRedisSaver
+
+        saver = await stack.enter_async_context(
+            AsyncRedisSaver.from_conn_string(AGENT_CHECKPOINT_REDIS_URL)
+        )
+        await saver.asetup()
+    elif AGENT_CHECKPOINTER == "memory":
+        from langgraph.checkpoint.memory import MemorySaver
+
+        saver = MemorySaver()
+    else:
+        raise ValueError(f"지원하지 않는 AGENT_CHECKPOINTER: {AGENT_CHECKPOINTER}")
+
+    _stack, _checkpointer = stack, saver
+    logger.info(f"에이전트 체크포인터 사용: {AGENT_CHECKPOINTER}")
+
+
+async def close_checkpointer() -> None:
+    """FastAPI shutdown 시 체크포인터 연결 정리"""
+    global _stack, _checkpointer
+    if _stack is not None:
+        await _stack.aclose()
+    _stack, _checkpointer = None, None
+
+
+def get_checkpointer():
+    if _checkpointer is None:
+        raise RuntimeError("에이전트 체크포인터가 초기화되지 않았습니다")
+    return _checkpointer
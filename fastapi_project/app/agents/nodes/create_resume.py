@@ -1,7 +1,8 @@
 import os
+import time
 from datetime import datetime
 import asyncio
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 from app.utils.llm_client import LLMClient, create_llm_client
 from app.agents.schema.resume_create_agent import ResumeAgentState
 from docx import Document
@@ -12,6 +13,36 @@ from docx.oxml.ns import qn
 from bs4 import BeautifulSoup
 from markdown2 import markdown
 from app.agents.base_node import LLMBaseNode
+from app.utils.llm_admission import LLMOverloadedError
+from app.utils.vllm_gateway import LLMCircuitOpenError
+
+
+# 요청과 무관한 고정 시스템 프롬프트 (vLLM prefix cache 재사용을 위해 모듈 상수로 유지)
+RESUME_SYSTEM_PROMPT = """당신은 전문 이력서 작성 컨설턴트입니다. 
+주어진 정보를 바탕으로 고품질의 마크다운 형식 이력서를 작성해주세요.
+다음 구조를 따라주세요:
+- 명확한 헤딩 구조 (# ## ### 사용)
+- 구체적이고 임팩트 있는 표현
+- 기술적 경험을 부각
+- 프로젝트 성과를 정량적으로 표현"""
+
+# 섹션별 생성 모드용 시스템 프롬프트 - 섹션 지시는 사용자 프롬프트 맨 끝에 두어 섹션 간 prefix 공유
+RESUME_SECTION_SYSTEM_PROMPT = """당신은 전문 이력서 작성 컨설턴트입니다.
+주어진 정보를 바탕으로 마크다운 형식 이력서의 한 섹션만 작성해주세요.
+- 지정된 "## 섹션명" 헤딩으로 시작하고 다른 섹션은 작성하지 마세요
+- 구체적이고 임팩트 있는 표현
+- 기술적 경험을 부각
+- 성과는 가능한 한 정량적으로 표현
+- 작성할 정보가 없으면 '없음'만 출력하세요"""
+
+# (섹션명, 생성 토큰 상한, 작성 지침) - 이 순서대로 문서에 조립
+RESUME_SECTIONS = [
+    ("경력 사항", 384, "재직 회사, 직무, 기간과 주요 업무 및 성과를 bullet로 작성하세요."),
+    ("프로젝트", 512, "프로젝트마다 ### 제목 아래 역할, 사용 기술, 성과를 작성하세요."),
+    ("기술 역량", 256, "분야별(언어, 프레임워크, 인프라 등) 기술 스택을 bullet로 정리하세요."),
+    ("자격증", 192, "자격증명과 취득 시기 또는 점수를 bullet로 작성하세요."),
+    ("기타", 256, "대외 활동, 교육, 수상 등 추가 경험을 bullet로 작성하세요."),
+]
 
 
 class CreateResumeNode(LLMBaseNode):
@@ -33,26 +64,24 @@ class CreateResumeNode(LLMBaseNode):
             "ENVIRONMENT", "development"
         )  # development, production
         self.use_s3 = os.getenv("USE_S3", "false").lower() == "true"
+        # single: 전체 이력서를 한 번에 생성 / sections: 섹션별 동시 생성 후 순서대로 조립
+        self.generation_mode = os.getenv("RESUME_GENERATION_MODE", "single").lower()
 
-        self.logger.info(f"환경: {self.environment}, S3 사용: {self.use_s3}")
+        self.logger.info(
+            f"환경: {self.environment}, S3 사용: {self.use_s3}, 생성 모드: {self.generation_mode}"
+        )
 
     async def execute(self, state: ResumeAgentState) -> ResumeAgentState:
         try:
-            prompt = self._build_resume_prompt(state)
-
-            # 시스템 프롬프트 정의
-            system_prompt = """당신은 전문 이력서 작성 컨설턴트입니다. 
-주어진 정보를 바탕으로 고품질의 마크다운 형식 이력서를 작성해주세요.
-다음 구조를 따라주세요:
-- 명확한 헤딩 구조 (# ## ### 사용)
-- 구체적이고 임팩트 있는 표현
-- 기술적 경험을 부각
-- 프로젝트 성과를 정량적으로 표현"""
+            if self.generation_mode == "sections":
+                content = await self._generate_sections(state)
+            else:
+                prompt = self._build_resume_prompt(state)
 
-            # LLM으로 이력서 생성 (시스템 프롬프트 포함)
-            content = await self._safe_llm_call(
-                prompt, system_prompt, "이력서 생성 중 오류가 발생했습니다."
-            )
+                # LLM으로 이력서 생성 (시스템 프롬프트 포함)
+                content = await self._safe_llm_call(
+                    prompt, RESUME_SYSTEM_PROMPT, "이력서 생성 중 오류가 발생했습니다."
+                )
 
             # 생성된 내용을 임시 저장 (에러 처리용)
             self._last_generated_content = content
@@ -72,6 +101,15 @@ class CreateResumeNode(LLMBaseNode):
 
             return state
 
+        except LLMOverloadedError:
+            raise
+        except LLMCircuitOpenError as e:
+            # vLLM 장애 중 - LLM 없이 입력 정보로 만든 기본 이력서 제공
+            self.logger.warning(f"vLLM 서킷 open, 기본 이력서 반환: {e}")
+            state.resume = self._create_fallback_resume(state)
+            state.step = "completed_with_error"
+            state.docx_path = ""
+            return state
         except Exception as e:
             self.logger.error(f"CreateResumeNode 실행 중 오류: {e}")
 
@@ -211,7 +249,8 @@ class CreateResumeNode(LLMBaseNode):
             self.logger.error(f"로컬 파일 생성 실패: {abs_path}")
             raise FileNotFoundError(f"파일을 생성할 수 없습니다: {abs_path}")
 
-    def _build_resume_prompt(self, state: ResumeAgentState) -> str:
+    def _format_resume_info(self, state: ResumeAgentState) -> Tuple[str, str]:
+        """(입력 정보, 질문 응답) 프롬프트 블록"""
         # LLM에 보낼 요약 정보
         base_info = f"""
     이메일: {state.inputs.email}
@@ -228,6 +267,10 @@ class CreateResumeNode(LLMBaseNode):
         qna_info = "\n".join(
             [f"Q: {a['question']}\nA: {a['answer']}" for a in state.answers]
         )
+        return base_info, qna_info
+
+    def _build_resume_prompt(self, state: ResumeAgentState) -> str:
+        base_info, qna_info = self._format_resume_info(state)
 
         return f"""
     다음은 이력서에 포함될 정보입니다. 아래 정보를 기반으로 고급 이력서 초안을 마크다운 형식으로 작성해주세요. 항목: 경력 사항, 프로젝트, 기술 역량, 자격증 등
@@ -239,6 +282,73 @@ class CreateResumeNode(LLMBaseNode):
     {qna_info}
     """
 
+    def _build_section_prompt(self, state: ResumeAgentState, title: str, guide: str) -> str:
+        """섹션별 프롬프트 - 섹션마다 다른 지시는 맨 끝에 둠 (입력 정보/질문 응답까지는 모든 섹션이 동일)"""
+        base_info, qna_info = self._format_resume_info(state)
+
+        return f"""
+    다음은 이력서에 포함될 정보입니다.
+
+    [입력 정보]
+    {base_info}
+
+    [질문 응답]
+    {qna_info}
+
+    [작성할 섹션]
+    위 정보를 기반으로 이력서의 "{title}" 섹션만 "## {title}" 헤딩으로 시작해 마크다운 형식으로 작성해주세요.
+    {guide}
+    """
+
+    async def _generate_sections(self, state: ResumeAgentState) -> str:
+        """
+        섹션별 동시 생성 - vLLM이 한 배치로 처리하므로 전체 시간은 가장 긴 섹션 수준
+        - 섹션마다 생성 토큰 상한을 따로 두어 잘려도 해당 섹션 끝부분만 잘림
+        - 실패하거나 '없음'인 섹션은 빼고 조립, 모든 섹션이 실패하면 예외 (기본 이력서로 대체)
+        """
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                self._safe_llm_call(
+                    self._build_section_prompt(state, title, guide),
+                    RESUME_SECTION_SYSTEM_PROMPT,
+                    "",
+                    max_tokens=max_tokens,
+                )
+                for title, max_tokens, guide in RESUME_SECTIONS
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            # 과부하/서킷 open은 execute에서 기존과 같이 처리
+            if isinstance(result, BaseException):
+                raise result
+
+        sections = [
+            self._normalize_section(title, text)
+            for (title, _, _), text in zip(RESUME_SECTIONS, results)
+        ]
+        if not any(sections):
+            raise ValueError("모든 이력서 섹션 생성에 실패했습니다")
+
+        self.logger.info(
+            f"섹션별 이력서 생성 완료: {sum(1 for s in sections if s)}/{len(sections)}개, "
+            f"{time.perf_counter() - start:.2f}s"
+        )
+        return "\n\n".join(section for section in sections if section)
+
+    def _normalize_section(self, title: str, text: str) -> str:
+        """섹션 응답 정리 - 빈 응답/'없음'은 빈 문자열, 헤딩이 없으면 붙임"""
+        text = text.strip()
+        if text.startswith("```"):
+            text = text.strip("`").removeprefix("markdown").strip()
+        body = text.removeprefix(f"## {title}").strip()
+        if not body or body.strip("- ") == "없음":
+            return ""
+        if not text.startswith("#"):
+            text = f"## {title}\n{text}"
+        return text
+
     async def _generate_resume_content(self, prompt: str) -> str:
         """LLM으로 이력서 내용 생성"""
         content = await self._safe_llm_call(
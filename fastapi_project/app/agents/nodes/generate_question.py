@@ -1,9 +1,24 @@
 from app.agents.schema.resume_create_agent import ResumeAgentState
 from app.agents.base_node import LLMBaseNode
 from app.utils.llm_client import LLMClient, create_llm_client
+from app.utils.llm_admission import LLMOverloadedError
+from app.utils.vllm_gateway import LLMCircuitOpenError
 from typing import Optional, Union
 
 
+# 요청과 무관한 고정 시스템 프롬프트 (vLLM prefix cache 재사용을 위해 모듈 상수로 유지)
+QUESTION_SYSTEM_PROMPT = """당신은 이력서 작성을 도와주는 전문 컨설턴트입니다.
+사용자의 기본 정보를 바탕으로 더 나은 이력서를 작성하기 위해 필요한 추가 정보를 파악하고,
+적절한 질문을 하나만 생성해주세요.
+
+질문 생성 가이드라인:
+1. 구체적이고 답변 가능한 질문을 만드세요
+2. 이전 질문과 중복되지 않도록 하세요  
+3. 이력서 품질 향상에 도움이 되는 정보를 얻을 수 있는 질문을 하세요
+4. 반드시 "- Q: [질문내용]" 형식으로 출력하세요
+5. 정보가 충분하다면 '없음'이라고 답하세요"""
+
+
 class GenerateQuestionNode(LLMBaseNode):
     def __init__(self, llm_client: Optional[Union[LLMClient, object]] = None):
         """
@@ -32,24 +47,18 @@ class GenerateQuestionNode(LLMBaseNode):
         context = self._build_context(state)
         prompt = self._build_prompt(context)
 
-        # 시스템 프롬프트 설정
-        system_prompt = """당신은 이력서 작성을 도와주는 전문 컨설턴트입니다.
-사용자의 기본 정보를 바탕으로 더 나은 이력서를 작성하기 위해 필요한 추가 정보를 파악하고,
-적절한 질문을 하나만 생성해주세요.
-
-질문 생성 가이드라인:
-1. 구체적이고 답변 가능한 질문을 만드세요
-2. 이전 질문과 중복되지 않도록 하세요  
-3. 이력서 품질 향상에 도움이 되는 정보를 얻을 수 있는 질문을 하세요
-4. 반드시 "- Q: [질문내용]" 형식으로 출력하세요
-5. 정보가 충분하다면 '없음'이라고 답하세요"""
-
         try:
-            response = await self._safe_llm_call(prompt, system_prompt, "없음")
+            response = await self._safe_llm_call(prompt, QUESTION_SYSTEM_PROMPT, "없음")
             self.logger.debug(f"LLM 응답: {response}")
 
             return self._process_response(state, response)
 
+        except LLMOverloadedError:
+            raise
+        except LLMCircuitOpenError as e:
+            # vLLM 장애 중 - 추가 질문 없이("없음") 정보 수집 완료로 처리
+            self.logger.warning(f"vLLM 서킷 open, 질문 생성 생략: {e}")
+            return self._process_response(state, "없음")
         except Exception as e:
             self.logger.error(f"질문 생성 중 오류: {e}")
             # 에러 발생시 정보 수집 완료로 처리
@@ -2,6 +2,7 @@
 
 from langgraph.graph import StateGraph, END
 from app.utils.llm_client import create_llm_client
+from app.utils.llm_admission import PRIORITY_INTERACTIVE
 
 # from langgraph.tracers.langchain import LangChainTracer
 from app.agents.nodes.generate_question import GenerateQuestionNode
@@ -9,6 +10,7 @@ from app.agents.nodes.check_completion import CheckCompletionNode
 from app.agents.nodes.create_resume import CreateResumeNode
 from app.agents.nodes.receive_answer import ReceiveAnswerNode
 from app.agents.schema.resume_create_agent import ResumeAgentState
+from app.agents.checkpoint import get_checkpointer
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -18,9 +20,9 @@ load_dotenv()
 
 
 # DAG 노드 정의 및 연결
-def build_resume_agent():
+def build_resume_agent(checkpointer=None):
     # 통합 LLM 클라이언트 생성 (환경 변수에 따라 자동으로 OpenAI 또는 VLLM 선택)
-    llm_client = create_llm_client(temperature=0.3)
+    llm_client = create_llm_client(temperature=0.3, priority=PRIORITY_INTERACTIVE)
 
     builder = StateGraph(ResumeAgentState)  # name="resume-agent", tracer=tracer
 
@@ -51,7 +53,17 @@ def build_resume_agent():
 
     # ✅ 이력서 생성도 마지막 노드
     builder.add_edge("create_resume", END)
-    return builder.compile()
+    return builder.compile(checkpointer=checkpointer)
 
 
 resume_agent = build_resume_agent()
+
+# 세션 모드용 그래프 (상태를 서버 체크포인터에 thread_id 별로 저장) - startup 이후 최초 사용 시 생성
+_session_agent = None
+
+
+def get_session_agent():
+    global _session_agent
+    if _session_agent is None:
+        _session_agent = build_resume_agent(checkpointer=get_checkpointer())
+    return _session_agent
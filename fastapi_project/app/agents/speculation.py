@@ -0,0 +1,224 @@
+import os
+import re
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from app.agents.nodes.create_resume import (
+    CreateResumeNode,
+    RESUME_SECTIONS,
+    RESUME_SECTION_SYSTEM_PROMPT,
+    RESUME_SYSTEM_PROMPT,
+)
+from app.agents.nodes.generate_question import GenerateQuestionNode, QUESTION_SYSTEM_PROMPT
+from app.agents.schema.resume_create_agent import ResumeAgentState
+from app.utils import deadline
+from app.utils.llm_admission import PRIORITY_BATCH
+from app.utils.llm_client import create_llm_client
+from app.utils.vllm_gateway import get_gateway
+
+logger = logging.getLogger(__name__)
+
+# 세션 모드에서 사용자가 답변을 쓰는 동안 다음 단계를 미리 생성 (기본 비활성)
+AGENT_SPECULATION = os.getenv("AGENT_SPECULATION", "false").lower() == "true"
+# 미리 만든 질문이 방금 받은 답변과 이 비율 이상 단어가 겹치면 이미 답한 내용으로 보고 버림
+AGENT_SPECULATION_MAX_OVERLAP = float(os.getenv("AGENT_SPECULATION_MAX_OVERLAP", "0.3"))
+# 답변이 오지 않은 세션의 추측 결과 보관 시간 (초)
+AGENT_SPECULATION_TTL = float(os.getenv("AGENT_SPECULATION_TTL", "900"))
+# 백그라운드 LLM 호출 하나의 예산 (초) - 요청의 deadline과 별개
+AGENT_SPECULATION_TIMEOUT = float(os.getenv("AGENT_SPECULATION_TIMEOUT", "60"))
+
+PENDING_ANSWER = "(사용자가 답변 작성 중)"
+_WORD_RE = re.compile(r"[0-9A-Za-z가-힣]{2,}")
+# 질문 프롬프트가 요구하는 "- Q: [질문내용]" 형식 (질문 내용이 비어 있으면 불일치)
+_QUESTION_RE = re.compile(r"Q:\s*\S")
+
+
+@dataclass
+class _Speculation:
+    kind: str  # "question" | "resume_prefix"
+    question: str  # 추측 시점에 답변을 기다리던 질문
+    asked_count: int
+    task: asyncio.Task
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class SpeculationManager:
+    """
+    세션별 추측 실행 관리
+    - 다음 질문이 남아 있으면: 현재 질문을 '답변 대기 중'으로 넣고 후속 질문 후보를 미리 생성
+      → 답변 도착 시 후보가 준비됐고 "Q:" 형식이며 답변과 겹치지 않으면 LLM 호출 없이 사용
+    - 마지막 질문(asked_count == max_questions - 1)이면: 최종 이력서 프롬프트에서 마지막 답변 앞까지를
+      max_tokens=1로 미리 보내 vLLM prefix cache를 채움 → 답변 도착 후 CreateResumeNode는 답변 이후만 prefill
+    추측 호출은 batch 우선순위로 보내 실제 사용자 요청을 밀어내지 않음
+    """
+
+    def __init__(self):
+        # 노드는 LLMClient를 감싸지 않고 그대로 써서 batch 우선순위가 gateway.chat까지 유지됨
+        self.llm_client = create_llm_client(temperature=0.3, priority=PRIORITY_BATCH)
+        self.question_node = GenerateQuestionNode(self.llm_client)
+        self.resume_node = CreateResumeNode(self.llm_client)
+        self.max_questions = self.question_node.max_questions
+        self._entries: Dict[str, _Speculation] = {}
+        self.metrics: Dict[str, int] = {
+            "started": 0,
+            "reused": 0,
+            "discarded": 0,
+            "cancelled": 0,
+            "failed": 0,
+            "expired": 0,
+            "prefix_warmed": 0,
+        }
+
+    def start(self, session_id: str, state: ResumeAgentState) -> None:
+        """질문을 반환한 직후 호출 - 답변을 기다리는 동안 다음 단계를 백그라운드로 시작"""
+        self.discard(session_id)
+        self._prune()
+        if not state.pending_questions or state.info_ready:
+            return
+
+        question = state.pending_questions[0]
+        if state.asked_count + 1 < self.max_questions:
+            kind, coro = "question", self._next_question(state, question)
+        elif self.llm_client.llm_type == "vllm":
+            kind, coro = "resume_prefix", self._warm_resume_prefix(state, question)
+        else:
+            # OpenAI는 prefix cache를 제어할 수 없어 마지막 턴은 추측하지 않음
+            return
+
+        task = asyncio.create_task(coro)
+        self._entries[session_id] = _Speculation(kind, question, state.asked_count, task)
+        self.metrics["started"] += 1
+
+    def take_question(self, session_id: str, state: ResumeAgentState, answer: str) -> Optional[str]:
+        """
+        답변 도착 시 미리 만든 후속 질문 반환 (사용 불가면 None → 평소대로 그래프 실행)
+        - 아직 생성 중이면 취소하고 None (batch 우선순위라 기다리는 것보다 새로 호출하는 편이 빠름)
+        """
+        entry = self._entries.pop(session_id, None)
+        if entry is None:
+            return None
+        if entry.kind != "question":
+            # 마지막 턴의 prefix 채우기는 답변 도착과 상관없이 끝까지 보내도 무방
+            return None
+        if (
+            not state.pending_questions
+            or entry.question != state.pending_questions[0]
+            or entry.asked_count != state.asked_count
+        ):
+            self._cancel(entry)
+            self.metrics["discarded"] += 1
+            return None
+        if not entry.task.done():
+            self._cancel(entry)
+            self.metrics["cancelled"] += 1
+            return None
+
+        candidate = (entry.task.result() or "").strip()
+        if not candidate or not _QUESTION_RE.search(candidate):
+            # 빈 응답/형식 불일치는 답변 대기 중 문구를 보고 만든 후보라 신뢰할 수 없음 → 평소대로 생성
+            self.metrics["failed"] += 1
+            return None
+        if "없음" in candidate or self._overlap(candidate, entry.question, answer) >= AGENT_SPECULATION_MAX_OVERLAP:
+            # 정보 충분 판단이나 이미 답한 내용을 묻는 후보는 실제 답변 기준으로 다시 생성
+            self.metrics["discarded"] += 1
+            return None
+
+        self.metrics["reused"] += 1
+        return candidate
+
+    def discard(self, session_id: str) -> None:
+        entry = self._entries.pop(session_id, None)
+        if entry is not None:
+            self._cancel(entry)
+
+    def shutdown(self) -> None:
+        for session_id in list(self._entries):
+            self.discard(session_id)
+
+    def _cancel(self, entry: _Speculation) -> None:
+        if not entry.task.done():
+            entry.task.cancel()
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for session_id, entry in list(self._entries.items()):
+            if now - entry.created_at > AGENT_SPECULATION_TTL:
+                self.discard(session_id)
+                self.metrics["expired"] += 1
+
+    async def _next_question(self, state: ResumeAgentState, question: str) -> Optional[str]:
+        deadline.replace_deadline(AGENT_SPECULATION_TIMEOUT)
+        spec_state = state.model_copy(deep=True)
+        spec_state.answers.append({"question": question, "answer": PENDING_ANSWER})
+        prompt = self.question_node._build_prompt(self.question_node._build_context(spec_state))
+        try:
+            return await self.question_node._safe_llm_call(prompt, QUESTION_SYSTEM_PROMPT, None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(f"후속 질문 추측 실패: {e}")
+            return None
+
+    async def _warm_resume_prefix(self, state: ResumeAgentState, question: str) -> None:
+        deadline.replace_deadline(AGENT_SPECULATION_TIMEOUT)
+        spec_state = state.model_copy(deep=True)
+        spec_state.answers.append({"question": question, "answer": ""})
+        if self.resume_node.generation_mode == "sections":
+            # 섹션 프롬프트는 질문 응답까지 모두 같으므로 한 번 채우면 모든 섹션이 공유
+            title, _, guide = RESUME_SECTIONS[0]
+            prompt = self.resume_node._build_section_prompt(spec_state, title, guide)
+            system_prompt = RESUME_SECTION_SYSTEM_PROMPT
+        else:
+            prompt = self.resume_node._build_resume_prompt(spec_state)
+            system_prompt = RESUME_SYSTEM_PROMPT
+        # 마지막 "A: " 까지만 보내야 실제 답변이 붙은 프롬프트와 앞부분이 일치
+        prefix = prompt[: prompt.rfind("A: ") + len("A: ")]
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prefix},
+        ]
+        try:
+            await get_gateway().chat(messages, max_tokens=1, temperature=0.0, priority=PRIORITY_BATCH)
+            self.metrics["prefix_warmed"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(f"이력서 프롬프트 prefix 채우기 실패: {e}")
+            self.metrics["failed"] += 1
+
+    @staticmethod
+    def _overlap(candidate: str, question: str, answer: str) -> float:
+        """후보 질문 단어(직전 질문과 공통인 주제어 제외) 중 답변에 이미 나온 단어 비율"""
+        words = set(_WORD_RE.findall(candidate.lower())) - set(_WORD_RE.findall(question.lower()))
+        if not words:
+            return 0.0
+        return len(words & set(_WORD_RE.findall(answer.lower()))) / len(words)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        resolved = self.metrics["reused"] + self.metrics["discarded"] + self.metrics["cancelled"]
+        return {
+            "enabled": AGENT_SPECULATION,
+            "in_flight": sum(1 for e in self._entries.values() if not e.task.done()),
+            "sessions": len(self._entries),
+            **self.metrics,
+            "reuse_rate": round(self.metrics["reused"] / resolved, 4) if resolved else None,
+        }
+
+
+_manager: Optional[SpeculationManager] = None
+
+
+def get_speculation_manager() -> SpeculationManager:
+    global _manager
+    if _manager is None:
+        _manager = SpeculationManager()
+    return _manager
+
+
+def shutdown_speculation() -> None:
+    """FastAPI shutdown 시 진행 중인 추측 작업 취소"""
+    if _manager is not None:
+        _manager.shutdown()
@@ -1,4 +1,5 @@
 import sys
+import asyncio
 import logging
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
@@ -10,11 +11,21 @@ from app.routes import (
     resume_extract,
     feedback,
     update_summary,
+    metrics,
 )
 from app.routes.resume_agent_init import router as resume_agent_init_router
 from app.routes.resume_agent_update import router as resume_agent_update_router
+from app.routes.resume_agent_session import router as resume_agent_session_router
+from app.agents.checkpoint import init_checkpointer, close_checkpointer
+from app.agents.speculation import shutdown_speculation
 
 from app.services.summary_service import run_summary_pipeline
+from app.utils.http_pool import init_http_pool, close_http_pool, get_vllm_session
+from app.utils.vllm_gateway import get_gateway
+from app.utils.llm_admission import LLMOverloadedError
+from app.utils import deadline
+from app.utils.token_budget import get_tokenizer
+from app.utils.cpu_pool import get_cpu_pool
 from apscheduler.schedulers.background import BackgroundScheduler
 from pytz import timezone
 from dotenv import load_dotenv
@@ -43,6 +54,42 @@ scheduler.add_job(
 )
 scheduler.start()
 
+# ✅ vLLM 커넥션 풀 수명 관리 (startup 생성 / shutdown 종료)
+@app.on_event("startup")
+async def startup_event():
+    await init_http_pool()
+    gateway = get_gateway()
+    # 스케줄러 스레드의 동기 호출도 서버 루프의 풀/동시성 제한을 공유
+    gateway.bind_loop(asyncio.get_running_loop())
+    # replica가 여럿이면 /health, /metrics 주기 프로브로 라우팅 대상 관리
+    gateway.replicas.start_probing(get_vllm_session)
+    # 토크나이저는 첫 요청 전에 미리 로드 (프롬프트 토큰 예산 계산용)
+    await asyncio.to_thread(get_tokenizer)
+    # PDF 파싱 등 CPU 작업용 프로세스 풀
+    get_cpu_pool().start()
+    # 세션 모드 이력서 에이전트 상태 저장소
+    await init_checkpointer()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await get_gateway().replicas.stop_probing()
+    await close_http_pool()
+    get_cpu_pool().shutdown()
+    shutdown_speculation()
+    await close_checkpointer()
+
+# ✅ 요청 예산(deadline) 설정 - X-Request-Timeout 헤더(초) 또는 기본값
+@app.middleware("http")
+async def request_deadline_middleware(request: Request, call_next):
+    token = deadline.set_deadline(
+        deadline.parse_budget(request.headers.get(deadline.REQUEST_TIMEOUT_HEADER))
+    )
+    try:
+        return await call_next(request)
+    finally:
+        deadline.reset_deadline(token)
+
 # ✅ HTTP 예외 핸들러
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
@@ -55,6 +102,19 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
         },
     )
 
+# ✅ LLM 대기열 초과 (503) 핸들러 - 기다리지 않고 Retry-After로 즉시 응답
+@app.exception_handler(LLMOverloadedError)
+async def llm_overloaded_handler(request: Request, exc: LLMOverloadedError):
+    return JSONResponse(
+        status_code=503,
+        headers={"Retry-After": str(exc.retry_after)},
+        content={
+            "httpStatusCode": 503,
+            "message": "LLM 서버 과부하",
+            "detail": str(exc),
+        },
+    )
+
 # ✅ 요청 유효성 검증 실패 (422) 핸들러
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -89,10 +149,12 @@ async def generic_exception_handler(request: Request, exc: Exception):
 app.include_router(resume_create, tags=["Resume-create"])
 app.include_router(resume_agent_init_router, tags=["Resume-agent-init"])
 app.include_router(resume_agent_update_router, tags=["Resume-agent-update"])
+app.include_router(resume_agent_session_router, tags=["Resume-agent-session"])
 app.include_router(resume_extract, tags=["Resume-extract"])
 app.include_router(health)
 app.include_router(feedback, tags=["Feedback"])
 app.include_router(update_summary, tags=["Summary"])
+app.include_router(metrics, tags=["Metrics"])
 
 # ✅ 기본 헬스 체크
 @app.get("/health-check")
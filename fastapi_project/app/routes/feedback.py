@@ -1,14 +1,35 @@
-from fastapi import APIRouter, status
-from app.schemas.feedback import FeedbackRequest, FeedbackResponse
-from app.services.feedback_service import generate_feedback
-from fastapi.responses import JSONResponse
+import os
+import json
+from fastapi import APIRouter, HTTPException, status
+from app.schemas.feedback import (
+    FeedbackRequest,
+    FeedbackResponse,
+    FeedbackBatchRequest,
+    FeedbackBatchResponse,
+)
+from app.services.feedback_service import (
+    generate_feedback,
+    generate_feedback_batch,
+    stream_feedback,
+)
+from app.utils.vllm_gateway import LLMGatewayError
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.concurrency import run_in_threadpool
 
 router = APIRouter()
 
+FEEDBACK_BATCH_MAX_ITEMS = int(os.getenv("FEEDBACK_BATCH_MAX_ITEMS", "20"))
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
 
 @router.post("/feedback/create", response_model=FeedbackResponse)
-async def create_feedback(request: FeedbackRequest):
+async def create_feedback(request: FeedbackRequest, stream: bool = False):
+    if stream:
+        return await _create_feedback_stream(request)
+
     feedback = await generate_feedback(request.question, request.answer)
     return JSONResponse(
         status_code=status.HTTP_200_OK,
@@ -18,3 +39,66 @@ async def create_feedback(request: FeedbackRequest):
             "data": {"feedback": feedback},
         },
     )
+
+
+@router.post("/feedback/batch", response_model=FeedbackBatchResponse)
+async def create_feedback_batch(request: FeedbackBatchRequest):
+    if not request.items:
+        raise HTTPException(status_code=400, detail="items가 비어 있습니다.")
+    if len(request.items) > FEEDBACK_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {FEEDBACK_BATCH_MAX_ITEMS}개까지 요청할 수 있습니다.",
+        )
+
+    items = await generate_feedback_batch(
+        [(item.question, item.answer) for item in request.items]
+    )
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "httpStatusCode": 200,
+            "message": "피드백 일괄 생성 완료",
+            "data": {"items": items},
+        },
+    )
+
+
+async def _create_feedback_stream(request: FeedbackRequest) -> StreamingResponse:
+    """
+    SSE 스트리밍 응답 (?stream=true)
+    - event: delta → {"delta": "..."} / event: done → {"feedback": 전체 텍스트}
+    - 첫 델타를 미리 받아 과부하(503)는 스트림 시작 전에 응답
+    """
+    deltas = stream_feedback(request.question, request.answer)
+    error = ""
+    try:
+        first = await deltas.__anext__()
+    except StopAsyncIteration:
+        first = ""
+    except LLMGatewayError as e:
+        first = None
+        error = f"피드백 생성 중 오류 발생: {str(e)}"
+
+    async def event_stream():
+        if first is None:
+            yield _sse("error", {"message": error})
+            return
+
+        parts = [first]
+        if first:
+            yield _sse("delta", {"delta": first})
+        try:
+            async for delta in deltas:
+                parts.append(delta)
+                yield _sse("delta", {"delta": delta})
+        except LLMGatewayError as e:
+            yield _sse("error", {"message": f"피드백 생성 중 오류 발생: {str(e)}"})
+            return
+        yield _sse("done", {"feedback": "".join(parts).strip()})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,38 @@
+from fastapi import APIRouter
+from app.utils import token_budget
+from app.utils.vllm_gateway import get_gateway
+from app.services.feedback_service import feedback_cache, semantic_cache
+from app.services.llm_handler import get_extract_metrics
+from app.services.resume_extract_service import resume_cache
+from app.services import resume_pre_extract
+from app.utils.file import get_download_metrics
+from app.utils.cpu_pool import get_cpu_pool
+from app.utils import ocr
+from app.agents.speculation import AGENT_SPECULATION, get_speculation_manager
+
+router = APIRouter()
+
+
+@router.get("/metrics/llm")
+def llm_metrics():
+    return {
+        "httpStatusCode": 200,
+        "message": "LLM 메트릭 조회 성공",
+        "data": {
+            "vllm": get_gateway().get_metrics(),
+            "token_budget": token_budget.get_metrics(),
+            "resume_extract": get_extract_metrics(),
+            "resume_extract_cache": resume_cache.get_metrics(),
+            "resume_pre_extract": resume_pre_extract.get_metrics(),
+            "pdf_download": get_download_metrics(),
+            "cpu_pool": get_cpu_pool().get_metrics(),
+            "ocr": ocr.get_metrics(),
+            "agent_speculation": (
+                get_speculation_manager().get_metrics() if AGENT_SPECULATION else None
+            ),
+            "feedback_cache": feedback_cache.get_metrics(),
+            "feedback_semantic_cache": (
+                semantic_cache.get_metrics() if semantic_cache is not None else None
+            ),
+        },
+    }
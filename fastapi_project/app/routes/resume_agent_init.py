@@ -14,6 +14,7 @@ from app.schemas.resume_agent import (
 from app.agents.nodes.generate_question import GenerateQuestionNode
 from app.agents.schema.resume_create_agent import ResumeAgentState
 from app.utils.llm_client import LLMClient, create_llm_client
+from app.utils.llm_admission import LLMOverloadedError, PRIORITY_INTERACTIVE
 
 # 로깅 기본 설정
 logging.basicConfig(
@@ -21,7 +22,7 @@ logging.basicConfig(
 )
 
 # LLM 초기화
-llm_client = create_llm_client(temperature=0.3)
+llm_client = create_llm_client(temperature=0.3, priority=PRIORITY_INTERACTIVE)
 router = APIRouter()
 
 
@@ -75,8 +76,8 @@ async def initialize_resume_stream(payload: ResumeAgentInitRequest):
 
         return JSONResponse(content=result)
 
-    except HTTPException:
-        # HTTPException은 그대로 re-raise
+    except (HTTPException, LLMOverloadedError):
+        # HTTPException / 과부하 거절은 그대로 re-raise
         raise
     except Exception as e:
         logging.error(f"초기화 중 오류 발생: {str(e)}")
@@ -0,0 +1,173 @@
+import uuid
+import asyncio
+import logging
+import traceback
+import weakref
+
+from fastapi import APIRouter, HTTPException
+
+from app.schemas.resume_agent import (
+    ResumeAgentInitRequest,
+    ResumeAgentAnswerRequest,
+    ResumeAgentSessionResponse,
+    InputsModel,
+)
+from app.agents.nodes.generate_question import GenerateQuestionNode
+from app.agents.nodes.receive_answer import ReceiveAnswerNode
+from app.agents.nodes.check_completion import CheckCompletionNode
+from app.agents.resume_agent import get_session_agent
+from app.agents.speculation import AGENT_SPECULATION, get_speculation_manager
+from app.agents.schema.resume_create_agent import ResumeAgentState
+from app.utils.llm_client import create_llm_client
+from app.utils.llm_admission import LLMOverloadedError, PRIORITY_INTERACTIVE
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+llm_client = create_llm_client(temperature=0.3, priority=PRIORITY_INTERACTIVE)
+
+# 같은 세션에 답변이 동시에 들어오면 순서대로 처리 (인스턴스 내부 기준)
+_session_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def _session_lock(session_id: str) -> asyncio.Lock:
+    lock = _session_locks.get(session_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _session_locks[session_id] = lock
+    return lock
+
+
+def _config(session_id: str) -> dict:
+    return {"configurable": {"thread_id": session_id}}
+
+
+def _to_response(session_id: str, state: ResumeAgentState) -> ResumeAgentSessionResponse:
+    return ResumeAgentSessionResponse(
+        session_id=session_id,
+        step=state.step,
+        pending_questions=state.pending_questions,
+        asked_count=state.asked_count,
+        info_ready=state.info_ready,
+        resume=state.resume,
+        docx_path=state.docx_path,
+    )
+
+
+def _speculate(session_id: str, state: ResumeAgentState) -> None:
+    """질문을 돌려준 뒤 사용자가 답변을 쓰는 동안 다음 단계를 미리 시작"""
+    if AGENT_SPECULATION:
+        get_speculation_manager().start(session_id, state)
+
+
+async def _apply_speculative_question(
+    session_id: str, state: ResumeAgentState, question: str
+) -> ResumeAgentState:
+    """미리 만든 질문으로 receive_answer → check_completion → generate_question 결과를 저장"""
+    state = await ReceiveAnswerNode().execute(state)
+    state = await CheckCompletionNode().execute(state)
+    state.pending_questions = [question]
+    await get_session_agent().aupdate_state(
+        _config(session_id), state.model_dump(), as_node="generate_question"
+    )
+    return state
+
+
+def _recorded_answer(state: ResumeAgentState):
+    """중단된 실행에 이미 반영된 답변 (receive_answer 이전이면 user_inputs, 이후면 마지막 answers)"""
+    if state.pending_questions:
+        return state.user_inputs.get(state.pending_questions[0])
+    return state.answers[-1]["answer"] if state.answers else None
+
+
+async def _load_snapshot(session_id: str):
+    snapshot = await get_session_agent().aget_state(_config(session_id))
+    if not snapshot.values:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+    return snapshot
+
+
+# 세션 모드: 상태는 서버 체크포인터에 저장하고 클라이언트는 session_id와 답변만 주고받음
+@router.post("/resume/agent/session", response_model=ResumeAgentSessionResponse)
+async def create_resume_agent_session(payload: ResumeAgentInitRequest):
+    try:
+        inputs_data = payload.inputs
+        if isinstance(inputs_data, dict):
+            try:
+                inputs_data = InputsModel(**inputs_data)
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=f"inputs 데이터 형식 오류: {str(e)}")
+
+        state = await GenerateQuestionNode(llm_client).execute(ResumeAgentState(inputs=inputs_data))
+
+        session_id = uuid.uuid4().hex
+        # 첫 질문까지 생성된 상태를 질문 노드 실행 결과로 저장 → 다음 답변에서 receive_answer부터 이어감
+        await get_session_agent().aupdate_state(
+            _config(session_id), state.model_dump(), as_node="generate_question"
+        )
+        logger.info(f"세션 생성: {session_id}, asked_count={state.asked_count}")
+        _speculate(session_id, state)
+        return _to_response(session_id, state)
+
+    except (HTTPException, LLMOverloadedError):
+        raise
+    except Exception as e:
+        logger.error(f"세션 생성 실패: {e}")
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"세션 생성 실패: {str(e)}")
+
+
+@router.get("/resume/agent/session/{session_id}", response_model=ResumeAgentSessionResponse)
+async def get_resume_agent_session(session_id: str):
+    snapshot = await _load_snapshot(session_id)
+    return _to_response(session_id, ResumeAgentState(**snapshot.values))
+
+
+@router.post("/resume/agent/session/{session_id}/answer", response_model=ResumeAgentSessionResponse)
+async def answer_resume_agent_session(session_id: str, payload: ResumeAgentAnswerRequest):
+    async with _session_lock(session_id):
+        snapshot = await _load_snapshot(session_id)
+        state = ResumeAgentState(**snapshot.values)
+        speculated = None
+        if snapshot.next:
+            # 이전 실행이 과부하(503) 등으로 중간에 멈춤 - 같은 답변의 재시도일 때만 멈춘 노드부터 재개
+            if _recorded_answer(state) != payload.answer:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"이전 답변 처리가 중단된 상태입니다 (다음 단계: {', '.join(snapshot.next)}). "
+                    "같은 답변으로 다시 요청해주세요",
+                )
+            graph_input = None
+            if AGENT_SPECULATION:
+                get_speculation_manager().discard(session_id)
+        elif state.pending_questions:
+            if AGENT_SPECULATION:
+                speculated = get_speculation_manager().take_question(session_id, state, payload.answer)
+            state.user_inputs = {**state.user_inputs, state.pending_questions[0]: payload.answer}
+            graph_input = state.model_dump()
+        else:
+            raise HTTPException(status_code=409, detail="답변을 기다리는 질문이 없습니다")
+
+        try:
+            if speculated is not None:
+                # 답변을 쓰는 동안 미리 만든 후속 질문 사용 - 질문 생성 LLM 호출 생략
+                state = await _apply_speculative_question(session_id, state, speculated)
+                logger.info(f"세션 {session_id} 추측 질문 사용: asked_count={state.asked_count}")
+                _speculate(session_id, state)
+                return _to_response(session_id, state)
+
+            # 저장된 상태에 답변만 반영해 그래프 실행 - 결과 상태는 체크포인터에 자동 저장
+            result = await get_session_agent().ainvoke(graph_input, _config(session_id))
+            state = result if isinstance(result, ResumeAgentState) else ResumeAgentState(**result)
+            logger.info(
+                f"세션 {session_id} 진행: step={state.step}, asked_count={state.asked_count}"
+            )
+            _speculate(session_id, state)
+            return _to_response(session_id, state)
+
+        except LLMOverloadedError:
+            raise
+        except Exception as e:
+            logger.error(f"세션 {session_id} 처리 실패: {e}")
+            logger.error(traceback.format_exc())
+            raise HTTPException(status_code=500, detail=f"서버 내부 오류: {str(e)}")
@@ -7,6 +7,7 @@ from fastapi.responses import JSONResponse
 from app.agents.resume_agent import resume_agent
 from app.schemas.resume_agent import ResumeAgentRequest, InputsModel
 from app.agents.schema.resume_create_agent import ResumeAgentState
+from app.utils.llm_admission import LLMOverloadedError
 
 # 로깅 기본 설정
 logging.basicConfig(
@@ -132,8 +133,8 @@ async def update_resume_agent(payload: ResumeAgentRequest):
             logging.error(f"JSON 직렬화 실패: {e}")
             raise HTTPException(status_code=500, detail=f"응답 생성 실패: {str(e)}")
 
-    except HTTPException:
-        # HTTPException은 그대로 re-raise
+    except (HTTPException, LLMOverloadedError):
+        # HTTPException / 과부하 거절은 그대로 re-raise
         raise
     except Exception as e:
         logging.error(f"예상치 못한 오류 발생: {str(e)}")
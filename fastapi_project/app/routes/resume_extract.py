@@ -1,13 +1,24 @@
 # app/routes/resume_extract.py
-from fastapi import APIRouter
-from app.schemas.resume_extract import ResumeExtractRequest, ResumeExtractResponse, ResumeInfo
-from app.services.resume_extract_service import extract_resume_info
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from app.schemas.resume_extract import (
+    ResumeExtractRequest,
+    ResumeExtractResponse,
+    ResumeExtractBatchRequest,
+    ResumeInfo,
+)
+from app.services.resume_extract_service import extract_resume_info, extract_resume_batch
+from app.utils.llm_admission import LLMOverloadedError
+import os
+import json
 import logging
 import traceback
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+RESUME_BATCH_MAX_ITEMS = int(os.getenv("RESUME_BATCH_MAX_ITEMS", "500"))
+
 # fallback 기본값 정의
 fallback_result = ResumeInfo(
     certification_count=0,
@@ -27,8 +38,37 @@ async def extract_resume(request: ResumeExtractRequest):
         result = await extract_resume_info(request.file_url)
         return ResumeExtractResponse(message="extraction_success", data=result)
 
+    except LLMOverloadedError:
+        # 과부하는 fallback 대신 503 + Retry-After로 응답
+        raise
     except Exception as e:
         # 모든 예외에서 fallback 반환
         logger.error("❌ 이력서 정보 추출 실패. 기본값 반환")
         traceback.print_exc()
-        return ResumeExtractResponse(message="extraction_failed", data=fallback_result)
\ No newline at end of file
+        return ResumeExtractResponse(message="extraction_failed", data=fallback_result)
+
+
+@router.post("/resume/extract/batch")
+async def extract_resume_batch_route(request: ResumeExtractBatchRequest):
+    """
+    이력서 일괄 추출 - 끝나는 순서대로 한 줄에 한 항목씩 NDJSON 스트리밍
+    (각 줄: index, file_url, status, data, error, elapsed / ResumeExtractBatchItem)
+    """
+    if not request.file_urls:
+        raise HTTPException(status_code=400, detail="file_urls가 비어 있습니다.")
+    if len(request.file_urls) > RESUME_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {RESUME_BATCH_MAX_ITEMS}개까지 요청할 수 있습니다.",
+        )
+    logger.info(f"📥 [resume/extract/batch] {len(request.file_urls)}건 수신")
+
+    async def ndjson_stream():
+        async for item in extract_resume_batch([str(url) for url in request.file_urls]):
+            yield json.dumps(item, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(
+        ndjson_stream(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
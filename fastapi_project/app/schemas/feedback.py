@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from typing import List, Optional
 
 
 class FeedbackRequest(BaseModel):
@@ -8,3 +9,17 @@ class FeedbackRequest(BaseModel):
 
 class FeedbackResponse(BaseModel):
     feedback: str
+
+
+class FeedbackBatchRequest(BaseModel):
+    items: List[FeedbackRequest]
+
+
+class FeedbackBatchItem(BaseModel):
+    index: int
+    feedback: Optional[str] = None
+    error: Optional[str] = None
+
+
+class FeedbackBatchResponse(BaseModel):
+    items: List[FeedbackBatchItem]
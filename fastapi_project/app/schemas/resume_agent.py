@@ -33,3 +33,17 @@ class ResumeAgentRequest(
     docx_path: str = ""
     info_ready: bool = False
     asked_count: int = 0
+
+
+class ResumeAgentAnswerRequest(BaseModel):  # 세션 모드: 현재 질문에 대한 답변만 전송
+    answer: str
+
+
+class ResumeAgentSessionResponse(BaseModel):  # 세션 모드 응답 (전체 state 대신 UI에 필요한 값만)
+    session_id: str
+    step: str
+    pending_questions: List[str] = Field(default_factory=list)
+    asked_count: int = 0
+    info_ready: bool = False
+    resume: str = ""
+    docx_path: str = ""
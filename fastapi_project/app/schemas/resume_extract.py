@@ -1,6 +1,6 @@
 # app/schemas/resume_extract.py
 from pydantic import BaseModel, HttpUrl
-from typing import Optional
+from typing import List, Optional
 
 class ResumeExtractRequest(BaseModel):
     file_url: HttpUrl
@@ -16,4 +16,15 @@ class ResumeInfo(BaseModel):
 
 class ResumeExtractResponse(BaseModel):
     message: str
-    data: Optional[ResumeInfo]
\ No newline at end of file
+    data: Optional[ResumeInfo]
+
+class ResumeExtractBatchRequest(BaseModel):
+    file_urls: List[HttpUrl]
+
+class ResumeExtractBatchItem(BaseModel):
+    index: int
+    file_url: str
+    status: str                         # "success" | "cached" | "failed"
+    data: ResumeInfo                    # 실패 시 기본값
+    error: Optional[str] = None
+    elapsed: float
@@ -1,11 +1,50 @@
 import os
-import requests
-import time
-import aiohttp
 import asyncio
+import numpy as np
+from app.utils.vllm_gateway import LLMGatewayError, get_gateway
+from app.utils.llm_admission import LLMOverloadedError, PRIORITY_INTERACTIVE
+from app.utils.response_cache import ResponseCache, make_cache_key
+from app.utils.semantic_cache import SemanticFeedbackCache
+from app.utils.token_budget import count_message_tokens, fit_to_budget, input_budget
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import re
+import unicodedata
 
-VLLM_URL = os.getenv("VLLM_URL", "http://localhost:8001")
-MODEL_NAME = "/mnt/ssd/aya-expanse-8b"
+FEEDBACK_SYSTEM_PROMPT = "당신은 컴퓨터공학 면접관입니다. 당신이 질문한 컴퓨터공학 개념에 대해 지원자의 답변을 보고 어떤 점이 보완되면 좋겠는지 친절하게 피드백해주세요."
+FEEDBACK_INSTRUCTIONS = (
+    "아래 질문과 지원자의 답변에 대해 다음 기준을 바탕으로 간결하게 구체적인 피드백을 3~5문장으로 작성해주세요:\n"
+    "- 답변이 질문의 핵심을 이해하고 있는지\n"
+    "- 틀린 내용이나 부족한 설명이 있는지\n"
+    "- 어떤 내용을 보완하면 더 좋은 답변이 되는지\n"
+    "문장 도중에 끊지 말고, 의미 단위로 문장을 마무리한 뒤 출력을 종료해주세요.\n\n"
+)
+FEEDBACK_MAX_TOKENS = 512
+FEEDBACK_TEMPERATURE = 0.7
+
+# 동일 (질문, 답변) 피드백 캐시
+FEEDBACK_CACHE_ENABLED = os.getenv("FEEDBACK_CACHE_ENABLED", "true").lower() == "true"
+feedback_cache = ResponseCache(
+    name="feedback",
+    max_entries=int(os.getenv("FEEDBACK_CACHE_MAX_ENTRIES", "2048")),
+    ttl_seconds=float(os.getenv("FEEDBACK_CACHE_TTL", "86400")),
+    sqlite_path=os.getenv("FEEDBACK_CACHE_SQLITE_PATH", ""),
+)
+
+# 의미 유사 답변 캐시 (opt-in)
+FEEDBACK_SEMANTIC_CACHE = os.getenv("FEEDBACK_SEMANTIC_CACHE", "false").lower() == "true"
+semantic_cache = (
+    SemanticFeedbackCache(
+        threshold=float(os.getenv("FEEDBACK_SEMANTIC_THRESHOLD", "0.92")),
+        max_questions=int(os.getenv("FEEDBACK_SEMANTIC_MAX_QUESTIONS", "1024")),
+        max_per_question=int(os.getenv("FEEDBACK_SEMANTIC_MAX_PER_QUESTION", "512")),
+        hit_log_path=os.getenv("FEEDBACK_SEMANTIC_HIT_LOG", ""),
+    )
+    if FEEDBACK_SEMANTIC_CACHE
+    else None
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_PUNCT_RE = re.compile(r"[\s.!?~…。]+$")
 
 
 def build_feedback_prompt(question: str, answer: str) -> str:
@@ -40,49 +79,164 @@ def build_feedback_prompt(question: str, answer: str) -> str:
             f"[피드백]\n{ex['feedback']}\n\n"
         )
 
+    # 고정 지시문을 앞에, 질문/답변을 뒤에 두어 vLLM prefix cache가 요청 간에 재사용되도록 함
     user_prompt = (
+        f"{FEEDBACK_INSTRUCTIONS}"
         f"[질문]\n{question}\n"
-        f"[답변]\n{answer}\n"
-        "이 답변에 대해 다음 기준을 바탕으로 간결하게 구체적인 피드백을 3~5문장으로 작성해주세요:\n"
-        "- 답변이 질문의 핵심을 이해하고 있는지\n"
-        "- 틀린 내용이나 부족한 설명이 있는지\n"
-        "- 어떤 내용을 보완하면 더 좋은 답변이 되는지\n"
-        "문장 도중에 끊지 말고, 의미 단위로 문장을 마무리한 뒤 출력을 종료해주세요.\n\n"
+        f"[답변]\n{answer}\n\n"
         "피드백:"
     )
 
     return f"{few_shot_prompt}" f"{user_prompt}"
 
 
-# async + aiohttp 로 비동기 방식 전환
-async def generate_feedback(question: str, answer: str) -> str:
-    prompt = build_feedback_prompt(question, answer)
+def build_feedback_messages(question: str, answer: str) -> List[Dict[str, str]]:
+    # 매우 긴 답변은 컨텍스트 예산에 맞게 문장 단위로 자름
+    reserved = count_message_tokens(
+        [
+            {"role": "system", "content": FEEDBACK_SYSTEM_PROMPT},
+            {"role": "user", "content": build_feedback_prompt(question, "")},
+        ]
+    )
+    answer = fit_to_budget(answer, input_budget(FEEDBACK_MAX_TOKENS, reserved))
+    return [
+        {
+            "role": "system",
+            "content": FEEDBACK_SYSTEM_PROMPT,
+            # "아래는 예시 질문과 답변, 그리고 그에 대한 피드백입니다."
+        },
+        {"role": "user", "content": build_feedback_prompt(question, answer)},
+    ]
+
+
+def normalize_feedback_text(text: str) -> str:
+    """캐시 키용 정규화 - 유니코드/공백/대소문자/끝 문장부호 차이 무시"""
+    text = unicodedata.normalize("NFKC", text or "")
+    text = _WHITESPACE_RE.sub(" ", text).strip().lower()
+    return _TRAILING_PUNCT_RE.sub("", text)
+
+
+def feedback_cache_key(question: str, answer: str) -> str:
+    return make_cache_key(
+        normalize_feedback_text(question),
+        normalize_feedback_text(answer),
+        get_gateway().model_name,
+        FEEDBACK_SYSTEM_PROMPT,
+        FEEDBACK_INSTRUCTIONS,
+        FEEDBACK_MAX_TOKENS,
+        FEEDBACK_TEMPERATURE,
+    )
+
+
+def get_cached_feedback(question: str, answer: str) -> Optional[str]:
+    if not FEEDBACK_CACHE_ENABLED:
+        return None
+    return feedback_cache.get(feedback_cache_key(question, answer))
+
+
+def store_feedback(question: str, answer: str, feedback: str) -> None:
+    if FEEDBACK_CACHE_ENABLED and feedback:
+        feedback_cache.set(feedback_cache_key(question, answer), feedback)
+
+
+async def lookup_feedback(
+    question: str, answer: str
+) -> Tuple[Optional[str], Optional[np.ndarray]]:
+    """
+    캐시 조회 (정확 일치 → 의미 유사 순서)
+    - (피드백 또는 None, 답변 임베딩 또는 None) 반환
+    """
+    cached = get_cached_feedback(question, answer)
+    if cached is not None or semantic_cache is None:
+        return cached, None
+
+    try:
+        feedback, vector = await semantic_cache.lookup(
+            normalize_feedback_text(question), answer
+        )
+    except Exception as e:
+        # 임베딩 실패는 캐시 miss로 취급
+        print(f"⚠️ 시맨틱 캐시 조회 실패: {e}")
+        return None, None
+
+    if feedback is not None:
+        store_feedback(question, answer, feedback)
+    return feedback, vector
+
+
+def remember_feedback(
+    question: str, answer: str, feedback: str, vector: Optional[np.ndarray] = None
+) -> None:
+    store_feedback(question, answer, feedback)
+    if semantic_cache is not None and vector is not None and feedback:
+        semantic_cache.add(normalize_feedback_text(question), answer, feedback, vector)
+
+
+async def _generate_feedback(question: str, answer: str) -> str:
+    """피드백 생성 - 실패 시 LLMGatewayError / LLMOverloadedError를 그대로 전달"""
+    cached, vector = await lookup_feedback(question, answer)
+    if cached is not None:
+        return cached
+
+    # 공용 vLLM 게이트웨이를 통해 호출
+    feedback = await get_gateway().chat(
+        build_feedback_messages(question, answer),
+        max_tokens=FEEDBACK_MAX_TOKENS,
+        temperature=FEEDBACK_TEMPERATURE,
+        priority=PRIORITY_INTERACTIVE,
+    )
+
+    remember_feedback(question, answer, feedback, vector)
+    return feedback
+
 
+async def generate_feedback(question: str, answer: str) -> str:
     try:
-        print("VLLM_URL:", VLLM_URL)
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30)
-        ) as session:
-            async with session.post(
-                url=f"{VLLM_URL}/v1/chat/completions",
-                json={
-                    "model": MODEL_NAME,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "당신은 컴퓨터공학 면접관입니다. 당신이 질문한 컴퓨터공학 개념에 대해 지원자의 답변을 보고 어떤 점이 보완되면 좋겠는지 친절하게 피드백해주세요.",
-                            # "아래는 예시 질문과 답변, 그리고 그에 대한 피드백입니다."
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    "max_tokens": 512,
-                    "temperature": 0.7,
-                },
-                headers={"Content-Type": "application/json"},
-            ) as response:
-                response.raise_for_status()
-                result = await response.json()
-                return result["choices"][0]["message"]["content"].strip()
-
-    except aiohttp.ClientError as e:
+        return await _generate_feedback(question, answer)
+    except LLMGatewayError as e:
         return f"피드백 생성 중 오류 발생: {str(e)}"
+
+
+async def generate_feedback_batch(items: List[Tuple[str, str]]) -> List[Dict]:
+    """
+    여러 (질문, 답변)을 동시에 vLLM으로 보내고 입력 순서대로 결과 반환
+    - 동시 요청은 vLLM continuous batching으로 함께 처리됨
+    - 항목별 실패는 error 필드로 반환 (배치 전체를 실패시키지 않음)
+    """
+    results = await asyncio.gather(
+        *(_generate_feedback(question, answer) for question, answer in items),
+        return_exceptions=True,
+    )
+
+    batch = []
+    for index, result in enumerate(results):
+        if isinstance(result, LLMOverloadedError):
+            batch.append({"index": index, "feedback": None, "error": f"LLM 서버 과부하: {result}"})
+        elif isinstance(result, BaseException):
+            batch.append({"index": index, "feedback": None, "error": f"피드백 생성 중 오류 발생: {result}"})
+        else:
+            batch.append({"index": index, "feedback": result, "error": None})
+    return batch
+
+
+async def stream_feedback(question: str, answer: str) -> AsyncIterator[str]:
+    """피드백 스트리밍 생성 - vLLM 델타 텍스트를 그대로 전달 (캐시 적중 시 한 번에 전달)"""
+    cached, vector = await lookup_feedback(question, answer)
+    if cached is not None:
+        yield cached
+        return
+
+    messages = build_feedback_messages(question, answer)
+    parts = []
+
+    async for delta in get_gateway().stream_chat(
+        messages,
+        max_tokens=FEEDBACK_MAX_TOKENS,
+        temperature=FEEDBACK_TEMPERATURE,
+        priority=PRIORITY_INTERACTIVE,
+    ):
+        parts.append(delta)
+        yield delta
+
+    # 스트림이 끝까지 완료된 경우에만 캐시에 저장
+    remember_feedback(question, answer, "".join(parts).strip(), vector)
@@ -1,10 +1,20 @@
 # app/services/llm_handler.py
+import os
+import json
 import time
 import traceback
-from langchain_community.chat_models import ChatOpenAI
+from typing import Optional
 from langchain.prompts import ChatPromptTemplate
 from langchain.output_parsers import StructuredOutputParser, ResponseSchema
 from app.schemas.resume_extract import ResumeInfo
+from app.utils.vllm_gateway import (
+    LLMCircuitOpenError,
+    LLMGatewayError,
+    get_gateway,
+    to_openai_messages,
+)
+from app.utils.llm_admission import LLMOverloadedError, PRIORITY_DEFAULT
+from app.utils.token_budget import count_message_tokens, fit_to_budget, input_budget
 
 # 1. 응답 스키마 정의
 response_schemas = [
@@ -20,8 +30,8 @@ response_schemas = [
 parser = StructuredOutputParser.from_response_schemas(response_schemas)
 
 # 2. 프롬프트 템플릿 정의
-prompt = ChatPromptTemplate.from_messages([
-    ("system", """
+# vLLM prefix caching이 적용되도록 고정 지시문(+형식 지시)을 앞에, 요청마다 바뀌는 이력서 텍스트를 마지막에 둔다
+EXTRACT_SYSTEM_PROMPT = """
 너는 사용자의 이력서를 분석해 **정확히 하나의 JSON 객체**만 출력하는 AI야. 반드시 아래 기준을 지켜줘.
 
 📌 출력 형식은 아래 7개 항목의 **단일 값**이며, 절대 리스트 금지:
@@ -42,19 +52,59 @@ prompt = ChatPromptTemplate.from_messages([
 - additional_experiences에는 반드시 성과 기반의 외부 활동만 포함하고, 자격증/근무/프로젝트 내용은 절대 포함하지 마세요.
 
 📅 기준일은 2025년. "현재"는 2025년으로 계산합니다.
-"""),
+"""
+
+prompt = ChatPromptTemplate.from_messages([
+    ("system", EXTRACT_SYSTEM_PROMPT + "\n{format_instructions}"),
     ("user", "{text}"),
-    ("system", "{format_instructions}")
 ])
 
-# 3. 모델 정의
-llm = ChatOpenAI(
-    model="/mnt/ssd/aya-expanse-8b",
-    openai_api_base="http://localhost:8001/v1",
-    openai_api_key="NULL",
-    temperature=0.3,
-    max_tokens=512
-)
+# 2-1. guided 모드용 프롬프트 - 출력 형식은 JSON 스키마로 강제하므로 format_instructions 제외
+guided_prompt = ChatPromptTemplate.from_messages([
+    ("system", EXTRACT_SYSTEM_PROMPT),
+    ("user", "{text}"),
+])
+
+# vLLM guided decoding에 넘길 스키마 (major_type은 두 값으로 제한)
+RESUME_INFO_JSON_SCHEMA = ResumeInfo.model_json_schema()
+RESUME_INFO_JSON_SCHEMA["properties"]["major_type"] = {
+    "type": "string",
+    "enum": ["MAJOR", "NON_MAJOR"],
+}
+# 선택 필드도 생략하지 않고 null로 명시하도록 모든 필드를 필수로
+RESUME_INFO_JSON_SCHEMA["required"] = list(RESUME_INFO_JSON_SCHEMA["properties"])
+
+# 3. 모델 호출은 공용 vLLM 게이트웨이를 사용
+LLM_TEMPERATURE = 0.3
+LLM_MAX_TOKENS = 512
+# guided_json으로 스키마를 만족하는 JSON만 생성 (false면 기존 format_instructions 방식)
+RESUME_EXTRACT_GUIDED = os.getenv("RESUME_EXTRACT_GUIDED", "true").lower() == "true"
+
+# 모드별 파싱 실패/재시도 집계 (guided 전환 전후 비교용)
+_extract_metrics = {
+    mode: {"requests": 0, "attempts": 0, "parse_failures": 0, "retries": 0, "fallbacks": 0}
+    for mode in ("guided", "format_instructions")
+}
+
+
+def build_extract_messages(resume_text: str, guided: bool) -> list:
+    """추출 프롬프트 메시지 - 고정 프롬프트와 생성 토큰을 뺀 예산에 맞게 이력서 텍스트를 자름"""
+    if guided:
+        template, variables = guided_prompt, {}
+    else:
+        template, variables = prompt, {"format_instructions": parser.get_format_instructions()}
+
+    reserved = count_message_tokens(
+        to_openai_messages(template.format_messages(text="", **variables))
+    )
+    text = fit_to_budget(resume_text.strip(), input_budget(LLM_MAX_TOKENS, reserved))
+    return to_openai_messages(template.format_messages(text=text, **variables))
+
+
+def parse_extract_output(content: str, guided: bool) -> dict:
+    if guided:
+        return json.loads(content)
+    return parser.parse(content)
 
 # 4. 안전한 정수 파싱 함수
 def safe_int(val):
@@ -64,7 +114,13 @@ def safe_int(val):
         return 0
 
 # 5. LLM 추론 함수
-async def extract_info_from_resume(resume_text: str) -> dict:
+async def extract_info_from_resume(
+    resume_text: str,
+    guided: bool = RESUME_EXTRACT_GUIDED,
+    fallback: bool = True,
+    priority: int = PRIORITY_DEFAULT,
+) -> Optional[dict]:
+    """이력서 정보 추출 - 실패 시 기본값 반환 (fallback=False면 None을 반환해 호출 측에서 구분)"""
     fallback_result = {
         "certification_count": 0,
         "project_count": 0,
@@ -75,49 +131,93 @@ async def extract_info_from_resume(resume_text: str) -> dict:
         "additional_experiences": None
     }
 
+    mode = "guided" if guided else "format_instructions"
+    stats = _extract_metrics[mode]
+    stats["requests"] += 1
+    params = {"guided_json": RESUME_INFO_JSON_SCHEMA} if guided else {}
+
+    # 네트워크/5xx 재시도는 게이트웨이가 담당 - 여기서는 응답 형식(파싱) 실패만 한 번 더 시도
     MAX_RETRY = 2
     for attempt in range(MAX_RETRY):
+        stats["attempts"] += 1
+        if attempt > 0:
+            stats["retries"] += 1
         try:
-            format_instructions = parser.get_format_instructions()
-            filled_prompt = prompt.format_messages(
-                text=resume_text.strip()[:6000],
-                format_instructions=format_instructions
-            )
-
             start = time.time()
-            response = await llm.ainvoke(filled_prompt)
+            content = await get_gateway().chat(
+                build_extract_messages(resume_text, guided),
+                max_tokens=LLM_MAX_TOKENS,
+                temperature=LLM_TEMPERATURE,
+                priority=priority,
+                **params,
+            )
             end = time.time()
 
-            content = response.content
             print(f"\n⏱️ 응답 시간: {end - start:.2f}초")
             print("🧠 LLM 응답 원문:\n", content)
 
-            parsed_dict = parser.parse(content)
-
-            # position 필드 정리
-            position_raw = parsed_dict.get("position")
-            position = position_raw[0] if isinstance(position_raw, list) and position_raw else position_raw or None
-
-            # additional_experiences 필드 정리
-            add_exp = parsed_dict.get("additional_experiences")
-            if isinstance(add_exp, list):
-                add_exp = "\n".join(add_exp)
-            elif not isinstance(add_exp, str):
-                add_exp = None
-
-            return ResumeInfo(
-                certification_count=safe_int(parsed_dict.get("certification_count")),
-                project_count=safe_int(parsed_dict.get("project_count")),
-                major_type=parsed_dict.get("major_type", "NON_MAJOR"),
-                company_name=parsed_dict.get("company_name") or None,
-                work_period=safe_int(parsed_dict.get("work_period")),
-                position=position,
-                additional_experiences=add_exp
-            ).dict()
-
+            try:
+                parsed_dict = parse_extract_output(content, guided)
+
+                # position 필드 정리
+                position_raw = parsed_dict.get("position")
+                position = position_raw[0] if isinstance(position_raw, list) and position_raw else position_raw or None
+
+                # additional_experiences 필드 정리
+                add_exp = parsed_dict.get("additional_experiences")
+                if isinstance(add_exp, list):
+                    add_exp = "\n".join(add_exp)
+                elif not isinstance(add_exp, str):
+                    add_exp = None
+
+                return ResumeInfo(
+                    certification_count=safe_int(parsed_dict.get("certification_count")),
+                    project_count=safe_int(parsed_dict.get("project_count")),
+                    major_type=parsed_dict.get("major_type", "NON_MAJOR"),
+                    company_name=parsed_dict.get("company_name") or None,
+                    work_period=safe_int(parsed_dict.get("work_period")),
+                    position=position,
+                    additional_experiences=add_exp
+                ).dict()
+            except Exception as e:
+                # 응답 형식(JSON 파싱/스키마 검증) 실패만 재시도
+                stats["parse_failures"] += 1
+                print(f"⚠️ LLM 응답 파싱 시도 {attempt + 1} 실패:", e)
+                if attempt == MAX_RETRY - 1:
+                    print(f"⚠️ LLM 응답 파싱 {MAX_RETRY}회 실패. fallback 반환")
+                    stats["fallbacks"] += 1
+                    return fallback_result if fallback else None
+
+        except LLMOverloadedError:
+            # 과부하 거절은 재시도하지 않고 그대로 전달 (503)
+            raise
+        except LLMCircuitOpenError as e:
+            # vLLM 장애 중 - 재시도 없이 바로 fallback
+            print("⚠️ vLLM 서킷 open, fallback 반환:", e)
+            stats["fallbacks"] += 1
+            return fallback_result if fallback else None
+        except LLMGatewayError as e:
+            # 게이트웨이 재시도 후에도 실패(예산 소진, 4xx 등) - 다시 호출하지 않고 바로 fallback
+            print(f"⚠️ vLLM 호출 실패 ({type(e).__name__}), fallback 반환:", e)
+            stats["fallbacks"] += 1
+            return fallback_result if fallback else None
         except Exception as e:
-            print(f"⚠️ LLM 추론 시도 {attempt + 1} 실패:", e)
+            print("⚠️ LLM 추론 실패, fallback 반환:", e)
             traceback.print_exc()
-            if attempt == MAX_RETRY - 1:
-                print("⚠️ LLM 추론 2회 실패. fallback 반환")
-                return fallback_result
\ No newline at end of file
+            stats["fallbacks"] += 1
+            return fallback_result if fallback else None
+
+
+def get_extract_metrics() -> dict:
+    """모드별 파싱 실패율/재시도율"""
+    metrics = {}
+    for mode, stats in _extract_metrics.items():
+        metrics[mode] = dict(stats)
+        metrics[mode]["parse_failure_rate"] = (
+            round(stats["parse_failures"] / stats["attempts"], 4) if stats["attempts"] else None
+        )
+        metrics[mode]["retry_rate"] = (
+            round(stats["retries"] / stats["requests"], 4) if stats["requests"] else None
+        )
+    metrics["active_mode"] = "guided" if RESUME_EXTRACT_GUIDED else "format_instructions"
+    return metrics
\ No newline at end of file
@@ -1,51 +1,226 @@
 # app/services/resume_extract_service.py
+import os
+import time
+import asyncio
+import hashlib
 import traceback
+from contextlib import nullcontext
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from app.utils.file import (
-    download_pdf_from_url,
-    is_valid_pdf
-)
-from app.utils.pdf_parser import extract_text_with_formatting
-from app.services.llm_handler import extract_info_from_resume
+from app.utils.file import download_pdf_from_url
+from app.utils.pdf_parser import extract_text_with_formatting, PDFValidationError
+from app.utils.cpu_pool import get_cpu_pool
+from app.utils.ocr import extract_text_with_ocr
+from app.utils.response_cache import ResponseCache, make_cache_key
+from app.services.llm_handler import RESUME_EXTRACT_GUIDED, extract_info_from_resume
+from app.services.resume_pre_extract import pre_extract
 from app.schemas.resume_extract import ResumeInfo
+from app.utils.llm_admission import LLMOverloadedError, PRIORITY_BATCH, PRIORITY_DEFAULT
+from app.utils import deadline
 
-async def extract_resume_info(file_url: str) -> ResumeInfo:
-    try:
-        print("📥 Step 1: file_url =", file_url)
+# 파서/프롬프트/스키마를 바꾸면 올려서 기존 캐시를 무효화
+EXTRACTOR_VERSION = "4"
+# 규칙으로 확실한 필드를 먼저 채우고 LLM에는 필요한 섹션만 전달
+RESUME_PRE_EXTRACT = os.getenv("RESUME_PRE_EXTRACT", "true").lower() == "true"
+
+# 같은 PDF 재업로드 시 파싱과 LLM 호출을 건너뛰는 캐시 (키: PDF 바이트 SHA-256)
+RESUME_CACHE_ENABLED = os.getenv("RESUME_CACHE_ENABLED", "true").lower() == "true"
+resume_cache = ResponseCache(
+    name="resume_extract",
+    max_entries=int(os.getenv("RESUME_CACHE_MAX_ENTRIES", "512")),
+    ttl_seconds=float(os.getenv("RESUME_CACHE_TTL", str(7 * 86400))),
+    sqlite_path=os.getenv("RESUME_CACHE_SQLITE_PATH", "cache/resume_extract.sqlite3"),
+)
+
+
+# 일괄 추출 단계별 동시 실행 수 (다운로드 → 파싱 → LLM 파이프라인)
+RESUME_BATCH_DOWNLOAD_CONCURRENCY = int(os.getenv("RESUME_BATCH_DOWNLOAD_CONCURRENCY", "16"))
+RESUME_BATCH_PARSE_CONCURRENCY = int(os.getenv("RESUME_BATCH_PARSE_CONCURRENCY", str(get_cpu_pool().workers * 2)))
+RESUME_BATCH_LLM_CONCURRENCY = int(os.getenv("RESUME_BATCH_LLM_CONCURRENCY", "8"))
+# 항목별 예산 (초) - 배치 전체가 아니라 이력서 한 건 기준
+RESUME_BATCH_ITEM_TIMEOUT = float(os.getenv("RESUME_BATCH_ITEM_TIMEOUT", "180"))
+# 과부하(503) 거절 시 Retry-After만큼 기다렸다 다시 시도하는 횟수
+RESUME_BATCH_OVERLOAD_RETRIES = int(os.getenv("RESUME_BATCH_OVERLOAD_RETRIES", "5"))
+
+
+def _text_key(pdf_hash: str) -> str:
+    return make_cache_key("text", EXTRACTOR_VERSION, pdf_hash)
+
+
+def _info_key(pdf_hash: str) -> str:
+    # 규칙 사전 추출 여부에 따라 결과가 달라지므로 모드별로 따로 캐시
+    return make_cache_key(
+        "info", EXTRACTOR_VERSION, RESUME_EXTRACT_GUIDED, RESUME_PRE_EXTRACT, pdf_hash
+    )
+
+
+class _StageLimits:
+    """배치 모드 단계별 동시 실행 제한 - 단일 요청에서는 제한 없이 바로 실행"""
+
+    def __init__(self, download: int, parse: int, llm: int, overload_retries: int):
+        self.download = asyncio.Semaphore(download)
+        self.parse = asyncio.Semaphore(parse)
+        self.llm = asyncio.Semaphore(llm)
+        self.overload_retries = overload_retries
+
+
+async def _retry_overloaded(limits: Optional[_StageLimits], fn: Callable[..., Awaitable], *args, **kwargs):
+    """배치 모드에서는 CPU 풀/LLM 과부하 거절을 Retry-After 만큼 기다렸다 재시도"""
+    attempts = 1 + (limits.overload_retries if limits else 0)
+    for attempt in range(attempts):
+        try:
+            return await fn(*args, **kwargs)
+        except LLMOverloadedError as e:
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep(e.retry_after)
+
+
+async def _parse_pdf(pdf_bytes: bytes, pdf_hash: str, limits: Optional[_StageLimits]) -> str:
+    """PDF 유효성 검사 + 텍스트 추출 (한 번의 open, 프로세스 풀에서 실행해 이벤트 루프를 막지 않음)"""
+    resume_text = resume_cache.get(_text_key(pdf_hash)) if RESUME_CACHE_ENABLED else None
+    if resume_text is not None:
+        return resume_text
 
-        # 1. PDF 다운로드
-        pdf_bytes = download_pdf_from_url(file_url)
-        print("📦 Step 2: PDF 다운로드 성공")
-        print("🔥 PDF 첫 100바이트:", pdf_bytes[:100])
+    async with limits.parse if limits else nullcontext():
+        try:
+            resume_text = await _retry_overloaded(
+                limits, get_cpu_pool().run, extract_text_with_formatting, pdf_bytes
+            )
+        except PDFValidationError as e:
+            print(f"❌ Step 3: PDF 유효성 검사 실패 ({type(e).__name__}):", e)
+            raise
+        if not resume_text.strip():
+            # 이미지로만 된 이력서 - 텍스트 레이어가 없는 페이지만 OCR
+            print("🔍 Step 3: 텍스트 레이어 없음, 페이지별 OCR 시도")
+            resume_text = await extract_text_with_ocr(pdf_bytes)
+    if RESUME_CACHE_ENABLED and resume_text.strip():
+        resume_cache.set(_text_key(pdf_hash), resume_text)
+    return resume_text
 
-        # 2. PDF 유효성 검사
-        if not is_valid_pdf(pdf_bytes):
-            print("❌ Step 3: PDF 유효성 검사 실패")
-            raise ValueError("invalid_file_type")
-        print("✅ Step 3: PDF 유효성 검사 통과")
 
-        # 3. 텍스트 추출
-        resume_text = extract_text_with_formatting(pdf_bytes)
-        print("📄 Step 4: 텍스트 길이:", len(resume_text))
-        print("📄 텍스트 앞 600자:\n", resume_text[:600].encode('utf-8', 'replace').decode('utf-8'))
+async def _infer(resume_text: str, limits: Optional[_StageLimits]) -> dict:
+    """규칙 기반 사전 추출 + LLM 추론 - 실패하면 예외 (fallback 결과는 캐시하지 않음)"""
+    ruled, llm_text = pre_extract(resume_text) if RESUME_PRE_EXTRACT else ({}, resume_text)
+    if ruled:
+        print(f"📐 규칙 추출 필드: {ruled}, LLM 입력 {len(resume_text)} → {len(llm_text)}자")
 
-        if len(resume_text.strip()) == 0:
-            raise ValueError("resume_text_is_empty")
+    async with limits.llm if limits else nullcontext():
+        result = await _retry_overloaded(
+            limits,
+            extract_info_from_resume,
+            llm_text,
+            fallback=False,
+            priority=PRIORITY_BATCH if limits else PRIORITY_DEFAULT,
+        )
+    if result is None:
+        raise ValueError("llm_extract_failed")
+    result.update(ruled)
+    return result
 
-        # 4. LLM 추론
-        result = await extract_info_from_resume(resume_text)
+
+async def _run_pipeline(
+    file_url: str,
+    loader: Callable[[str], Awaitable[bytes]] = download_pdf_from_url,
+    limits: Optional[_StageLimits] = None,
+) -> Tuple[dict, str]:
+    """다운로드 → 파싱 → LLM - (ResumeInfo dict, "success" | "cached") 반환, 실패 시 예외"""
+    print("📥 Step 1: file_url =", file_url)
+
+    # 1. PDF 다운로드
+    async with limits.download if limits else nullcontext():
+        pdf_bytes = await loader(str(file_url))
+    print("📦 Step 2: PDF 다운로드 성공")
+    print("🔥 PDF 첫 100바이트:", pdf_bytes[:100])
+
+    pdf_hash = hashlib.sha256(pdf_bytes).hexdigest()
+    if RESUME_CACHE_ENABLED:
+        cached_info = resume_cache.get(_info_key(pdf_hash))
+        if cached_info is not None:
+            print("⚡ 캐시 적중: 파싱/LLM 호출 생략 -", pdf_hash[:12])
+            return cached_info, "cached"
+
+    # 2. PDF 유효성 검사 + 텍스트 추출
+    resume_text = await _parse_pdf(pdf_bytes, pdf_hash, limits)
+    print("📄 Step 3: 텍스트 길이:", len(resume_text))
+    print("📄 텍스트 앞 600자:\n", resume_text[:600].encode('utf-8', 'replace').decode('utf-8'))
+
+    if len(resume_text.strip()) == 0:
+        raise ValueError("resume_text_is_empty")
+
+    # 3. 규칙 기반 사전 추출 + LLM 추론
+    result = await _infer(resume_text, limits)
+    if RESUME_CACHE_ENABLED:
+        resume_cache.set(_info_key(pdf_hash), result)
+    return result, "success"
+
+
+def _fallback_info() -> ResumeInfo:
+    return ResumeInfo(
+        certification_count=0,
+        project_count=0,
+        major_type="NON_MAJOR",
+        company_name=None,
+        work_period=0,
+        position=None,
+        additional_experiences=None
+    )
+
+
+async def extract_resume_info(file_url: str) -> ResumeInfo:
+    try:
+        result, _ = await _run_pipeline(file_url)
         return ResumeInfo(**result)
 
+    except LLMOverloadedError:
+        raise
     except Exception as e:
         print("❌ extract_resume_info 실패:", e)
         traceback.print_exc()
         # fallback 반환
-        return ResumeInfo(
-            certification_count=0,
-            project_count=0,
-            major_type="NON_MAJOR",
-            company_name=None,
-            work_period=0,
-            position=None,
-            additional_experiences=None
-        )
\ No newline at end of file
+        return _fallback_info()
+
+
+async def extract_resume_batch(
+    file_urls: List[str],
+    loader: Callable[[str], Awaitable[bytes]] = download_pdf_from_url,
+) -> AsyncIterator[Dict]:
+    """
+    여러 이력서를 파이프라인으로 동시에 처리하고 끝나는 순서대로 항목 결과 반환
+    - 단계별 동시 실행 수를 따로 제한해 다운로드/파싱/LLM이 겹쳐서 진행됨
+    - 항목별 실패는 status="failed" + fallback 데이터로 반환 (배치 전체를 실패시키지 않음)
+    """
+    limits = _StageLimits(
+        RESUME_BATCH_DOWNLOAD_CONCURRENCY,
+        RESUME_BATCH_PARSE_CONCURRENCY,
+        RESUME_BATCH_LLM_CONCURRENCY,
+        RESUME_BATCH_OVERLOAD_RETRIES,
+    )
+
+    async def run(index: int, file_url: str) -> Dict:
+        # 배치 요청 전체 예산 대신 항목마다 예산을 새로 둠 (태스크별 컨텍스트라 다른 항목에 영향 없음)
+        deadline.replace_deadline(RESUME_BATCH_ITEM_TIMEOUT)
+        start = time.perf_counter()
+        try:
+            result, status = await _run_pipeline(file_url, loader, limits)
+            data, error = ResumeInfo(**result), None
+        except Exception as e:
+            print(f"❌ [{index}] 이력서 추출 실패:", e)
+            data, status, error = _fallback_info(), "failed", f"{type(e).__name__}: {e}"
+        return {
+            "index": index,
+            "file_url": str(file_url),
+            "status": status,
+            "data": data.dict(),
+            "error": error,
+            "elapsed": round(time.perf_counter() - start, 3),
+        }
+
+    tasks = [asyncio.ensure_future(run(index, url)) for index, url in enumerate(file_urls)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # 클라이언트가 스트림을 끊으면 남은 항목 취소
+        for task in tasks:
+            task.cancel()
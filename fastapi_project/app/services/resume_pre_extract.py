@@ -0,0 +1,204 @@
+# app/services/resume_pre_extract.py
+"""
+규칙 기반 사전 추출 - LLM 프롬프트를 줄이기 위해 확실한 필드는 직접 계산
+
+extract_text_with_formatting이 붙인 "[📌 제목 추정]" 줄로 이력서를 섹션으로 나누고
+- 자격증 섹션의 각 줄이 모두 자격증 패턴이면 certification_count
+- 학력 섹션의 학과/학위 줄에 IT 계열 전공 키워드가 있으면 major_type
+- 경력 섹션에서 회사/근무 표현이 있는 줄의 기간이 하나뿐이면 work_period
+을 직접 채웁니다. LLM에는 나머지 필드에 필요한 섹션만 보내고,
+섹션 구분이 불확실하면 전체 텍스트를 그대로 보냅니다.
+"""
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+TITLE_PREFIX = "[📌 제목 추정]"
+
+# 섹션 제목 분류 키워드 (소문자 기준) - 위에서부터 먼저 맞는 종류로 분류
+# "경험/experience"가 들어간 "프로젝트 경험", "대외활동 경험" 등이 경력으로 잡히지 않도록 career는 마지막
+SECTION_KEYWORDS = {
+    "certification": ("자격", "어학", "certif", "license"),
+    "project": ("프로젝트", "project"),
+    # "교육"은 부트캠프/직무 교육 섹션도 걸리므로 학력이 아니라 기타 활동으로 분류
+    "education": ("학력", "전공", "education"),
+    "activity": ("활동", "수상", "대외", "동아리", "교육", "award", "activit"),
+    "career": ("경력", "근무", "재직", "직장", "경험", "career", "experience", "employment"),
+}
+# 필드 → LLM이 판단에 참고해야 하는 섹션
+FIELD_SECTIONS = {
+    "certification_count": ("certification",),
+    "project_count": ("project",),
+    "major_type": ("education",),
+    "company_name": ("career",),
+    "work_period": ("career",),
+    "position": ("career",),
+    "additional_experiences": ("activity",),
+}
+
+_CERT_NAME_RE = re.compile(
+    r"기사|기능사|SQLD|SQLP|ADsP|ADP|컴활|컴퓨터활용능력|TOEIC|토익|OPIc|TEPS|JLPT|HSK|"
+    r"운전면허|리눅스마스터|한국사|정보처리|AWS Certified|자격증",
+    re.IGNORECASE,
+)
+# 점수/등급/취득 표시 (프롬프트 기준: 점수나 등급이 함께 있는 항목만 자격증으로 셈)
+# 점수는 앞뒤에 숫자/점이 붙지 않은 세 자리 수만 인정 (연도 "2022", 날짜 "2022.05"의 일부는 제외)
+_CERT_EVIDENCE_RE = re.compile(
+    r"(?<![\d.])[1-9]\d{2}(?![\d.])\s*점?|\d\s*급|\b(?:IH|IM[1-3]?|AL|N[1-5]|Level\s*\d)\b|취득|합격|\d{4}\s*[.\-/년]\s*\d{1,2}",
+    re.IGNORECASE,
+)
+_MAJOR_RE = re.compile(
+    r"컴퓨터|소프트웨어|전산|정보통신|정보보호|인공지능|데이터사이언스|\bAI\b|computer|software",
+    re.IGNORECASE,
+)
+# 전공이 아니라 교육 과정(부트캠프 등)의 키워드일 수 있어 학과/학위 표현이 같은 줄에 있을 때만 인정
+_DEGREE_RE = re.compile(
+    r"학과|학부|대학교|대학|전공|학사|석사|박사|bachelor|master|degree|major|university|college",
+    re.IGNORECASE,
+)
+# 기간이 근무 기간인지 판단하는 회사/고용 표현 (프로젝트/교육 기간 제외용)
+_EMPLOYMENT_RE = re.compile(
+    r"근무|재직|인턴|입사|퇴사|회사|주식회사|\(주\)|㈜|정규직|계약직|"
+    r"\bintern\b|employ|\binc\b|\bcorp|\bltd\b|co\.,",
+    re.IGNORECASE,
+)
+_YM = r"(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*월?"
+_PERIOD_RE = re.compile(_YM + r"\s*[~\-–—]\s*(?:" + _YM + r"|(현재|재직\s*중|present))", re.IGNORECASE)
+
+_metrics: Dict[str, Any] = {
+    "documents": 0,
+    "reduced": 0,
+    "full_text_fallbacks": 0,
+    "input_chars": 0,
+    "llm_chars": 0,
+    "fields": {field: 0 for field in FIELD_SECTIONS},
+}
+
+
+def split_sections(text: str) -> List[Tuple[Optional[str], str]]:
+    """(섹션 종류, 섹션 텍스트) 목록 - 첫 제목 앞부분과 분류 못 한 섹션의 종류는 None"""
+    sections: List[Tuple[Optional[str], List[str]]] = [(None, [])]
+    for line in text.splitlines():
+        if line.startswith(TITLE_PREFIX):
+            title = line[len(TITLE_PREFIX):].strip().lower()
+            kind = next(
+                (k for k, words in SECTION_KEYWORDS.items() if any(w in title for w in words)),
+                None,
+            )
+            sections.append((kind, [line]))
+        else:
+            sections[-1][1].append(line)
+    return [(kind, "\n".join(lines)) for kind, lines in sections if "".join(lines).strip()]
+
+
+def _body_lines(section: str) -> List[str]:
+    return [
+        line.strip() for line in section.splitlines()
+        if line.strip() and not line.startswith(TITLE_PREFIX)
+    ]
+
+
+def _certification_count(sections: List[str]) -> Optional[int]:
+    lines = [line for section in sections for line in _body_lines(section)]
+    if not lines:
+        return None
+    matched = [line for line in lines if _CERT_NAME_RE.search(line) and _CERT_EVIDENCE_RE.search(line)]
+    # 섹션 안에 패턴에 안 맞는 줄이 있으면 (여러 줄에 걸친 항목 등) LLM에 맡김
+    return len(matched) if len(matched) == len(lines) else None
+
+
+def _major_type(sections: List[str]) -> Optional[str]:
+    """학과/학위 줄에 IT 계열 키워드가 있으면 MAJOR, 아니면 LLM에 맡김 (NON_MAJOR는 단정하지 않음)"""
+    lines = (line for section in sections for line in _body_lines(section))
+    return "MAJOR" if any(_MAJOR_RE.search(line) and _DEGREE_RE.search(line) for line in lines) else None
+
+
+def _employment_periods(section: str) -> List[re.Match]:
+    """
+    회사/고용 표현이 같은 줄에 있는 기간만 (프로젝트/교육 기간 제외)
+    - 기간 없이 회사명만 있는 윗줄 바로 아래 기간도 인정
+    """
+    lines = _body_lines(section)
+
+    def is_employment(i: int) -> bool:
+        if _EMPLOYMENT_RE.search(lines[i]):
+            return True
+        prev = lines[i - 1] if i > 0 else ""
+        return bool(_EMPLOYMENT_RE.search(prev)) and not _PERIOD_RE.search(prev)
+
+    return [m for i, line in enumerate(lines) if is_employment(i) for m in _PERIOD_RE.finditer(line)]
+
+
+def _work_period(sections: List[str]) -> Optional[int]:
+    periods = [m for section in sections for m in _employment_periods(section)]
+    if len(periods) != 1 or periods[0].group(5):
+        # 기간이 여러 개(최근 회사 판단 필요)거나 "현재"인 경우는 LLM에 맡김
+        return None
+    y1, m1, y2, m2 = (int(periods[0].group(i)) for i in range(1, 5))
+    months = (y2 - y1) * 12 + (m2 - m1) + 1
+    return months if 0 < months <= 600 else None
+
+
+def pre_extract(resume_text: str) -> Tuple[Dict[str, Any], str]:
+    """
+    (규칙으로 확정한 필드, LLM에 보낼 텍스트) 반환
+    - 제목이 2개 미만이거나 남은 필드에 필요한 섹션이 없으면 전체 텍스트를 보냄
+    """
+    _metrics["documents"] += 1
+    _metrics["input_chars"] += len(resume_text)
+
+    sections = split_sections(resume_text)
+    by_kind: Dict[str, List[str]] = {}
+    for kind, section in sections:
+        if kind is not None:
+            by_kind.setdefault(kind, []).append(section)
+
+    fields: Dict[str, Any] = {}
+    # 제목 앞부분이 비어 있으면 split_sections가 빼므로 제목으로 시작하는 섹션을 직접 셈
+    headed = sum(1 for _, section in sections if section.startswith(TITLE_PREFIX))
+    if headed < 2:
+        _metrics["full_text_fallbacks"] += 1
+        _metrics["llm_chars"] += len(resume_text)
+        return fields, resume_text
+
+    if "certification" in by_kind:
+        count = _certification_count(by_kind["certification"])
+        if count is not None:
+            fields["certification_count"] = count
+    if "education" in by_kind:
+        major = _major_type(by_kind["education"])
+        if major is not None:
+            fields["major_type"] = major
+    if "career" in by_kind:
+        period = _work_period(by_kind["career"])
+        if period is not None:
+            fields["work_period"] = period
+    # 경력 섹션이 없다고 근무 이력 없음으로 단정하지 않음 - 아래에서 전체 텍스트를 LLM에 보냄
+
+    remaining = [field for field in FIELD_SECTIONS if field not in fields]
+    needed = {kind for field in remaining for kind in FIELD_SECTIONS[field]}
+    # 근무 기간만 확정된 경우에도 회사명/직무는 경력 섹션이 필요
+    if not all(kind in by_kind for kind in needed if kind != "activity"):
+        _metrics["full_text_fallbacks"] += 1
+        _metrics["llm_chars"] += len(resume_text)
+        for field in fields:
+            _metrics["fields"][field] += 1
+        return fields, resume_text
+
+    # 첫 제목 앞(이름/연락처/한 줄 소개)과 분류 못 한 섹션은 기타 활동 판단에 쓰일 수 있어 함께 보냄
+    keep = needed | ({None} if "additional_experiences" in remaining else set())
+    llm_text = "\n".join(section for kind, section in sections if kind in keep)
+
+    _metrics["reduced"] += 1
+    _metrics["llm_chars"] += len(llm_text)
+    for field in fields:
+        _metrics["fields"][field] += 1
+    return fields, llm_text
+
+
+def get_metrics() -> Dict[str, Any]:
+    metrics = dict(_metrics)
+    metrics["fields"] = dict(_metrics["fields"])
+    metrics["char_reduction"] = (
+        round(1 - metrics["llm_chars"] / metrics["input_chars"], 4) if metrics["input_chars"] else None
+    )
+    return metrics
@@ -0,0 +1,102 @@
+import os
+import time
+import logging
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+# 연속 실패 N회 → open, reset_timeout 후 half-open 시험 요청 허용
+VLLM_BREAKER_FAILURES = int(os.getenv("VLLM_BREAKER_FAILURES", "5"))
+VLLM_BREAKER_RESET_TIMEOUT = float(os.getenv("VLLM_BREAKER_RESET_TIMEOUT", "30"))
+VLLM_BREAKER_HALF_OPEN_MAX = int(os.getenv("VLLM_BREAKER_HALF_OPEN_MAX", "1"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    백엔드 장애 시 호출을 즉시 차단하는 서킷 브레이커
+    - closed: 정상 호출, 연속 실패가 임계치에 닿으면 open
+    - open: 호출 차단 (호출 측은 바로 fallback), reset_timeout 경과 후 half-open
+    - half-open: 시험 요청 몇 개만 통과, 성공 시 closed / 실패 시 다시 open
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = VLLM_BREAKER_FAILURES,
+        reset_timeout: float = VLLM_BREAKER_RESET_TIMEOUT,
+        half_open_max: int = VLLM_BREAKER_HALF_OPEN_MAX,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max = half_open_max
+
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trials_in_flight = 0
+        self._metrics = {"opened_total": 0, "short_circuited_total": 0}
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._trials_in_flight = 0
+            logger.info(f"[{self.name}] 서킷 half-open - 시험 요청 허용")
+        return self._state
+
+    def retry_after(self) -> float:
+        """open 상태가 풀리기까지 남은 시간 (초)"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        """호출 허용 여부 - half-open에서는 시험 요청 슬롯을 점유"""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._trials_in_flight < self.half_open_max:
+            self._trials_in_flight += 1
+            return True
+        self._metrics["short_circuited_total"] += 1
+        return False
+
+    def record_success(self) -> None:
+        if self._state == HALF_OPEN:
+            logger.info(f"[{self.name}] 시험 요청 성공 - 서킷 closed")
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._trials_in_flight = 0
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def release(self) -> None:
+        """성공/실패로 판단할 수 없는 종료 (취소, 예산 소진 등) - 시험 슬롯만 반납"""
+        if self._state == HALF_OPEN and self._trials_in_flight > 0:
+            self._trials_in_flight -= 1
+
+    def _open(self) -> None:
+        if self._state != OPEN:
+            self._metrics["opened_total"] += 1
+            logger.warning(
+                f"[{self.name}] 서킷 open - 연속 실패 {self._consecutive_failures}회, "
+                f"{self.reset_timeout}s 동안 호출 차단"
+            )
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._trials_in_flight = 0
+
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics = dict(self._metrics)
+        metrics["state"] = self.state
+        metrics["consecutive_failures"] = self._consecutive_failures
+        metrics["retry_after"] = round(self.retry_after(), 2)
+        return metrics
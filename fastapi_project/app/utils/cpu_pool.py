@@ -0,0 +1,171 @@
+import os
+import time
+import asyncio
+import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Set
+from concurrent.futures import Future
+
+from app.utils import deadline
+from app.utils.llm_admission import LLMOverloadedError
+
+logger = logging.getLogger(__name__)
+
+# CPU 작업(PDF 파싱, OCR 등) 프로세스 풀 설정
+CPU_POOL_WORKERS = int(os.getenv("CPU_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+# 실행 중 + 대기 작업이 workers + max_queue를 넘으면 즉시 거절
+CPU_POOL_MAX_QUEUE = int(os.getenv("CPU_POOL_MAX_QUEUE", "32"))
+CPU_JOB_TIMEOUT = float(os.getenv("CPU_JOB_TIMEOUT", "30"))
+
+
+class CPUPoolOverloadedError(LLMOverloadedError):
+    """문서 처리 대기열 초과 - LLM 과부하와 같은 503 + Retry-After 응답으로 처리"""
+
+    def __init__(self, retry_after: int = 2):
+        super().__init__(retry_after, f"문서 처리 대기열 초과 - {retry_after}초 후 재시도하세요")
+
+
+class CPUJobTimeoutError(TimeoutError):
+    """작업 제한 시간 초과"""
+
+
+class CPUPool:
+    """
+    CPU 바운드 작업용 프로세스 풀
+    - 이벤트 루프를 막지 않도록 별도 프로세스에서 실행
+    - 대기열 상한, 작업별 타임아웃(요청 예산 이내), 대기열 깊이 메트릭
+    - 이미 실행 중인 작업은 타임아웃 후에도 멈출 수 없으므로 워커가 실제로 끝날 때까지 in_flight에 포함
+    """
+
+    def __init__(
+        self,
+        workers: int = CPU_POOL_WORKERS,
+        max_queue: int = CPU_POOL_MAX_QUEUE,
+        job_timeout: float = CPU_JOB_TIMEOUT,
+    ):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.job_timeout = job_timeout
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        # 타임아웃으로 호출 측은 포기했지만 워커에서 계속 실행 중인 작업
+        self._abandoned: Set[Future] = set()
+        self._durations = deque(maxlen=500)
+        self._metrics = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "rejected": 0,
+            "restarts": 0,
+        }
+
+    def start(self) -> None:
+        if self._executor is None:
+            # 서버 프로세스의 스레드(스케줄러, 이벤트 루프) 상태를 복제하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"CPU 프로세스 풀 시작 - workers={self.workers}, max_queue={self.max_queue}")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        fn(*args)를 워커 프로세스에서 실행 (fn과 인자는 pickle 가능해야 함)
+        - 대기열이 가득 차면 CPUPoolOverloadedError
+        - timeout(기본 job_timeout)과 남은 요청 예산 중 작은 값을 넘기면 CPUJobTimeoutError
+          (대기 중이던 작업은 취소, 실행 중인 작업은 끝날 때까지 슬롯을 차지)
+        """
+        limit = timeout or self.job_timeout
+        budget = deadline.remaining()
+        if budget is not None:
+            if budget <= 0:
+                self._metrics["timeouts"] += 1
+                raise CPUJobTimeoutError("요청 예산이 소진되어 CPU 작업을 실행하지 않습니다")
+            limit = min(limit, budget)
+
+        if self._in_flight >= self.workers + self.max_queue:
+            self._metrics["rejected"] += 1
+            raise CPUPoolOverloadedError()
+
+        self.start()
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        future = None
+        try:
+            future = self._executor.submit(fn, *args)
+            self._in_flight += 1
+            self._metrics["submitted"] += 1
+            # 슬롯은 호출 측이 아니라 워커의 작업이 실제로 끝날(또는 대기 중 취소될) 때 반환
+            future.add_done_callback(lambda f: self._on_job_done(loop, f))
+            result = await asyncio.wait_for(asyncio.wrap_future(future), limit)
+            self._metrics["completed"] += 1
+            self._durations.append(time.perf_counter() - start)
+            return result
+        except asyncio.TimeoutError as e:
+            self._metrics["timeouts"] += 1
+            if not future.cancel() and not future.done():
+                self._abandoned.add(future)
+            logger.error(
+                f"CPU 작업 타임아웃: {getattr(fn, '__name__', fn)} "
+                f"(워커에서 계속 실행 중인 작업 {len(self._abandoned)}개)"
+            )
+            raise CPUJobTimeoutError(f"CPU 작업 제한 시간 초과 ({limit:.1f}s)") from e
+        except BrokenProcessPool:
+            # 워커가 비정상 종료(메모리 부족 등)하면 풀을 다시 만듦
+            self._metrics["failed"] += 1
+            self._metrics["restarts"] += 1
+            logger.error("CPU 프로세스 풀 손상 - 재생성")
+            self.shutdown()
+            raise
+        except Exception:
+            self._metrics["failed"] += 1
+            raise
+        finally:
+            if future is not None and not future.done():
+                future.cancel()
+
+    def _on_job_done(self, loop: asyncio.AbstractEventLoop, future: Future) -> None:
+        """작업 종료 콜백 - executor 스레드에서 호출될 수 있어 카운터 갱신은 이벤트 루프로 넘김"""
+        try:
+            loop.call_soon_threadsafe(self._release, future)
+        except RuntimeError:
+            # 루프 종료 후(서버 shutdown) 끝난 작업
+            self._release(future)
+
+    def _release(self, future: Future) -> None:
+        self._in_flight -= 1
+        self._abandoned.discard(future)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        durations = sorted(self._durations)
+        p95 = durations[min(len(durations) - 1, int(0.95 * len(durations)))] if durations else None
+        metrics: Dict[str, Any] = dict(self._metrics)
+        metrics["workers"] = self.workers
+        metrics["in_flight"] = self._in_flight
+        metrics["abandoned_running"] = len(self._abandoned)
+        metrics["queue_depth"] = max(0, self._in_flight - self.workers)
+        metrics["max_queue"] = self.max_queue
+        metrics["duration_p95"] = round(p95, 4) if p95 is not None else None
+        return metrics
+
+
+# 전역 CPU 풀 (앱 전체에서 공유)
+_cpu_pool: Optional[CPUPool] = None
+
+
+def get_cpu_pool() -> CPUPool:
+    """전역 CPU 프로세스 풀 반환"""
+    global _cpu_pool
+    if _cpu_pool is None:
+        _cpu_pool = CPUPool()
+    return _cpu_pool
@@ -0,0 +1,52 @@
+import os
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+
+# 요청 전체 예산 기본값 (초) - 헤더가 없을 때 적용
+REQUEST_BUDGET_SECONDS = float(os.getenv("REQUEST_BUDGET_SECONDS", "60"))
+# 클라이언트가 남은 예산을 전달하는 헤더 (초 단위)
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout"
+
+# 현재 요청의 절대 마감 시각 (time.monotonic 기준)
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+def set_deadline(budget_seconds: Optional[float]) -> Token:
+    """현재 컨텍스트에 마감 시각 설정 - 이미 더 이른 마감이 있으면 유지"""
+    if budget_seconds is None:
+        return _deadline.set(_deadline.get())
+    new_deadline = time.monotonic() + budget_seconds
+    current = _deadline.get()
+    if current is not None and current < new_deadline:
+        new_deadline = current
+    return _deadline.set(new_deadline)
+
+
+def replace_deadline(budget_seconds: float) -> Token:
+    """기존 마감과 상관없이 새 마감으로 교체 (스트리밍 배치처럼 항목마다 예산을 따로 두는 경우)"""
+    return _deadline.set(time.monotonic() + budget_seconds)
+
+
+def reset_deadline(token: Token) -> None:
+    _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """남은 예산(초) - 마감이 없으면 None"""
+    current = _deadline.get()
+    if current is None:
+        return None
+    return current - time.monotonic()
+
+
+def parse_budget(header_value: Optional[str]) -> float:
+    """X-Request-Timeout 헤더 → 예산(초), 잘못된 값이면 기본값"""
+    if header_value:
+        try:
+            budget = float(header_value)
+            if budget > 0:
+                return budget
+        except ValueError:
+            pass
+    return REQUEST_BUDGET_SECONDS
@@ -1,28 +1,129 @@
 # app/utils/file.py
-import requests
+import os
 import io
+import time
+import asyncio
+import aiohttp
 import pdfplumber
-from PyPDF2 import PdfReader
 from pdf2image import convert_from_bytes
 import pytesseract
+from app.utils import deadline
+from app.utils.http_pool import get_download_session
 
+# PDF 다운로드 제한
+PDF_MAX_BYTES = int(os.getenv("PDF_MAX_BYTES", str(10 * 1024 * 1024)))
+PDF_DOWNLOAD_TIMEOUT = float(os.getenv("PDF_DOWNLOAD_TIMEOUT", "30"))
+PDF_DOWNLOAD_CHUNK = 64 * 1024
+# PDF 헤더(%PDF-)는 파일 앞 1024바이트 안에 있어야 함
+_PDF_MAGIC = b"%PDF-"
+_PDF_MAGIC_WINDOW = 1024
+# S3 등은 업로드 방식에 따라 octet-stream으로 내려주므로 함께 허용
+_ALLOWED_CONTENT_TYPES = {"application/pdf", "application/octet-stream", "binary/octet-stream", "application/x-pdf"}
 
-def download_pdf_from_url(file_url: str) -> bytes:
-    headers = {"User-Agent": "Mozilla/5.0"}
-    response = requests.get(file_url, headers=headers)
-    if response.status_code != 200:
-        raise Exception(f"PDF 다운로드 실패 (status code: {response.status_code})")
-    print(f"\U0001F4C5 PDF 다운로드 성공 - Content-Type: {response.headers.get('Content-Type')}, 파일크기: {len(response.content)} bytes")
-    return response.content
+_download_metrics = {
+    "downloads_total": 0,
+    "failures_total": 0,
+    "rejected_too_large": 0,
+    "rejected_not_pdf": 0,
+    "bytes_total": 0,
+    "seconds_total": 0.0,
+}
 
-def is_valid_pdf(pdf_bytes: bytes) -> bool:
+
+class PDFDownloadError(Exception):
+    """PDF 다운로드 실패 (HTTP 오류, 타임아웃, 연결 오류)"""
+
+
+class PDFTooLargeError(PDFDownloadError):
+    """PDF_MAX_BYTES 초과 - 본문을 끝까지 읽지 않고 중단"""
+
+
+class PDFContentTypeError(PDFDownloadError):
+    """PDF가 아닌 응답 (Content-Type 또는 파일 헤더 불일치)"""
+
+
+def _check_content_type(content_type: str) -> None:
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type and media_type not in _ALLOWED_CONTENT_TYPES:
+        _download_metrics["rejected_not_pdf"] += 1
+        raise PDFContentTypeError(f"PDF가 아닌 Content-Type: {media_type}")
+
+
+def _check_pdf_header(buffer: bytearray) -> None:
+    if _PDF_MAGIC not in buffer[:_PDF_MAGIC_WINDOW]:
+        _download_metrics["rejected_not_pdf"] += 1
+        raise PDFContentTypeError("파일 헤더가 PDF가 아닙니다")
+
+
+async def download_pdf_from_url(file_url: str, max_bytes: int = PDF_MAX_BYTES) -> bytes:
+    """
+    공유 세션으로 PDF 스트리밍 다운로드
+    - Content-Length / Content-Type이 맞지 않으면 본문을 읽기 전에 중단
+    - 읽는 도중 max_bytes를 넘거나 파일 헤더가 PDF가 아니면 즉시 중단
+    """
+    timeout = PDF_DOWNLOAD_TIMEOUT
+    budget = deadline.remaining()
+    if budget is not None:
+        timeout = max(0.1, min(timeout, budget))
+
+    start = time.perf_counter()
     try:
-        reader = PdfReader(io.BytesIO(pdf_bytes))
-        return len(reader.pages) > 0
-    except Exception as e:
-        print("❌ PyPDF2 PDF 유효성 검사 실패:", e)
-        return False
+        async with get_download_session().get(
+            str(file_url), timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            if response.status != 200:
+                raise PDFDownloadError(f"PDF 다운로드 실패 (status code: {response.status})")
+
+            _check_content_type(response.headers.get("Content-Type", ""))
+            if response.content_length is not None and response.content_length > max_bytes:
+                _download_metrics["rejected_too_large"] += 1
+                raise PDFTooLargeError(
+                    f"PDF 크기 초과: {response.content_length} bytes (최대 {max_bytes} bytes)"
+                )
+
+            buffer = bytearray()
+            header_checked = False
+            async for chunk in response.content.iter_chunked(PDF_DOWNLOAD_CHUNK):
+                buffer.extend(chunk)
+                if len(buffer) > max_bytes:
+                    _download_metrics["rejected_too_large"] += 1
+                    raise PDFTooLargeError(f"PDF 크기 초과: {max_bytes} bytes 이상")
+                if not header_checked and len(buffer) >= _PDF_MAGIC_WINDOW:
+                    _check_pdf_header(buffer)
+                    header_checked = True
+
+            if not header_checked:
+                _check_pdf_header(buffer)
+
+    except PDFDownloadError:
+        _download_metrics["failures_total"] += 1
+        raise
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        _download_metrics["failures_total"] += 1
+        raise PDFDownloadError(f"PDF 다운로드 실패: {type(e).__name__} {e}") from e
+
+    elapsed = time.perf_counter() - start
+    _download_metrics["downloads_total"] += 1
+    _download_metrics["bytes_total"] += len(buffer)
+    _download_metrics["seconds_total"] += elapsed
+    throughput = len(buffer) / elapsed / (1024 * 1024) if elapsed > 0 else 0.0
+    print(
+        f"\U0001F4C5 PDF 다운로드 성공 - Content-Type: {response.headers.get('Content-Type')}, "
+        f"파일크기: {len(buffer)} bytes, {elapsed:.2f}s ({throughput:.2f} MB/s)"
+    )
+    return bytes(buffer)
+
 
+def get_download_metrics() -> dict:
+    metrics = dict(_download_metrics)
+    metrics["avg_throughput_mb_s"] = (
+        round(metrics["bytes_total"] / metrics["seconds_total"] / (1024 * 1024), 3)
+        if metrics["seconds_total"]
+        else None
+    )
+    metrics["seconds_total"] = round(metrics["seconds_total"], 3)
+    metrics["max_bytes"] = PDF_MAX_BYTES
+    return metrics
 
 def extract_text_from_pdf(pdf_bytes: bytes) -> str:
     """
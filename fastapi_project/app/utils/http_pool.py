@@ -0,0 +1,90 @@
+import os
+import logging
+from typing import Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# vLLM 커넥션 풀 설정
+VLLM_POOL_LIMIT = int(os.getenv("VLLM_POOL_LIMIT", "100"))
+VLLM_POOL_LIMIT_PER_HOST = int(os.getenv("VLLM_POOL_LIMIT_PER_HOST", "32"))
+VLLM_KEEPALIVE_TIMEOUT = float(os.getenv("VLLM_KEEPALIVE_TIMEOUT", "30"))
+
+# 파일(S3 등) 다운로드 커넥션 풀 설정
+DOWNLOAD_POOL_LIMIT = int(os.getenv("DOWNLOAD_POOL_LIMIT", "50"))
+DOWNLOAD_POOL_LIMIT_PER_HOST = int(os.getenv("DOWNLOAD_POOL_LIMIT_PER_HOST", "20"))
+
+# 이름별 공유 세션 (앱 수명 동안 유지)
+_sessions: Dict[str, aiohttp.ClientSession] = {}
+
+
+def _create_vllm_session() -> aiohttp.ClientSession:
+    """vLLM 호출용 세션 생성 (keep-alive + 호스트별 커넥션 제한)"""
+    connector = aiohttp.TCPConnector(
+        limit=VLLM_POOL_LIMIT,
+        limit_per_host=VLLM_POOL_LIMIT_PER_HOST,
+        keepalive_timeout=VLLM_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=300,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+def get_vllm_session() -> aiohttp.ClientSession:
+    """
+    vLLM /v1/chat/completions 호출에 공유되는 세션 반환
+    - startup 이전(스크립트 등)에 호출되면 지연 생성
+    """
+    session: Optional[aiohttp.ClientSession] = _sessions.get("vllm")
+    if session is None or session.closed:
+        session = _create_vllm_session()
+        _sessions["vllm"] = session
+        logger.info(
+            f"vLLM 커넥션 풀 생성 - limit={VLLM_POOL_LIMIT}, "
+            f"limit_per_host={VLLM_POOL_LIMIT_PER_HOST}, keepalive={VLLM_KEEPALIVE_TIMEOUT}s"
+        )
+    return session
+
+
+def _create_download_session() -> aiohttp.ClientSession:
+    """파일 다운로드용 세션 생성 (vLLM 호출과 커넥션 한도를 나눠 서로 막지 않도록 분리)"""
+    connector = aiohttp.TCPConnector(
+        limit=DOWNLOAD_POOL_LIMIT,
+        limit_per_host=DOWNLOAD_POOL_LIMIT_PER_HOST,
+        ttl_dns_cache=300,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={"User-Agent": "Mozilla/5.0"},
+    )
+
+
+def get_download_session() -> aiohttp.ClientSession:
+    """이력서 PDF 등 외부 파일 다운로드에 공유되는 세션 반환 (지연 생성)"""
+    session: Optional[aiohttp.ClientSession] = _sessions.get("download")
+    if session is None or session.closed:
+        session = _create_download_session()
+        _sessions["download"] = session
+        logger.info(
+            f"다운로드 커넥션 풀 생성 - limit={DOWNLOAD_POOL_LIMIT}, "
+            f"limit_per_host={DOWNLOAD_POOL_LIMIT_PER_HOST}"
+        )
+    return session
+
+
+async def init_http_pool() -> None:
+    """FastAPI startup 시 공유 세션 생성"""
+    get_vllm_session()
+    get_download_session()
+
+
+async def close_http_pool() -> None:
+    """FastAPI shutdown 시 공유 세션 정리"""
+    for name, session in list(_sessions.items()):
+        if not session.closed:
+            await session.close()
+        logger.info(f"HTTP 세션 종료: {name}")
+    _sessions.clear()
@@ -0,0 +1,139 @@
+import os
+import time
+import heapq
+import asyncio
+import itertools
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 (값이 작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = 0  # 면접 피드백, 에이전트 질문 등 사용자가 기다리는 요청
+PRIORITY_DEFAULT = 1  # 이력서 추출 등 일반 API
+PRIORITY_BATCH = 2  # 기업 요약 배치
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_DEFAULT: "default",
+    PRIORITY_BATCH: "batch",
+}
+
+# 대기열 임계치 (자기보다 앞선 대기 요청 수 기준)
+VLLM_MAX_QUEUE = int(os.getenv("VLLM_MAX_QUEUE", "64"))
+VLLM_MAX_QUEUE_BATCH = int(os.getenv("VLLM_MAX_QUEUE_BATCH", "1000"))
+VLLM_RETRY_AFTER = int(os.getenv("VLLM_RETRY_AFTER", "2"))
+
+
+class LLMOverloadedError(Exception):
+    """대기열이 임계치를 넘어 요청을 즉시 거절한 경우 (503 + Retry-After)"""
+
+    def __init__(self, retry_after: int = VLLM_RETRY_AFTER, message: str = ""):
+        self.retry_after = retry_after
+        super().__init__(message or f"LLM 서버 과부하 - {retry_after}초 후 재시도하세요")
+
+
+class AdmissionController:
+    """
+    우선순위 기반 세마포어
+    - 슬롯이 비면 우선순위가 높은(값이 작은) 대기 요청부터 입장
+    - 앞선 대기 요청 수가 임계치를 넘으면 기다리지 않고 즉시 거절
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int = VLLM_MAX_QUEUE,
+        max_queue_batch: int = VLLM_MAX_QUEUE_BATCH,
+        retry_after: int = VLLM_RETRY_AFTER,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_queue_batch = max_queue_batch
+        self.retry_after = retry_after
+
+        self._available = max_concurrency
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+        self._wait_times = deque(maxlen=500)
+        self._admitted = {name: 0 for name in PRIORITY_NAMES.values()}
+        self._rejected = {name: 0 for name in PRIORITY_NAMES.values()}
+
+    def _queue_limit(self, priority: int) -> int:
+        return self.max_queue_batch if priority >= PRIORITY_BATCH else self.max_queue
+
+    def _waiting_ahead(self, priority: int) -> int:
+        return sum(1 for p, _, _ in self._waiters if p <= priority)
+
+    async def acquire(self, priority: int = PRIORITY_DEFAULT) -> None:
+        name = PRIORITY_NAMES.get(priority, "default")
+        start = time.perf_counter()
+
+        if self._available > 0 and not self._waiters:
+            self._available -= 1
+            self._admitted[name] += 1
+            self._wait_times.append(0.0)
+            return
+
+        if self._waiting_ahead(priority) >= self._queue_limit(priority):
+            self._rejected[name] += 1
+            logger.warning(
+                f"LLM 대기열 초과로 요청 거절 - priority={name}, waiting={len(self._waiters)}"
+            )
+            raise LLMOverloadedError(self.retry_after)
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._seq), future)
+        heapq.heappush(self._waiters, entry)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 → 다음 대기자에게 넘김
+                self.release()
+            elif entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+
+        self._admitted[name] += 1
+        self._wait_times.append(time.perf_counter() - start)
+
+    def try_acquire(self) -> bool:
+        """대기 없이 빈 슬롯이 있을 때만 획득 (hedge 같은 부가 요청용, 대기 요청보다 앞지르지 않음)"""
+        if self._available > 0 and not self._waiters:
+            self._available -= 1
+            return True
+        return False
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._available += 1
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_DEFAULT):
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        wait_times = sorted(self._wait_times)
+        p95 = wait_times[min(len(wait_times) - 1, int(0.95 * len(wait_times)))] if wait_times else None
+        return {
+            "in_use": self.max_concurrency - self._available,
+            "waiting": len(self._waiters),
+            "max_queue": self.max_queue,
+            "admitted": dict(self._admitted),
+            "rejected": dict(self._rejected),
+            "queue_wait_p95": round(p95, 4) if p95 is not None else None,
+        }
@@ -1,22 +1,27 @@
 import os
 import asyncio
-import aiohttp
 import logging
 from typing import Optional
 from langchain_openai import ChatOpenAI
+from app.utils.vllm_gateway import LLMGatewayError, get_gateway
+from app.utils.llm_admission import LLMOverloadedError, PRIORITY_DEFAULT
+from app.utils.token_budget import count_tokens, fit_to_budget, input_budget
 
 
 class LLMClient:
     """OpenAI와 VLLM을 통합하여 사용할 수 있는 LLM 클라이언트"""
 
-    def __init__(self, temperature: float = 0.3):
+    def __init__(self, temperature: float = 0.3, priority: int = PRIORITY_DEFAULT):
         self.temperature = temperature
+        self.priority = priority  # vLLM 대기열 우선순위
         self.logger = logging.getLogger(self.__class__.__name__)
 
         # 환경 변수 설정
         self.llm_type = os.getenv("LLM_TYPE", "openai")  # openai, vllm
-        self.vllm_url = os.getenv("VLLM_URL", "http://localhost:8001")
-        self.model_name = os.getenv("MODEL_NAME", "CohereLabs/aya-expanse-8b")
+        self.gateway = get_gateway()
+        self.vllm_url = self.gateway.base_url
+        self.vllm_urls = self.gateway.base_urls  # VLLM_URLS 지정 시 replica 목록
+        self.model_name = self.gateway.model_name
 
         self.logger.info(f"LLM 타입: {self.llm_type}")
 
@@ -33,14 +38,17 @@ class LLMClient:
         )
 
     async def ainvoke(
-        self, prompt: str, system_prompt: Optional[str] = None
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
     ) -> "LLMResponse":
-        """비동기 LLM 호출"""
+        """비동기 LLM 호출 (max_tokens 미지정 시 vLLM은 1024, OpenAI는 모델 기본값)"""
 
         if self.llm_type == "vllm":
-            return await self._call_vllm(prompt, system_prompt)
+            return await self._call_vllm(prompt, system_prompt, max_tokens)
         else:
-            return await self._call_openai(prompt, system_prompt)
+            return await self._call_openai(prompt, system_prompt, max_tokens)
 
     def invoke(self, prompt: str, system_prompt: Optional[str] = None) -> "LLMResponse":
         """동기 LLM 호출 (비동기 래핑)"""
@@ -56,66 +64,71 @@ class LLMClient:
             return loop.run_until_complete(self.ainvoke(prompt, system_prompt))
 
     async def _call_vllm(
-        self, prompt: str, system_prompt: Optional[str] = None
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
     ) -> "LLMResponse":
         """VLLM API 호출"""
+        max_tokens = max_tokens or 1024
 
         # 시스템 프롬프트 설정
         if system_prompt is None:
             system_prompt = "당신은 도움이 되는 AI 어시스턴트입니다. 사용자의 요청에 정확하고 상세하게 답변해주세요."
 
+        # 컨텍스트 길이 - 생성 토큰 - 시스템 프롬프트 안에 들어오도록 사용자 프롬프트 조정
+        prompt = fit_to_budget(
+            prompt, input_budget(max_tokens, reserved=count_tokens(system_prompt))
+        )
+
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": prompt},
         ]
 
         try:
-            self.logger.debug(f"VLLM 호출: {self.vllm_url}")
-
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=60)
-            ) as session:
-                async with session.post(
-                    url=f"{self.vllm_url}/v1/chat/completions",
-                    json={
-                        "model": self.model_name,
-                        "messages": messages,
-                        "max_tokens": 1024,
-                        "temperature": self.temperature,
-                    },
-                    headers={"Content-Type": "application/json"},
-                ) as response:
-                    response.raise_for_status()
-                    result = await response.json()
-
-                    content = result["choices"][0]["message"]["content"].strip()
-                    self.logger.debug(f"VLLM 응답 길이: {len(content)} 글자")
-
-                    return LLMResponse(content)
-
-        except aiohttp.ClientError as e:
+            self.logger.debug(f"VLLM 호출: {self.gateway.completions_url}")
+
+            # 공용 vLLM 게이트웨이를 통해 호출 (풀/타임아웃/동시성 제한 공유)
+            content = await self.gateway.chat(
+                messages,
+                max_tokens=max_tokens,
+                temperature=self.temperature,
+                priority=self.priority,
+            )
+            self.logger.debug(f"VLLM 응답 길이: {len(content)} 글자")
+
+            return LLMResponse(content)
+
+        except (LLMOverloadedError, LLMGatewayError) as e:
+            # 오류 문자열을 모델 출력처럼 돌려주지 않고 호출 측(fallback)에 전달
             self.logger.error(f"VLLM 호출 실패: {e}")
-            error_msg = f"VLLM 호출 중 오류 발생: {str(e)}"
-            return LLMResponse(error_msg)
+            raise
         except Exception as e:
             self.logger.error(f"예상치 못한 VLLM 오류: {e}")
-            error_msg = f"LLM 처리 중 오류 발생: {str(e)}"
-            return LLMResponse(error_msg)
+            raise LLMGatewayError(f"LLM 처리 중 오류 발생: {str(e)}") from e
 
     async def _call_openai(
-        self, prompt: str, system_prompt: Optional[str] = None
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
     ) -> "LLMResponse":
         """OpenAI API 호출"""
 
         try:
+            # 시스템/사용자 메시지를 분리해 고정 시스템 프롬프트가 프롬프트 앞부분(prefix)으로 유지되게 함
+            messages = [("human", prompt)]
             if system_prompt:
-                # 시스템 프롬프트가 있는 경우
-                full_prompt = f"{system_prompt}\n\n{prompt}"
-            else:
-                full_prompt = prompt
+                messages.insert(0, ("system", system_prompt))
 
             self.logger.debug("OpenAI 호출 시작")
-            response = await self.openai_client.ainvoke(full_prompt)
+            client = (
+                self.openai_client.bind(max_tokens=max_tokens)
+                if max_tokens
+                else self.openai_client
+            )
+            response = await client.ainvoke(messages)
 
             content = (
                 response.content.strip()
@@ -128,8 +141,7 @@ class LLMClient:
 
         except Exception as e:
             self.logger.error(f"OpenAI 호출 실패: {e}")
-            error_msg = f"OpenAI 호출 중 오류 발생: {str(e)}"
-            return LLMResponse(error_msg)
+            raise LLMGatewayError(f"OpenAI 호출 중 오류 발생: {str(e)}") from e
 
 
 class LLMResponse:
@@ -146,25 +158,36 @@ class LLMResponse:
 
 
 # 전역 LLM 클라이언트 팩토리
-def create_llm_client(temperature: float = 0.3) -> LLMClient:
+def create_llm_client(
+    temperature: float = 0.3, priority: int = PRIORITY_DEFAULT
+) -> LLMClient:
     """LLM 클라이언트 생성 팩토리 함수"""
-    return LLMClient(temperature=temperature)
+    return LLMClient(temperature=temperature, priority=priority)
 
 
 # 기존 ChatOpenAI 호환성을 위한 래퍼
 class ChatLLM:
     """기존 ChatOpenAI와 호환되는 인터페이스"""
 
-    def __init__(self, model: str = "gpt-3.5-turbo", temperature: float = 0.3):
+    def __init__(
+        self,
+        model: str = "gpt-3.5-turbo",
+        temperature: float = 0.3,
+        priority: int = PRIORITY_DEFAULT,
+    ):
         self.model = model
         self.temperature = temperature
-        self.client = create_llm_client(temperature)
+        self.priority = priority
+        self.client = create_llm_client(temperature, priority=priority)
 
     async def ainvoke(
-        self, prompt: str, system_prompt: Optional[str] = None
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
     ) -> LLMResponse:
         """시스템 프롬프트를 지원하는 ainvoke 메서드"""
-        return await self.client.ainvoke(prompt, system_prompt)
+        return await self.client.ainvoke(prompt, system_prompt, max_tokens)
 
     def invoke(self, prompt: str, system_prompt: Optional[str] = None) -> LLMResponse:
         """시스템 프롬프트를 지원하는 invoke 메서드"""
@@ -0,0 +1,101 @@
+import os
+import time
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, List, Tuple
+
+import fitz  # PyMuPDF
+import pytesseract
+from PIL import Image
+
+from app.utils.cpu_pool import get_cpu_pool
+
+logger = logging.getLogger(__name__)
+
+# 페이지별 OCR 설정
+OCR_DPI = int(os.getenv("OCR_DPI", "200"))
+OCR_LANG = os.getenv("OCR_LANG", "kor+eng")
+# 텍스트 레이어 글자 수가 이보다 적은 페이지만 OCR
+OCR_MIN_PAGE_CHARS = int(os.getenv("OCR_MIN_PAGE_CHARS", "20"))
+# 이력서 한 건에서 OCR할 최대 페이지 수
+OCR_MAX_PAGES = int(os.getenv("OCR_MAX_PAGES", "10"))
+
+_metrics = {"documents_total": 0, "pages_total": 0, "pages_failed": 0, "seconds_total": 0.0}
+
+
+def page_text_layers(pdf_bytes: bytes) -> List[str]:
+    """페이지별 텍스트 레이어 (프로세스 풀에서 실행)"""
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        return [page.get_text().strip() for page in doc]
+
+
+def ocr_page(pdf_bytes: bytes, page_index: int, dpi: int, lang: str) -> str:
+    """페이지 하나를 지정 DPI로 래스터화해 tesseract OCR (프로세스 풀에서 실행)"""
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        pix = doc[page_index].get_pixmap(dpi=dpi)
+    image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    return pytesseract.image_to_string(image, lang=lang).strip()
+
+
+async def ocr_pages(
+    pdf_bytes: bytes, page_indices: List[int], dpi: int = OCR_DPI, lang: str = OCR_LANG
+) -> AsyncIterator[Tuple[int, str]]:
+    """
+    여러 페이지를 프로세스 풀에서 동시에 OCR하고 끝나는 순서대로 (페이지 번호, 텍스트) 반환
+    - 실패한 페이지는 빈 문자열
+    """
+    pool = get_cpu_pool()
+
+    async def run(index: int) -> Tuple[int, str]:
+        try:
+            return index, await pool.run(ocr_page, pdf_bytes, index, dpi, lang)
+        except Exception as e:
+            _metrics["pages_failed"] += 1
+            logger.warning(f"OCR 실패 (page {index + 1}): {type(e).__name__} {e}")
+            return index, ""
+
+    tasks = [asyncio.ensure_future(run(index)) for index in page_indices]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, text = await next_done
+            _metrics["pages_total"] += 1
+            yield index, text
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def extract_text_with_ocr(
+    pdf_bytes: bytes, dpi: int = OCR_DPI, lang: str = OCR_LANG
+) -> str:
+    """
+    텍스트 레이어가 없는 페이지만 골라 OCR, 나머지 페이지는 기존 텍스트 사용
+    - 결과는 원래 페이지 순서대로 합침
+    """
+    start = time.perf_counter()
+    pool = get_cpu_pool()
+    texts = await pool.run(page_text_layers, pdf_bytes)
+
+    targets = [i for i, text in enumerate(texts) if len(text) < OCR_MIN_PAGE_CHARS]
+    if len(targets) > OCR_MAX_PAGES:
+        logger.warning(f"OCR 대상 {len(targets)}페이지 중 앞 {OCR_MAX_PAGES}페이지만 처리")
+        targets = targets[:OCR_MAX_PAGES]
+    if not targets:
+        return "\n".join(texts)
+
+    _metrics["documents_total"] += 1
+    async for index, text in ocr_pages(pdf_bytes, targets, dpi, lang):
+        logger.info(f"OCR 완료 (page {index + 1}): {len(text)}자")
+        texts[index] = text
+
+    elapsed = time.perf_counter() - start
+    _metrics["seconds_total"] += elapsed
+    logger.info(f"OCR {len(targets)}/{len(texts)}페이지 처리 ({elapsed:.2f}s, dpi={dpi})")
+    return "\n".join(text for text in texts if text)
+
+
+def get_metrics() -> Dict[str, float]:
+    metrics = dict(_metrics)
+    metrics["seconds_total"] = round(metrics["seconds_total"], 3)
+    metrics["dpi"] = OCR_DPI
+    return metrics
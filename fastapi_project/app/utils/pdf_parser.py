@@ -1,8 +1,51 @@
+import re
+from typing import List, Tuple
+
 import fitz  # PyMuPDF
 import numpy as np
 
 BULLET_CHARS = {"●", "-", "·", "•", "▪", "※", "▶", "‣", "■"}
 TITLE_EXCLUDE_KEYWORDS = {"intern", "project", "engineer", "developer", "assistant", "news", "digital", "data", "team"}
+# 제목이 아닌 줄 판별: "@", "." 또는 제외 키워드를 한 번의 정규식 검색으로 확인 (소문자 기준)
+_NOT_TITLE_RE = re.compile("|".join(re.escape(k) for k in sorted(TITLE_EXCLUDE_KEYWORDS | {"@", "."})))
+# 이미지 블록은 쓰지 않으므로 get_text("dict")에서 이미지 데이터 추출을 끔
+_TEXT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+
+class PDFValidationError(ValueError):
+    """열 수 없거나 내용이 없는 PDF"""
+
+
+class PDFCorruptError(PDFValidationError):
+    """PDF 구조가 손상되어 열 수 없음"""
+
+
+class PDFEncryptedError(PDFValidationError):
+    """암호가 걸려 있어 텍스트를 읽을 수 없음"""
+
+
+class PDFEmptyError(PDFValidationError):
+    """페이지가 하나도 없음"""
+
+
+def open_pdf(pdf_bytes: bytes) -> fitz.Document:
+    """
+    PyMuPDF로 한 번만 열면서 유효성 검사
+    - 손상 / 암호화 / 빈 문서는 각각의 PDFValidationError로 구분
+    """
+    try:
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    except Exception as e:
+        raise PDFCorruptError(f"PDF를 열 수 없습니다: {e}") from e
+
+    # 빈 사용자 암호로 걸린 문서는 fitz가 자동으로 풀어주므로 여기서는 실제 암호가 필요한 경우만 남음
+    if doc.needs_pass:
+        doc.close()
+        raise PDFEncryptedError("암호가 설정된 PDF입니다")
+    if doc.page_count == 0:
+        doc.close()
+        raise PDFEmptyError("페이지가 없는 PDF입니다")
+    return doc
 
 def is_probably_bullet(text: str) -> bool:
     return text and (text[0] in BULLET_CHARS)
@@ -12,54 +55,70 @@ def is_title_candidate(text: str) -> bool:
     return word_count >= 2 or len(text.strip()) >= 5
 
 def is_probably_not_title(text: str) -> bool:
-    lower = text.lower()
-    if (
-        "@" in text or
-        "." in text or
-        any(keyword in lower for keyword in TITLE_EXCLUDE_KEYWORDS) or
-        len(text.split()) > 5
-    ):
-        return True
-    return False
+    return bool(_NOT_TITLE_RE.search(text.lower())) or len(text.split()) > 5
 
 def extract_text_with_formatting(pdf_bytes: bytes) -> str:
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    """유효성 검사와 텍스트 추출을 한 번의 open으로 처리 (실패 시 PDFValidationError)"""
+    with open_pdf(pdf_bytes) as doc:
+        return _extract_lines(doc)
+
+
+def _collect_spans(page: fitz.Page) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    페이지의 span 속성을 한 번에 배열로 모음
+    - 반환: (줄 텍스트 목록, span 크기, span bold 여부, span이 속한 줄 번호)
+    - span이 없는 줄은 건너뛰고, 줄 번호는 텍스트 목록의 인덱스
+    """
+    texts: List[str] = []
+    sizes: List[float] = []
+    bold: List[bool] = []
+    line_ids: List[int] = []
+    for block in page.get_text("dict", flags=_TEXT_FLAGS)["blocks"]:
+        for line in block.get("lines", []):
+            spans = line.get("spans", [])
+            if not spans:
+                continue
+            line_id = len(texts)
+            texts.append(" ".join(span["text"].strip() for span in spans).strip())
+            for span in spans:
+                sizes.append(span["size"])
+                bold.append("Bold" in span["font"])
+                line_ids.append(line_id)
+    return (
+        texts,
+        np.asarray(sizes, dtype=np.float64),
+        np.asarray(bold, dtype=bool),
+        np.asarray(line_ids, dtype=np.intp),
+    )
+
+
+def _extract_lines(doc: fitz.Document) -> str:
     output_lines = []
 
     for page in doc:
-        font_sizes = []
-        all_spans = []
-        blocks = page.get_text("dict")["blocks"]
-        for block in blocks:
-            for line in block.get("lines", []):
-                for span in line.get("spans", []):
-                    font_sizes.append(span["size"])
-                    all_spans.append(span)
-
-        font_threshold = np.percentile(font_sizes, 90) if font_sizes else 0
-
-        for block in blocks:
-            for line in block.get("lines", []):
-                spans = line.get("spans", [])
-                if not spans:
-                    continue
-
-                full_text = " ".join(span["text"].strip() for span in spans).strip()
-                if not full_text:
-                    continue
-
-                all_bold = all("Bold" in span["font"] for span in spans)
-                avg_font_size = np.mean([span["size"] for span in spans])
-
-                if (
-                    all_bold and
-                    avg_font_size >= font_threshold and
-                    not is_probably_bullet(full_text) and
-                    is_title_candidate(full_text) and
-                    not is_probably_not_title(full_text)
-                ):
-                    output_lines.append(f"[📌 제목 추정] {full_text}")
-                else:
-                    output_lines.append(full_text)
-
-    return "\n".join(output_lines)
\ No newline at end of file
+        texts, sizes, bold, line_ids = _collect_spans(page)
+        if not texts:
+            continue
+
+        # 페이지 상위 10% 글자 크기와 줄별 평균 크기 / 전체 bold 여부를 줄 번호 기준으로 한 번에 계산
+        font_threshold = np.percentile(sizes, 90)
+        span_counts = np.bincount(line_ids, minlength=len(texts))
+        avg_font_sizes = np.bincount(line_ids, weights=sizes, minlength=len(texts)) / span_counts
+        all_bold = np.bincount(line_ids, weights=~bold, minlength=len(texts)) == 0
+        heading_like = all_bold & (avg_font_sizes >= font_threshold)
+
+        for full_text, is_heading_like in zip(texts, heading_like.tolist()):
+            if not full_text:
+                continue
+
+            if (
+                is_heading_like and
+                not is_probably_bullet(full_text) and
+                is_title_candidate(full_text) and
+                not is_probably_not_title(full_text)
+            ):
+                output_lines.append(f"[📌 제목 추정] {full_text}")
+            else:
+                output_lines.append(full_text)
+
+    return "\n".join(output_lines)
@@ -0,0 +1,234 @@
+import os
+import time
+import asyncio
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# 헬스 프로브 설정
+VLLM_PROBE_INTERVAL = float(os.getenv("VLLM_PROBE_INTERVAL", "5"))
+VLLM_PROBE_TIMEOUT = float(os.getenv("VLLM_PROBE_TIMEOUT", "2"))
+# /health 응답이 이보다 느리면 느린 replica로 보고 제외
+VLLM_PROBE_SLOW_SECONDS = float(os.getenv("VLLM_PROBE_SLOW_SECONDS", "1"))
+# 연속 실패 시 제외, 제외된 replica는 프로브 성공 또는 쿨다운 경과 후 재투입
+VLLM_EJECT_FAILURES = int(os.getenv("VLLM_EJECT_FAILURES", "3"))
+VLLM_EJECT_COOLDOWN = float(os.getenv("VLLM_EJECT_COOLDOWN", "30"))
+
+# vLLM Prometheus 메트릭 중 대기열 깊이
+_WAITING_METRIC = "vllm:num_requests_waiting"
+_RUNNING_METRIC = "vllm:num_requests_running"
+
+
+def _parse_metric(text: str, name: str) -> Optional[float]:
+    """Prometheus 텍스트 포맷에서 메트릭 값 합산 (라벨 무시)"""
+    total = None
+    for line in text.splitlines():
+        if not line.startswith(name):
+            continue
+        rest = line[len(name):]
+        if rest and rest[0] not in "{ ":
+            continue
+        try:
+            value = float(line.rsplit(" ", 1)[-1])
+        except ValueError:
+            continue
+        total = (total or 0.0) + value
+    return total
+
+
+class Replica:
+    """vLLM replica 하나의 라우팅 상태"""
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.outstanding = 0  # 이 프로세스에서 보낸 진행 중 요청 수
+        self.waiting = 0.0  # /metrics 기준 서버 대기열 (다른 클라이언트 포함)
+        self.running = 0.0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.eject_reason: Optional[str] = None
+        self.ewma_latency: Optional[float] = None
+
+        self.requests_total = 0
+        self.failures_total = 0
+        self.ejections_total = 0
+
+    @property
+    def completions_url(self) -> str:
+        return f"{self.url}/v1/chat/completions"
+
+    def is_available(self, now: float) -> bool:
+        return now >= self.ejected_until
+
+    def load(self) -> float:
+        return self.outstanding + self.waiting
+
+    def eject(self, reason: str, cooldown: float = VLLM_EJECT_COOLDOWN) -> None:
+        if self.is_available(time.monotonic()):
+            self.ejections_total += 1
+            logger.warning(f"vLLM replica 제외: {self.url} ({reason})")
+        self.ejected_until = time.monotonic() + cooldown
+        self.eject_reason = reason
+
+    def readmit(self) -> None:
+        if not self.is_available(time.monotonic()):
+            logger.info(f"vLLM replica 재투입: {self.url}")
+        self.ejected_until = 0.0
+        self.eject_reason = None
+        self.consecutive_failures = 0
+
+    def record_success(self, latency: float) -> None:
+        self.consecutive_failures = 0
+        self.ewma_latency = (
+            latency if self.ewma_latency is None else 0.8 * self.ewma_latency + 0.2 * latency
+        )
+
+    def record_failure(self) -> None:
+        self.failures_total += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= VLLM_EJECT_FAILURES:
+            self.eject(f"연속 실패 {self.consecutive_failures}회")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "available": self.is_available(time.monotonic()),
+            "eject_reason": self.eject_reason,
+            "outstanding": self.outstanding,
+            "waiting": self.waiting,
+            "running": self.running,
+            "ewma_latency": round(self.ewma_latency, 4) if self.ewma_latency is not None else None,
+            "requests_total": self.requests_total,
+            "failures_total": self.failures_total,
+            "ejections_total": self.ejections_total,
+        }
+
+
+class ReplicaPool:
+    """
+    vLLM replica 목록 + least-outstanding-requests 라우팅
+    - 진행 중 요청 수 + 서버 대기열 깊이가 가장 작은 replica 선택
+    - /health, /metrics 주기 프로브로 죽었거나 느린 replica 제외 및 재투입
+    """
+
+    def __init__(self, urls: Iterable[str]):
+        self.replicas: List[Replica] = [Replica(url) for url in urls]
+        if not self.replicas:
+            raise ValueError("vLLM replica URL이 하나 이상 필요합니다")
+        self._probe_task: Optional[asyncio.Task] = None
+        self._rr = 0
+
+    @property
+    def urls(self) -> List[str]:
+        return [replica.url for replica in self.replicas]
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    def available(self) -> List[Replica]:
+        now = time.monotonic()
+        return [r for r in self.replicas if r.is_available(now)]
+
+    def pick(self, exclude: Iterable[Replica] = ()) -> Replica:
+        """
+        가장 한가한 replica 선택
+        - 제외 목록/제외 상태를 빼고 후보가 없으면 전체에서 선택 (요청 자체는 시도)
+        """
+        excluded = set(id(r) for r in exclude)
+        candidates = [r for r in self.available() if id(r) not in excluded]
+        if not candidates:
+            candidates = [r for r in self.replicas if id(r) not in excluded] or self.replicas
+
+        # 동률이면 순환시켜 한 replica로 몰리지 않게 함
+        self._rr = (self._rr + 1) % len(self.replicas)
+        offset = self._rr
+        return min(
+            candidates,
+            key=lambda r: (r.load(), (self.replicas.index(r) - offset) % len(self.replicas)),
+        )
+
+    def acquire(self, replica: Replica) -> None:
+        replica.outstanding += 1
+        replica.requests_total += 1
+
+    def release(self, replica: Replica) -> None:
+        replica.outstanding -= 1
+
+    @contextmanager
+    def track(self, replica: Replica):
+        """요청 수명 동안 진행 중 카운트 유지"""
+        self.acquire(replica)
+        try:
+            yield
+        finally:
+            self.release(replica)
+
+    async def probe(self, session: aiohttp.ClientSession, replica: Replica) -> None:
+        timeout = aiohttp.ClientTimeout(total=VLLM_PROBE_TIMEOUT)
+        start = time.perf_counter()
+        try:
+            async with session.get(f"{replica.url}/health", timeout=timeout) as response:
+                healthy = response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            replica.eject(f"헬스 체크 실패: {type(e).__name__}")
+            return
+
+        elapsed = time.perf_counter() - start
+        if not healthy:
+            replica.eject(f"헬스 체크 응답 {response.status}")
+            return
+        if elapsed > VLLM_PROBE_SLOW_SECONDS:
+            replica.eject(f"헬스 체크 지연 {elapsed:.2f}s")
+            return
+
+        try:
+            async with session.get(f"{replica.url}/metrics", timeout=timeout) as response:
+                if response.status == 200:
+                    text = await response.text()
+                    replica.waiting = _parse_metric(text, _WAITING_METRIC) or 0.0
+                    replica.running = _parse_metric(text, _RUNNING_METRIC) or 0.0
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # 메트릭은 라우팅 보조 정보일 뿐 - 실패해도 제외하지 않음
+            pass
+
+        replica.readmit()
+
+    async def probe_all(self, session: aiohttp.ClientSession) -> None:
+        await asyncio.gather(*(self.probe(session, r) for r in self.replicas))
+
+    def start_probing(
+        self,
+        session_factory: Callable[[], aiohttp.ClientSession],
+        interval: float = VLLM_PROBE_INTERVAL,
+    ) -> None:
+        """백그라운드 프로브 시작 (replica가 하나면 라우팅할 대상이 없으므로 생략)"""
+        if len(self.replicas) < 2 or self._probe_task is not None:
+            return
+
+        async def loop() -> None:
+            while True:
+                try:
+                    await self.probe_all(session_factory())
+                except Exception as e:
+                    logger.warning(f"vLLM replica 프로브 실패: {e}")
+                await asyncio.sleep(interval)
+
+        self._probe_task = asyncio.get_running_loop().create_task(loop())
+        logger.info(f"vLLM replica 프로브 시작 - {len(self.replicas)}개, {interval}s 간격")
+
+    async def stop_probing(self) -> None:
+        if self._probe_task is None:
+            return
+        self._probe_task.cancel()
+        try:
+            await self._probe_task
+        except asyncio.CancelledError:
+            pass
+        self._probe_task = None
+
+    def get_metrics(self) -> List[Dict[str, Any]]:
+        return [replica.snapshot() for replica in self.replicas]
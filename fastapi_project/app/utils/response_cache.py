@@ -0,0 +1,153 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(*parts: Any) -> str:
+    """입력 조합을 SHA-256 캐시 키로 변환"""
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    2단 응답 캐시
+    - 1단: 메모리 LRU (+TTL)
+    - 2단: SQLite (선택, sqlite_path 지정 시) - 재시작 후에도 유지
+    값은 JSON 직렬화 가능한 객체만 저장
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 1024,
+        ttl_seconds: float = 86400,
+        sqlite_path: Optional[str] = None,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.sqlite_path = sqlite_path or None
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._metrics = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+        }
+
+        if self.sqlite_path:
+            self._init_sqlite()
+
+    def _init_sqlite(self) -> None:
+        try:
+            directory = os.path.dirname(self.sqlite_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.sqlite_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, "
+                "value TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            self._conn.commit()
+            logger.info(f"[{self.name}] SQLite 캐시 사용: {self.sqlite_path}")
+        except sqlite3.Error as e:
+            logger.error(f"[{self.name}] SQLite 캐시 초기화 실패, 메모리 캐시만 사용: {e}")
+            self._conn = None
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._metrics["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+
+            value = self._get_from_disk(key, now)
+            if value is not None:
+                self._set_memory(key, value, now)
+                self._metrics["disk_hits"] += 1
+                return value
+
+            self._metrics["misses"] += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        with self._lock:
+            self._set_memory(key, value, now)
+            self._set_disk(key, value, now)
+            self._metrics["sets"] += 1
+
+    def _set_memory(self, key: str, value: Any, now: float) -> None:
+        self._memory[key] = (now + self.ttl_seconds, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._metrics["evictions"] += 1
+
+    def _get_from_disk(self, key: str, now: float) -> Optional[Any]:
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                (self.name, key),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND key = ?", (self.name, key)
+                )
+                self._conn.commit()
+                return None
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"[{self.name}] SQLite 캐시 조회 실패: {e}")
+            return None
+
+    def _set_disk(self, key: str, value: Any, now: float) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (self.name, key, json.dumps(value, ensure_ascii=False), now + self.ttl_seconds),
+            )
+            self._conn.commit()
+        except (sqlite3.Error, TypeError) as e:
+            logger.warning(f"[{self.name}] SQLite 캐시 저장 실패: {e}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics = dict(self._metrics)
+        lookups = metrics["memory_hits"] + metrics["disk_hits"] + metrics["misses"]
+        metrics["size"] = len(self._memory)
+        metrics["hit_rate"] = (
+            round((metrics["memory_hits"] + metrics["disk_hits"]) / lookups, 4)
+            if lookups
+            else None
+        )
+        metrics["sqlite"] = self._conn is not None
+        return metrics
@@ -0,0 +1,174 @@
+import json
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _default_embedder() -> Callable[[str], List[float]]:
+    """Chroma에서 이미 사용 중인 KR-SBERT 임베딩 모델을 재사용"""
+    from app.utils.chroma_handler import embedding_function
+
+    return embedding_function.embed_query
+
+
+def _normalize(vector: Iterable[float]) -> np.ndarray:
+    arr = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(arr)
+    return arr / norm if norm > 0 else arr
+
+
+class SemanticFeedbackCache:
+    """
+    질문별 의미 유사도 캐시
+    - 같은 질문(정규화 키) 안에서만 답변 임베딩을 비교
+    - 코사인 유사도가 threshold 이상인 가장 가까운 답변의 피드백을 재사용
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_questions: int = 1024,
+        max_per_question: int = 512,
+        embedder: Optional[Callable[[str], List[float]]] = None,
+        hit_log_path: Optional[str] = None,
+    ):
+        self.threshold = threshold
+        self.max_questions = max_questions
+        self.max_per_question = max_per_question
+        self.hit_log_path = hit_log_path or None
+        self._embedder = embedder
+
+        # question_key → {"vectors": (n, d) 행렬, "answers": [...], "feedbacks": [...]}
+        self._index: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._hit_scores: List[float] = []
+        self._metrics = {"lookups": 0, "hits": 0, "misses": 0, "adds": 0}
+
+    def _get_embedder(self) -> Callable[[str], List[float]]:
+        if self._embedder is None:
+            self._embedder = _default_embedder()
+        return self._embedder
+
+    async def embed(self, text: str) -> np.ndarray:
+        """CPU 연산이므로 스레드에서 임베딩"""
+        vector = await asyncio.to_thread(self._get_embedder(), text)
+        return _normalize(vector)
+
+    def nearest(
+        self, question_key: str, vector: np.ndarray
+    ) -> Optional[Tuple[float, str, str]]:
+        """(유사도, 저장된 답변, 피드백) 반환 - 인덱스가 비어있으면 None"""
+        entry = self._index.get(question_key)
+        if entry is None or not entry["answers"]:
+            return None
+        scores = entry["vectors"] @ vector
+        best = int(np.argmax(scores))
+        return float(scores[best]), entry["answers"][best], entry["feedbacks"][best]
+
+    async def lookup(
+        self, question_key: str, answer: str
+    ) -> Tuple[Optional[str], np.ndarray]:
+        """
+        (재사용할 피드백 또는 None, 답변 임베딩) 반환
+        - 임베딩은 miss 후 add()에 그대로 넘겨 재계산을 피함
+        """
+        self._metrics["lookups"] += 1
+        vector = await self.embed(answer)
+        match = self.nearest(question_key, vector)
+
+        if match is not None and match[0] >= self.threshold:
+            score, matched_answer, feedback = match
+            self._metrics["hits"] += 1
+            self._hit_scores.append(score)
+            self._hit_scores = self._hit_scores[-500:]
+            self._index.move_to_end(question_key)
+            self._log_hit(question_key, answer, matched_answer, score)
+            return feedback, vector
+
+        self._metrics["misses"] += 1
+        return None, vector
+
+    def add(
+        self, question_key: str, answer: str, feedback: str, vector: np.ndarray
+    ) -> None:
+        entry = self._index.get(question_key)
+        if entry is None:
+            entry = {"vectors": vector[np.newaxis, :], "answers": [], "feedbacks": []}
+            self._index[question_key] = entry
+        else:
+            entry["vectors"] = np.vstack([entry["vectors"], vector])
+
+        entry["answers"].append(answer)
+        entry["feedbacks"].append(feedback)
+
+        # 질문별 최대 개수 초과 시 오래된 답변부터 제거
+        if len(entry["answers"]) > self.max_per_question:
+            entry["vectors"] = entry["vectors"][1:]
+            entry["answers"].pop(0)
+            entry["feedbacks"].pop(0)
+
+        self._index.move_to_end(question_key)
+        while len(self._index) > self.max_questions:
+            self._index.popitem(last=False)
+
+        self._metrics["adds"] += 1
+
+    def _log_hit(
+        self, question_key: str, answer: str, matched_answer: str, score: float
+    ) -> None:
+        """오프라인 정밀도 검수를 위해 적중 쌍을 JSONL로 기록"""
+        if not self.hit_log_path:
+            return
+        record = {
+            "ts": time.time(),
+            "question_key": question_key,
+            "answer": answer,
+            "matched_answer": matched_answer,
+            "score": round(score, 4),
+        }
+        try:
+            with open(self.hit_log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"시맨틱 캐시 적중 로그 기록 실패: {e}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics = dict(self._metrics)
+        metrics["hit_rate"] = (
+            round(metrics["hits"] / metrics["lookups"], 4) if metrics["lookups"] else None
+        )
+        metrics["avg_hit_score"] = (
+            round(float(np.mean(self._hit_scores)), 4) if self._hit_scores else None
+        )
+        metrics["threshold"] = self.threshold
+        metrics["questions"] = len(self._index)
+        metrics["answers"] = sum(len(e["answers"]) for e in self._index.values())
+        return metrics
+
+
+def evaluate_threshold_precision(
+    scored_pairs: List[Tuple[float, bool]], thresholds: Iterable[float]
+) -> List[Dict[str, Any]]:
+    """
+    오프라인 평가 - (유사도, 사람이 판정한 '같은 피드백 재사용 가능' 여부) 목록으로
+    임계값별 precision / recall / 적중 비율 계산
+    """
+    total_positive = sum(1 for _, label in scored_pairs if label)
+    results = []
+    for threshold in thresholds:
+        selected = [label for score, label in scored_pairs if score >= threshold]
+        true_positive = sum(1 for label in selected if label)
+        results.append(
+            {
+                "threshold": threshold,
+                "hit_ratio": round(len(selected) / len(scored_pairs), 4) if scored_pairs else None,
+                "precision": round(true_positive / len(selected), 4) if selected else None,
+                "recall": round(true_positive / total_positive, 4) if total_positive else None,
+            }
+        )
+    return results
@@ -0,0 +1,53 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    동일 키의 동시 호출을 하나의 upstream 요청으로 합침
+    - 첫 호출(leader)이 작업을 시작하고, 이후 호출은 같은 결과를 함께 대기
+    - 일부 호출자가 취소돼도 작업은 유지, 모든 호출자가 떠나면 작업 취소
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+        self._metrics = {"leaders": 0, "shared": 0}
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda t, k=key: self._forget(k, t))
+            self._metrics["leaders"] += 1
+        else:
+            self._metrics["shared"] += 1
+            logger.debug(f"동일 LLM 요청 합류: {key[:12]}")
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._inflight.get(key) is task:
+                self._waiters[key] -= 1
+                if self._waiters[key] <= 0 and not task.done():
+                    task.cancel()
+            raise
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._waiters.pop(key, None)
+        # 모든 호출자가 취소된 뒤 실패한 경우 경고 로그 방지
+        if not task.cancelled():
+            task.exception()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics = dict(self._metrics)
+        metrics["in_flight"] = len(self._inflight)
+        return metrics
@@ -1,4 +1,3 @@
-import requests
 from langchain.prompts import FewShotPromptTemplate, PromptTemplate
 from langchain_community.vectorstores import Chroma
 from langchain_core.documents import Document
@@ -6,6 +5,9 @@ from langchain_core.documents import Document
 # from langchain_community.embeddings import SentenceTransformerEmbeddings
 from langchain_huggingface import HuggingFaceEmbeddings
 from app.utils.text_cleaner import clean_summary
+from app.utils.vllm_gateway import get_gateway
+from app.utils.llm_admission import PRIORITY_BATCH
+from app.utils.token_budget import count_message_tokens, fit_to_budget, input_budget, split_to_budget
 
 embedding_function = HuggingFaceEmbeddings(
     model_name="snunlp/KR-SBERT-V40K-klueNLI-augSTS", model_kwargs={"device": "cpu"}
@@ -54,24 +56,32 @@ fewshot_prompt = FewShotPromptTemplate(
 )
 
 
+SUMMARY_SYSTEM_PROMPT = "너는 취준생을 위한 한국어 기업 분석 요약 도우미야."
+SUMMARY_MAX_TOKENS = 1024
+
+
 def call_vllm(prompt: str) -> str:
-    url = "http://localhost:8001/v1/chat/completions"
-    headers = {"Content-Type": "application/json"}
-    payload = {
-        "model": "/mnt/ssd/aya-expanse-8b",
-        "messages": [
-            {
-                "role": "system",
-                "content": "너는 취준생을 위한 한국어 기업 분석 요약 도우미야.",
-            },
+    # 공용 vLLM 게이트웨이 경유 (스케줄러 스레드에서 호출되므로 동기 래퍼 사용)
+    return get_gateway().chat_sync(
+        [
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
             {"role": "user", "content": prompt},
         ],
-        "temperature": 0.3,
-        "max_tokens": 1024,
-    }
-    resp = requests.post(url, headers=headers, json=payload)
-    resp.raise_for_status()
-    return resp.json()["choices"][0]["message"]["content"]
+        temperature=0.3,
+        max_tokens=SUMMARY_MAX_TOKENS,
+        priority=PRIORITY_BATCH,
+    )
+
+
+def context_budget(corp_name: str) -> int:
+    """few-shot 프롬프트/시스템 프롬프트/생성 토큰을 제외하고 자료(context)에 쓸 수 있는 토큰 수"""
+    reserved = count_message_tokens(
+        [
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": fewshot_prompt.format(corp_name=corp_name, context="")},
+        ]
+    )
+    return input_budget(SUMMARY_MAX_TOKENS, reserved)
 
 
 def has_batchim(korean_word: str) -> bool:
@@ -134,9 +144,10 @@ def generate_latest_issue(corp_name: str, return_docs: bool = False):
 
     context = "\n\n".join(context_parts)
 
-    MAX_LEN = 4000
-    if len(context) > MAX_LEN:
-        chunks = [context[i : i + MAX_LEN] for i in range(0, len(context), MAX_LEN)]
+    # 모델 컨텍스트 예산 기준으로 문장 경계에서 분할
+    budget = context_budget(corp_name)
+    chunks = split_to_budget(context, budget)
+    if len(chunks) > 1:
         partial_summaries = [
             call_vllm(fewshot_prompt.format(corp_name=corp_name, context=chunk))
             for chunk in chunks
@@ -145,14 +156,12 @@ def generate_latest_issue(corp_name: str, return_docs: bool = False):
             [f"부분 요약 {i+1}: {s}" for i, s in enumerate(partial_summaries)]
         )
         final_prompt = fewshot_prompt.format(
-            corp_name=corp_name, context=merged_context
+            corp_name=corp_name, context=fit_to_budget(merged_context, budget)
         )
         result = call_vllm(final_prompt)
     else:
         prompt = fewshot_prompt.format(corp_name=corp_name, context=context)
         result = call_vllm(prompt)
-        prompt = fewshot_prompt.format(corp_name=corp_name, context=context)
-        result = call_vllm(prompt)
 
     cleaned = clean_summary(result, corp_name)
     return (cleaned, used_docs) if return_docs else cleaned
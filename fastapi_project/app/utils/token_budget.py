@@ -0,0 +1,159 @@
+import os
+import re
+import math
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 토크나이저 경로 (기본: vLLM이 서빙하는 모델 경로와 동일)
+TOKENIZER_PATH = os.getenv("TOKENIZER_PATH", os.getenv("MODEL_NAME", "/mnt/ssd/aya-expanse-8b"))
+# 모델 컨텍스트 길이 (aya-expanse-8b: 8K)
+MODEL_MAX_CONTEXT = int(os.getenv("MODEL_MAX_CONTEXT", "8192"))
+# chat template 특수 토큰 등 계산 오차 여유분
+TOKEN_SAFETY_MARGIN = int(os.getenv("TOKEN_SAFETY_MARGIN", "64"))
+# 메시지당 chat template 오버헤드 (role 토큰 등)
+_MESSAGE_OVERHEAD = 4
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?。])\s+|\n+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+_metrics = {"truncations_total": 0, "splits_total": 0, "truncated_tokens_total": 0}
+
+
+@lru_cache(maxsize=1)
+def get_tokenizer():
+    """모델 토크나이저 (최초 1회 로드 후 캐시) - 로드 실패 시 None (휴리스틱 사용)"""
+    try:
+        from transformers import AutoTokenizer
+
+        tokenizer = AutoTokenizer.from_pretrained(TOKENIZER_PATH)
+        logger.info(f"토크나이저 로드 완료: {TOKENIZER_PATH}")
+        return tokenizer
+    except Exception as e:
+        logger.warning(f"토크나이저 로드 실패, 글자 수 기반 추정 사용: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """텍스트 토큰 수 (토크나이저가 없으면 보수적으로 추정)"""
+    if not text:
+        return 0
+    tokenizer = get_tokenizer()
+    if tokenizer is not None:
+        return len(tokenizer.encode(text, add_special_tokens=False))
+    # 한글은 음절당 약 1토큰, 그 외는 약 3글자당 1토큰으로 보수적으로 추정
+    hangul = len(_HANGUL_RE.findall(text))
+    return hangul + math.ceil((len(text) - hangul) / 3)
+
+
+def count_message_tokens(messages: List[Dict[str, str]]) -> int:
+    return sum(count_tokens(m.get("content") or "") + _MESSAGE_OVERHEAD for m in messages)
+
+
+def input_budget(max_tokens: int, reserved: int = 0) -> int:
+    """입력에 쓸 수 있는 토큰 수 = 컨텍스트 - 생성 토큰 - 고정 프롬프트 - 여유분"""
+    return max(0, MODEL_MAX_CONTEXT - max_tokens - reserved - TOKEN_SAFETY_MARGIN)
+
+
+def _sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """문장 (시작, 끝) 위치 목록 - 원문 서식을 보존하기 위해 위치로 다룸"""
+    spans = []
+    start = 0
+    for match in _SENTENCE_RE.finditer(text):
+        if text[start:match.start()].strip():
+            spans.append((start, match.start()))
+        start = match.end()
+    if text[start:].strip():
+        spans.append((start, len(text)))
+    return spans
+
+
+def split_sentences(text: str) -> List[str]:
+    return [text[start:end] for start, end in _sentence_spans(text)]
+
+
+def _truncate_tokens(text: str, budget: int) -> str:
+    """문장 하나가 예산을 넘는 경우 토큰 단위로 자름"""
+    if budget <= 0:
+        return ""
+    tokenizer = get_tokenizer()
+    if tokenizer is not None:
+        ids = tokenizer.encode(text, add_special_tokens=False)[:budget]
+        return tokenizer.decode(ids)
+    # 휴리스틱: 예산 안에 들어올 때까지 글자 단위로 이분 탐색
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count_tokens(text[:mid]) <= budget:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low]
+
+
+def fit_to_budget(text: str, budget: int) -> str:
+    """
+    토큰 예산에 맞게 앞에서부터 문장 단위로 자름
+    - 예산 안이면 원문 그대로 반환
+    """
+    total = count_tokens(text)
+    if total <= budget:
+        return text
+
+    end = 0
+    used = 0
+    for start, stop in _sentence_spans(text):
+        tokens = count_tokens(text[start:stop]) + 1
+        if used + tokens > budget:
+            break
+        end = stop
+        used += tokens
+
+    fitted = text[:end] if end else _truncate_tokens(text, budget)
+    _metrics["truncations_total"] += 1
+    _metrics["truncated_tokens_total"] += total - count_tokens(fitted)
+    logger.info(f"프롬프트 입력 축소: {total} → {count_tokens(fitted)} tokens (예산 {budget})")
+    return fitted
+
+
+def split_to_budget(text: str, budget: int) -> List[str]:
+    """토큰 예산 이하의 청크들로 문장 경계에서 분할"""
+    if count_tokens(text) <= budget:
+        return [text]
+
+    chunks: List[str] = []
+    chunk_start, chunk_end, used = None, 0, 0
+    for start, stop in _sentence_spans(text):
+        tokens = count_tokens(text[start:stop]) + 1
+        if chunk_start is not None and used + tokens > budget:
+            chunks.append(text[chunk_start:chunk_end])
+            chunk_start, used = None, 0
+        if tokens > budget:
+            # 문장 하나가 예산을 넘으면 예산 크기로 잘라 단독 청크들로
+            rest = text[start:stop]
+            while rest.strip():
+                piece = _truncate_tokens(rest, budget)
+                if not piece:
+                    break
+                chunks.append(piece)
+                rest = rest[len(piece):]
+            continue
+        if chunk_start is None:
+            chunk_start = start
+        chunk_end = stop
+        used += tokens
+    if chunk_start is not None:
+        chunks.append(text[chunk_start:chunk_end])
+
+    _metrics["splits_total"] += 1
+    logger.info(f"프롬프트 입력 분할: {len(chunks)}개 청크 (청크당 예산 {budget} tokens)")
+    return chunks
+
+
+def get_metrics() -> Dict[str, Any]:
+    metrics: Dict[str, Any] = dict(_metrics)
+    metrics["tokenizer"] = "hf" if get_tokenizer() is not None else "heuristic"
+    metrics["max_context"] = MODEL_MAX_CONTEXT
+    return metrics
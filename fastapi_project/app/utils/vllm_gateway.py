@@ -0,0 +1,613 @@
+import os
+import re
+import json
+import time
+import random
+import asyncio
+import concurrent.futures
+import logging
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import aiohttp
+
+from app.utils import deadline
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.http_pool import get_vllm_session
+from app.utils.llm_admission import (
+    AdmissionController,
+    LLMOverloadedError,
+    PRIORITY_DEFAULT,
+)
+from app.utils.replica_pool import Replica, ReplicaPool
+from app.utils.response_cache import make_cache_key
+from app.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# vLLM 공통 설정 (모든 호출 경로가 이 값을 공유)
+VLLM_URL = os.getenv("VLLM_URL", "http://localhost:8001")
+# 기본값은 서버가 띄운 모델 경로 (기존 피드백/추출/요약 호출과 동일)
+# - 이전 LLMClient 기본값 "CohereLabs/aya-expanse-8b"로 서빙 중이면 MODEL_NAME을 지정해야 함
+MODEL_NAME = os.getenv("MODEL_NAME", "/mnt/ssd/aya-expanse-8b")
+VLLM_TIMEOUT = float(os.getenv("VLLM_TIMEOUT", "60"))
+VLLM_CONNECT_TIMEOUT = float(os.getenv("VLLM_CONNECT_TIMEOUT", "5"))
+VLLM_MAX_CONCURRENCY = int(os.getenv("VLLM_MAX_CONCURRENCY", "32"))
+VLLM_SINGLE_FLIGHT = os.getenv("VLLM_SINGLE_FLIGHT", "true").lower() == "true"
+
+# 복수 replica (쉼표 구분) - least-outstanding 라우팅, 헤징 시 다른 replica 사용
+VLLM_URLS = [u.strip() for u in os.getenv("VLLM_URLS", VLLM_URL).split(",") if u.strip()]
+
+# 재시도 (지터 포함 지수 백오프, 요청 예산이 남아 있을 때만)
+VLLM_MAX_RETRIES = int(os.getenv("VLLM_MAX_RETRIES", "2"))
+VLLM_RETRY_BASE_DELAY = float(os.getenv("VLLM_RETRY_BASE_DELAY", "0.2"))
+VLLM_RETRY_MAX_DELAY = float(os.getenv("VLLM_RETRY_MAX_DELAY", "2"))
+
+# 헤징 (p95 지연 이후 다른 replica로 두 번째 요청, 먼저 끝난 쪽 채택) - 부하를 늘리므로 기본 비활성
+VLLM_HEDGE = os.getenv("VLLM_HEDGE", "false").lower() == "true"
+VLLM_HEDGE_DELAY = float(os.getenv("VLLM_HEDGE_DELAY", "2"))
+VLLM_HEDGE_MIN_DELAY = float(os.getenv("VLLM_HEDGE_MIN_DELAY", "0.2"))
+VLLM_HEDGE_MIN_SAMPLES = 20
+
+# 재시도 가능한 HTTP 상태
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# LangChain 메시지 타입 → OpenAI 호환 role
+_ROLE_MAP = {"system": "system", "human": "user", "ai": "assistant"}
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class LLMGatewayError(Exception):
+    """vLLM 호출 실패 (네트워크 오류, 타임아웃, 비정상 응답)"""
+
+    def __init__(self, message: str = "", retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class LLMDeadlineExceeded(LLMGatewayError):
+    """요청 예산(deadline)이 소진되어 호출하지 않음"""
+
+
+class LLMCircuitOpenError(LLMGatewayError):
+    """서킷 브레이커가 열려 호출을 차단함 - 호출 측은 즉시 fallback"""
+
+
+def coalesce_key(payload: Dict[str, Any]) -> str:
+    """동일 요청 판별 키 - 메시지 공백 차이는 무시하고 샘플링 파라미터는 모두 포함"""
+    normalized = dict(payload)
+    normalized["messages"] = [
+        (m.get("role"), _WHITESPACE_RE.sub(" ", m.get("content") or "").strip())
+        for m in payload.get("messages", [])
+    ]
+    return make_cache_key(normalized)
+
+
+def to_openai_messages(messages: List[Any]) -> List[Dict[str, str]]:
+    """LangChain BaseMessage 목록을 /v1/chat/completions 형식으로 변환"""
+    converted = []
+    for message in messages:
+        if isinstance(message, dict):
+            converted.append(message)
+            continue
+        role = _ROLE_MAP.get(getattr(message, "type", ""), "user")
+        converted.append({"role": role, "content": message.content})
+    return converted
+
+
+class VLLMGateway:
+    """
+    vLLM /v1/chat/completions 단일 진입점
+    - 공유 커넥션 풀, 단일 타임아웃 정책, 우선순위 기반 동시성 제한, 메트릭 집계
+    - 요청 예산(deadline) 내에서만 재시도
+    - replica가 여럿이면 least-outstanding 라우팅 + 헤징
+    """
+
+    def __init__(
+        self,
+        base_urls: Optional[List[str]] = None,
+        model_name: str = MODEL_NAME,
+        timeout: float = VLLM_TIMEOUT,
+        max_concurrency: int = VLLM_MAX_CONCURRENCY,
+    ):
+        self.replicas = ReplicaPool(base_urls or VLLM_URLS)
+        self.base_urls = self.replicas.urls
+        self.base_url = self.base_urls[0]
+        self.model_name = model_name
+        self.timeout_seconds = timeout
+        self.max_concurrency = max_concurrency
+        self.admission = AdmissionController(max_concurrency)
+        self.single_flight = SingleFlight() if VLLM_SINGLE_FLIGHT else None
+        self.breaker = CircuitBreaker("vllm")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 메트릭
+        self._latencies = deque(maxlen=500)
+        self._ttfts = deque(maxlen=500)
+        self._prompt_tokens = deque(maxlen=500)
+        self._metrics = {
+            "requests_total": 0,
+            "errors_total": 0,
+            "timeouts_total": 0,
+            "in_flight": 0,
+            "streams_total": 0,
+            "retries_total": 0,
+            "hedges_total": 0,
+            "hedges_skipped_total": 0,
+            "hedge_wins_total": 0,
+            "deadline_exceeded_total": 0,
+            "prompt_tokens_total": 0,
+            "completion_tokens_total": 0,
+        }
+
+    @property
+    def completions_url(self) -> str:
+        return f"{self.base_url}/v1/chat/completions"
+
+    def _call_timeout(self) -> float:
+        """이번 호출에 쓸 타임아웃 - 정책 타임아웃과 남은 요청 예산 중 작은 값"""
+        budget = deadline.remaining()
+        if budget is None:
+            return self.timeout_seconds
+        if budget <= 0:
+            self._metrics["deadline_exceeded_total"] += 1
+            raise LLMDeadlineExceeded("요청 예산이 소진되어 LLM을 호출하지 않습니다")
+        return min(self.timeout_seconds, budget)
+
+    @staticmethod
+    def _deadline_bound(timeout: float) -> bool:
+        """이번 타임아웃이 남은 요청 예산으로 잘렸는지 - 이 경우 만료는 replica 장애가 아님"""
+        budget = deadline.remaining()
+        return budget is not None and budget <= timeout
+
+    def _deadline_timeout(self, timeout: float) -> "LLMDeadlineExceeded":
+        self._metrics["deadline_exceeded_total"] += 1
+        logger.warning(f"요청 예산 소진으로 vLLM 호출 중단 ({timeout:.2f}s)")
+        return LLMDeadlineExceeded(f"요청 예산이 소진되어 LLM 호출을 중단했습니다: {timeout:.2f}s")
+
+    def _hedge_delay(self) -> float:
+        """최근 지연 p95 이후 헤징 (표본이 적으면 기본값)"""
+        if len(self._latencies) < VLLM_HEDGE_MIN_SAMPLES:
+            return VLLM_HEDGE_DELAY
+        p95 = _percentile(sorted(self._latencies), 0.95)
+        return max(VLLM_HEDGE_MIN_DELAY, p95)
+
+    @contextmanager
+    def _breaker_guard(self):
+        """
+        서킷 브레이커 판정
+        - 연결 오류/타임아웃/5xx(재시도 가능 오류)만 실패로 집계
+        - 4xx/파싱 오류는 서버가 응답한 것이므로 성공으로 집계
+        """
+        if not self.breaker.allow():
+            retry_after = self.breaker.retry_after()
+            raise LLMCircuitOpenError(f"vLLM 서킷 open - {retry_after:.0f}초 후 재시도")
+        try:
+            yield
+        except LLMDeadlineExceeded:
+            self.breaker.release()
+            raise
+        except LLMGatewayError as e:
+            if e.retryable:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        else:
+            self.breaker.record_success()
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """FastAPI 이벤트 루프 등록 (동기 호출을 이 루프로 위임하기 위함)"""
+        self._loop = loop
+
+    def build_payload(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 1024,
+        temperature: float = 0.3,
+        **params,
+    ) -> Dict[str, Any]:
+        payload = {
+            "model": self.model_name,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        payload.update(params)
+        return payload
+
+    async def chat(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 1024,
+        temperature: float = 0.3,
+        priority: int = PRIORITY_DEFAULT,
+        **params,
+    ) -> str:
+        """
+        비동기 chat completion 호출 - 응답 텍스트 반환
+        - 대기열 초과 시 LLMOverloadedError (호출 측에서 503으로 변환)
+        - 서킷 open 시 대기 없이 LLMCircuitOpenError
+        - 동일 프롬프트/파라미터의 동시 호출은 하나의 upstream 요청을 공유
+        """
+        payload = self.build_payload(messages, max_tokens, temperature, **params)
+
+        async def call() -> str:
+            with self._breaker_guard():
+                async with self.admission.slot(priority):
+                    return await self._request(get_vllm_session(), payload)
+
+        if self.single_flight is None:
+            return await call()
+        return await self.single_flight.do(coalesce_key(payload), call)
+
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 1024,
+        temperature: float = 0.3,
+        priority: int = PRIORITY_DEFAULT,
+        **params,
+    ) -> AsyncIterator[str]:
+        """
+        스트리밍 chat completion - vLLM의 stream 델타 텍스트를 순서대로 yield
+        - 스트림이 끝날 때까지 입장 슬롯을 점유
+        """
+        payload = self.build_payload(
+            messages,
+            max_tokens,
+            temperature,
+            stream=True,
+            stream_options={"include_usage": True},
+            **params,
+        )
+        with self._breaker_guard():
+            async with self.admission.slot(priority):
+                stream = self._post_stream(
+                    get_vllm_session(), payload, self.replicas.pick(), self._call_timeout()
+                )
+                async for delta in stream:
+                    yield delta
+
+    def chat_sync(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 1024,
+        temperature: float = 0.3,
+        priority: int = PRIORITY_DEFAULT,
+        **params,
+    ) -> str:
+        """
+        동기 호출 (스케줄러 스레드, 배치 스크립트용)
+        - 서버 루프가 떠 있으면 해당 루프의 풀/동시성 제한을 그대로 사용
+        - 단독 실행 시에는 임시 세션으로 호출
+        - 서버 루프 스레드 안에서는 호출 불가 (루프가 막혀 응답을 받을 수 없음) → await chat() 사용
+        """
+        coro_kwargs = dict(max_tokens=max_tokens, temperature=temperature, **params)
+
+        if self._loop is not None and self._loop.is_running():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is self._loop:
+                raise RuntimeError(
+                    "chat_sync()는 게이트웨이 이벤트 루프 안에서 호출할 수 없습니다 - await chat()을 사용하세요"
+                )
+            future = asyncio.run_coroutine_threadsafe(
+                self.chat(messages, priority=priority, **coro_kwargs), self._loop
+            )
+            try:
+                return future.result(timeout=self.timeout_seconds)
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                raise
+
+        return asyncio.run(self._chat_standalone(messages, **coro_kwargs))
+
+    async def _chat_standalone(
+        self, messages: List[Dict[str, str]], **kwargs
+    ) -> str:
+        payload = self.build_payload(messages, **kwargs)
+        async with aiohttp.ClientSession(
+            headers={"Content-Type": "application/json"}
+        ) as session:
+            with self._breaker_guard():
+                return await self._request(session, payload)
+
+    async def _request(
+        self, session: aiohttp.ClientSession, payload: Dict[str, Any]
+    ) -> str:
+        """예산 안에서 재시도 (지터 포함 지수 백오프, 가능하면 직전에 실패한 replica 회피)"""
+        attempt = 0
+        tried: List[Replica] = []
+        while True:
+            timeout = self._call_timeout()
+            try:
+                return await self._attempt(session, payload, timeout, tried)
+            except LLMGatewayError as e:
+                if not e.retryable or attempt >= VLLM_MAX_RETRIES:
+                    raise
+
+                backoff = min(VLLM_RETRY_MAX_DELAY, VLLM_RETRY_BASE_DELAY * (2 ** attempt))
+                backoff *= random.uniform(0.5, 1.5)
+                budget = deadline.remaining()
+                if budget is not None and budget <= backoff:
+                    raise
+
+                attempt += 1
+                self._metrics["retries_total"] += 1
+                logger.warning(f"vLLM 재시도 {attempt}/{VLLM_MAX_RETRIES} ({backoff:.2f}s 후): {e}")
+                await asyncio.sleep(backoff)
+
+    async def _attempt(
+        self,
+        session: aiohttp.ClientSession,
+        payload: Dict[str, Any],
+        timeout: float,
+        tried: List[Replica],
+    ) -> str:
+        primary = self.replicas.pick(exclude=tried)
+        tried.append(primary)
+        if VLLM_HEDGE and len(self.replicas.available()) > 1:
+            return await self._hedged_post(session, payload, primary, timeout)
+        with self.replicas.track(primary):
+            return await self._post(session, payload, primary, timeout)
+
+    def _spawn(
+        self,
+        session: aiohttp.ClientSession,
+        payload: Dict[str, Any],
+        replica: Replica,
+        timeout: float,
+    ) -> asyncio.Future:
+        """
+        진행 중 카운트를 먼저 올린 뒤 요청 태스크 생성
+        - 동시에 라우팅되는 요청이 태스크 시작 전 같은 replica로 몰리지 않도록
+        """
+        self.replicas.acquire(replica)
+        task = asyncio.ensure_future(self._post(session, payload, replica, timeout))
+        task.add_done_callback(lambda _: self.replicas.release(replica))
+        return task
+
+    async def _hedged_post(
+        self,
+        session: aiohttp.ClientSession,
+        payload: Dict[str, Any],
+        primary: Replica,
+        timeout: float,
+    ) -> str:
+        """
+        기본 replica 응답이 hedge 지연을 넘기면 그 시점에 가장 한가한 다른 replica에도 요청
+        - hedge 요청도 입장 슬롯을 하나 차지하며, 빈 슬롯이 없으면(대기 요청이 있으면) hedge 생략
+        - 먼저 성공한 응답을 채택하고 나머지는 취소
+        """
+        delay = self._hedge_delay()
+        if delay >= timeout:
+            with self.replicas.track(primary):
+                return await self._post(session, payload, primary, timeout)
+
+        tasks = [self._spawn(session, payload, primary, timeout)]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                if self.admission.try_acquire():
+                    self._metrics["hedges_total"] += 1
+                    alternate = self.replicas.pick(exclude=[primary])
+                    hedge = self._spawn(session, payload, alternate, timeout - delay)
+                    hedge.add_done_callback(lambda _: self.admission.release())
+                    tasks.append(hedge)
+                else:
+                    # 이미 슬롯이 모자란 과부하 상황 - 중복 요청으로 부하를 더하지 않음
+                    self._metrics["hedges_skipped_total"] += 1
+
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not tasks[0]:
+                            self._metrics["hedge_wins_total"] += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _post(
+        self,
+        session: aiohttp.ClientSession,
+        payload: Dict[str, Any],
+        replica: Replica,
+        timeout: float,
+    ) -> str:
+        self._metrics["requests_total"] += 1
+        self._metrics["in_flight"] += 1
+        start = time.perf_counter()
+        deadline_bound = self._deadline_bound(timeout)
+
+        try:
+            async with session.post(
+                url=replica.completions_url,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=timeout, sock_connect=VLLM_CONNECT_TIMEOUT),
+            ) as response:
+                if response.status >= 400:
+                    body = await response.text()
+                    self._metrics["errors_total"] += 1
+                    if response.status in _RETRYABLE_STATUS:
+                        replica.record_failure()
+                    logger.error(f"vLLM 오류 응답 {response.status}: {body[:200]}")
+                    raise LLMGatewayError(
+                        f"vLLM HTTP {response.status}: {body[:200]}",
+                        retryable=response.status in _RETRYABLE_STATUS,
+                    )
+                result = await response.json()
+
+            content = result["choices"][0]["message"]["content"].strip()
+            self._record_usage(result.get("usage") or {})
+            latency = time.perf_counter() - start
+            self._latencies.append(latency)
+            replica.record_success(latency)
+            return content
+
+        except asyncio.TimeoutError as e:
+            if deadline_bound:
+                # 요청 예산 만료 - 재시도/replica 실패/서킷 집계 대상이 아님
+                raise self._deadline_timeout(timeout) from e
+            self._metrics["timeouts_total"] += 1
+            self._metrics["errors_total"] += 1
+            replica.record_failure()
+            logger.error(f"vLLM 호출 타임아웃 ({replica.url}, {timeout:.1f}s)")
+            raise LLMGatewayError(f"vLLM 호출 타임아웃: {timeout:.1f}s", retryable=True) from e
+        except aiohttp.ClientError as e:
+            self._metrics["errors_total"] += 1
+            replica.record_failure()
+            logger.error(f"vLLM 호출 실패 ({replica.url}): {e}")
+            raise LLMGatewayError(str(e), retryable=True) from e
+        except (KeyError, IndexError, ValueError) as e:
+            self._metrics["errors_total"] += 1
+            logger.error(f"vLLM 응답 파싱 실패: {e}")
+            raise LLMGatewayError(f"vLLM 응답 형식 오류: {e}") from e
+        finally:
+            self._metrics["in_flight"] -= 1
+
+    async def _post_stream(
+        self,
+        session: aiohttp.ClientSession,
+        payload: Dict[str, Any],
+        replica: Replica,
+        timeout: float,
+    ) -> AsyncIterator[str]:
+        self._metrics["requests_total"] += 1
+        self._metrics["streams_total"] += 1
+        self._metrics["in_flight"] += 1
+        self.replicas.acquire(replica)
+        start = time.perf_counter()
+        first_token = True
+        deadline_bound = self._deadline_bound(timeout)
+
+        try:
+            async with session.post(
+                url=replica.completions_url,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=timeout, sock_connect=VLLM_CONNECT_TIMEOUT),
+            ) as response:
+                if response.status >= 400:
+                    # _post와 동일 기준: 4xx(잘못된 요청, 프롬프트 길이 초과 등)는 replica 장애로 보지 않고 재시도하지 않음
+                    body = await response.text()
+                    self._metrics["errors_total"] += 1
+                    if response.status in _RETRYABLE_STATUS:
+                        replica.record_failure()
+                    logger.error(f"vLLM 스트리밍 오류 응답 {response.status}: {body[:200]}")
+                    raise LLMGatewayError(
+                        f"vLLM HTTP {response.status}: {body[:200]}",
+                        retryable=response.status in _RETRYABLE_STATUS,
+                    )
+
+                # SSE 라인 단위 파싱: "data: {...}" / "data: [DONE]"
+                async for raw_line in response.content:
+                    line = raw_line.decode("utf-8").strip()
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+
+                    chunk = json.loads(data)
+                    if chunk.get("usage"):
+                        self._record_usage(chunk["usage"])
+                    choices = chunk.get("choices") or []
+                    if not choices:
+                        continue
+                    delta = (choices[0].get("delta") or {}).get("content")
+                    if not delta:
+                        continue
+
+                    if first_token:
+                        self._ttfts.append(time.perf_counter() - start)
+                        first_token = False
+                    yield delta
+
+            latency = time.perf_counter() - start
+            self._latencies.append(latency)
+            replica.record_success(latency)
+
+        except asyncio.TimeoutError as e:
+            if deadline_bound:
+                raise self._deadline_timeout(timeout) from e
+            self._metrics["timeouts_total"] += 1
+            self._metrics["errors_total"] += 1
+            replica.record_failure()
+            logger.error(f"vLLM 스트리밍 타임아웃 ({replica.url}, {timeout:.1f}s)")
+            raise LLMGatewayError(f"vLLM 호출 타임아웃: {timeout:.1f}s", retryable=True) from e
+        except aiohttp.ClientError as e:
+            self._metrics["errors_total"] += 1
+            replica.record_failure()
+            logger.error(f"vLLM 스트리밍 실패 ({replica.url}): {e}")
+            raise LLMGatewayError(str(e), retryable=True) from e
+        except (KeyError, IndexError, ValueError) as e:
+            self._metrics["errors_total"] += 1
+            logger.error(f"vLLM 스트리밍 응답 파싱 실패: {e}")
+            raise LLMGatewayError(str(e)) from e
+        finally:
+            self._metrics["in_flight"] -= 1
+            self.replicas.release(replica)
+
+    def _record_usage(self, usage: Dict[str, Any]) -> None:
+        prompt_tokens = usage.get("prompt_tokens", 0) or 0
+        completion_tokens = usage.get("completion_tokens", 0) or 0
+        self._metrics["prompt_tokens_total"] += prompt_tokens
+        self._metrics["completion_tokens_total"] += completion_tokens
+        if prompt_tokens:
+            self._prompt_tokens.append(prompt_tokens)
+        logger.info(f"vLLM 토큰 사용 - prompt={prompt_tokens}, completion={completion_tokens}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """메트릭 스냅샷 반환"""
+        latencies = sorted(self._latencies)
+        metrics = dict(self._metrics)
+        metrics["max_concurrency"] = self.max_concurrency
+        metrics["replicas"] = self.replicas.get_metrics()
+        metrics["latency_p50"] = _percentile(latencies, 0.50)
+        metrics["latency_p95"] = _percentile(latencies, 0.95)
+        ttfts = sorted(self._ttfts)
+        metrics["ttft_p50"] = _percentile(ttfts, 0.50)
+        metrics["ttft_p95"] = _percentile(ttfts, 0.95)
+        prompt_tokens = sorted(self._prompt_tokens)
+        metrics["prompt_tokens_p50"] = _percentile(prompt_tokens, 0.50)
+        metrics["prompt_tokens_p95"] = _percentile(prompt_tokens, 0.95)
+        metrics["admission"] = self.admission.get_metrics()
+        metrics["circuit_breaker"] = self.breaker.get_metrics()
+        metrics["single_flight"] = (
+            self.single_flight.get_metrics() if self.single_flight is not None else None
+        )
+        return metrics
+
+
+def _percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return round(sorted_values[index], 4)
+
+
+# 전역 게이트웨이 (앱 전체에서 공유)
+_gateway: Optional[VLLMGateway] = None
+
+
+def get_gateway() -> VLLMGateway:
+    """전역 vLLM 게이트웨이 반환"""
+    global _gateway
+    if _gateway is None:
+        _gateway = VLLMGateway()
+    return _gateway
@@ -0,0 +1,124 @@
+"""
+PDF 파싱 벤치마크 - 검증+추출 단일 open vs 기존 2회 파싱(PyPDF2 검증 후 fitz 추출)
+
+이력서 PDF 묶음을 각 방식으로 처리해 문서당 처리 시간과 Python 힙 최대 사용량(tracemalloc)을 비교합니다.
+디렉토리를 주지 않으면 페이지 수가 다른 합성 이력서를 만들어 사용합니다.
+기존 방식 비교에는 PyPDF2가 필요합니다 (requirements에서 제외됨: pip install PyPDF2).
+
+실행 (fastapi_project 디렉토리에서):
+    python -m scripts.bench_pdf_parse data/resumes --repeat 5
+    python -m scripts.bench_pdf_parse --synthetic 20
+"""
+import io
+import os
+import time
+import argparse
+import tracemalloc
+from typing import Callable, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+from app.utils.pdf_parser import _extract_lines, extract_text_with_formatting
+
+_LINES = [
+    "백엔드 개발자 인턴 - 주문 API 응답 시간 40% 개선",
+    "Spring Boot, MySQL, Redis 기반 예약 서비스 설계 및 배포",
+    "정보처리기사 / SQLD 자격증 취득",
+    "쿠버네티스 환경에서 모니터링 대시보드 구축 프로젝트",
+    "컴퓨터공학과 졸업, 알고리즘 스터디 운영",
+]
+
+
+def synthetic_resumes(count: int) -> List[bytes]:
+    """1~count%5+1 페이지짜리 합성 이력서 (한 페이지에 40줄)"""
+    resumes = []
+    for i in range(count):
+        doc = fitz.open()
+        for p in range(i % 5 + 1):
+            page = doc.new_page()
+            page.insert_text((50, 50), f"Resume {i} page {p}", fontname="hebo", fontsize=16)
+            for j in range(40):
+                page.insert_text((50, 80 + j * 18), f"{j}. {_LINES[j % len(_LINES)]}", fontname="helv")
+        resumes.append(doc.tobytes())
+        doc.close()
+    return resumes
+
+
+def load_resumes(directory: str) -> List[bytes]:
+    resumes = []
+    for name in sorted(os.listdir(directory)):
+        if name.lower().endswith(".pdf"):
+            with open(os.path.join(directory, name), "rb") as f:
+                resumes.append(f.read())
+    return resumes
+
+
+def legacy_parse(pdf_bytes: bytes) -> str:
+    """변경 전: PyPDF2로 전체 파싱해 페이지 수 확인 후 fitz로 다시 열어 추출"""
+    from PyPDF2 import PdfReader
+
+    if len(PdfReader(io.BytesIO(pdf_bytes)).pages) == 0:
+        raise ValueError("invalid_file_type")
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    return _extract_lines(doc)
+
+
+def measure(fn: Callable[[bytes], str], resumes: List[bytes], repeat: int) -> Tuple[float, float]:
+    """(문서당 평균 ms, 문서당 최대 Python 힙 KB)"""
+    for pdf_bytes in resumes:  # 워밍업
+        fn(pdf_bytes)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for pdf_bytes in resumes:
+            fn(pdf_bytes)
+    avg_ms = (time.perf_counter() - start) / (repeat * len(resumes)) * 1000
+
+    peak = 0
+    for pdf_bytes in resumes:
+        tracemalloc.start()
+        fn(pdf_bytes)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return avg_ms, peak / 1024
+
+
+def _legacy_available() -> bool:
+    try:
+        import PyPDF2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="PDF 단일 open 파싱 벤치마크")
+    parser.add_argument("directory", nargs="?", help="이력서 PDF 디렉토리 (없으면 합성 이력서)")
+    parser.add_argument("--synthetic", type=int, default=20, help="합성 이력서 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    resumes = load_resumes(args.directory) if args.directory else synthetic_resumes(args.synthetic)
+    if not resumes:
+        print("PDF 파일이 없습니다.")
+        return
+    pages = sum(fitz.open(stream=b, filetype="pdf").page_count for b in resumes)
+    print(f"📄 이력서 {len(resumes)}개, 총 {pages}페이지, 반복 {args.repeat}회")
+
+    results = {"single_open": measure(extract_text_with_formatting, resumes, args.repeat)}
+    if _legacy_available():
+        results["legacy (PyPDF2 + fitz)"] = measure(legacy_parse, resumes, args.repeat)
+    else:
+        print("⚠️ PyPDF2가 설치되어 있지 않아 기존 방식 비교는 건너뜁니다.")
+
+    print(f"{'mode':<24}{'ms/doc':>10}{'peak_heap_kb':>14}")
+    for mode, (avg_ms, peak_kb) in results.items():
+        print(f"{mode:<24}{avg_ms:>10.2f}{peak_kb:>14.1f}")
+
+    if len(results) == 2:
+        (new_ms, new_kb), (old_ms, old_kb) = results.values()
+        print(f"⏱️ 절감: {old_ms - new_ms:.2f} ms/doc ({1 - new_ms / old_ms:.1%}), 힙 {old_kb - new_kb:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+프롬프트 배치(prefix/suffix) 벤치마크 - prefill 시간(TTFT)과 prefix cache 적중률 측정
+
+호출 경로별로 요청마다 내용이 다른 프롬프트를 N개 만들어 보내고,
+  - TTFT (max_tokens=1 스트리밍의 첫 토큰까지 시간 ≈ prefill 시간)
+  - 서버 /metrics 의 prefix cache 적중률 (vllm:prefix_cache_hits_total / queries_total)
+  - 연속 요청 간 공통 prefix 비율 (서버와 무관한 프롬프트 배치 지표)
+를 출력합니다. --legacy 를 주면 변경 전 배치(가변 데이터가 고정 지시문보다 앞)도 함께 측정합니다.
+
+실행 (fastapi_project 디렉토리에서):
+    python -m scripts.vllm_stub --port 8001 --delay 0 --prefill-ms-per-kchar 200
+    python -m scripts.bench_prefix_cache --url http://localhost:8001 --requests 30 --legacy
+"""
+import os
+import time
+import random
+import asyncio
+import argparse
+from typing import Callable, Dict, List, Optional
+
+import aiohttp
+
+from app.services.feedback_service import (
+    FEEDBACK_INSTRUCTIONS,
+    FEEDBACK_SYSTEM_PROMPT,
+    build_feedback_messages,
+)
+from app.services.llm_handler import EXTRACT_SYSTEM_PROMPT, build_extract_messages, parser
+
+_WORDS = [
+    "백엔드", "프로젝트", "데이터베이스", "트랜잭션", "인덱스", "캐시", "스프링", "파이썬",
+    "배포", "장애", "성능", "개선", "쿠버네티스", "모니터링", "API", "설계", "테스트", "리팩토링",
+]
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(6, 14))) + "했습니다."
+
+
+def _text(rng: random.Random, sentences: int) -> str:
+    return " ".join(_sentence(rng) for _ in range(sentences))
+
+
+def _legacy_extract(rng: random.Random) -> List[Dict[str, str]]:
+    # 변경 전: 이력서 텍스트 뒤에 format_instructions 시스템 메시지
+    return [
+        {"role": "system", "content": EXTRACT_SYSTEM_PROMPT},
+        {"role": "user", "content": _text(rng, 30)},
+        {"role": "system", "content": parser.get_format_instructions()},
+    ]
+
+
+def _legacy_feedback(rng: random.Random) -> List[Dict[str, str]]:
+    # 변경 전: 질문/답변 뒤에 평가 기준 지시문
+    user = f"[질문]\n{_sentence(rng)}\n[답변]\n{_text(rng, 5)}\n{FEEDBACK_INSTRUCTIONS}피드백:"
+    return [
+        {"role": "system", "content": FEEDBACK_SYSTEM_PROMPT},
+        {"role": "user", "content": user},
+    ]
+
+
+SCENARIOS: Dict[str, Callable[[random.Random], List[Dict[str, str]]]] = {
+    "resume_extract": lambda rng: build_extract_messages(_text(rng, 30), guided=False),
+    "resume_extract_guided": lambda rng: build_extract_messages(_text(rng, 30), guided=True),
+    "feedback": lambda rng: build_feedback_messages(_sentence(rng), _text(rng, 5)),
+}
+LEGACY_SCENARIOS = {
+    "resume_extract (legacy)": _legacy_extract,
+    "feedback (legacy)": _legacy_feedback,
+}
+
+
+def _serialize(messages: List[Dict[str, str]]) -> str:
+    return "".join(f"<{m['role']}>{m['content']}" for m in messages)
+
+
+def shared_prefix_ratio(prompts: List[List[Dict[str, str]]]) -> float:
+    """연속 요청 쌍의 공통 prefix 길이 / 프롬프트 길이 평균"""
+    ratios = []
+    for prev, cur in zip(prompts, prompts[1:]):
+        a, b = _serialize(prev), _serialize(cur)
+        common = len(os.path.commonprefix([a, b]))
+        ratios.append(common / max(1, len(b)))
+    return sum(ratios) / len(ratios) if ratios else 0.0
+
+
+async def read_prefix_counters(session: aiohttp.ClientSession, url: str) -> Optional[tuple]:
+    try:
+        async with session.get(f"{url}/metrics") as response:
+            text = await response.text()
+    except aiohttp.ClientError:
+        return None
+    values = {}
+    for line in text.splitlines():
+        for name in ("vllm:prefix_cache_hits_total", "vllm:prefix_cache_queries_total"):
+            if line.startswith(name):
+                values[name] = values.get(name, 0.0) + float(line.rsplit(" ", 1)[-1])
+    if len(values) < 2:
+        return None
+    return values["vllm:prefix_cache_hits_total"], values["vllm:prefix_cache_queries_total"]
+
+
+async def measure_ttft(
+    session: aiohttp.ClientSession, url: str, model: str, messages: List[Dict[str, str]]
+) -> float:
+    payload = {"model": model, "messages": messages, "max_tokens": 1, "stream": True}
+    start = time.perf_counter()
+    async with session.post(f"{url}/v1/chat/completions", json=payload) as response:
+        response.raise_for_status()
+        async for raw_line in response.content:
+            if raw_line.startswith(b"data:"):
+                return time.perf_counter() - start
+    return time.perf_counter() - start
+
+
+async def run(url: str, model: str, requests: int, legacy: bool, seed: int):
+    scenarios = dict(SCENARIOS)
+    if legacy:
+        scenarios.update(LEGACY_SCENARIOS)
+
+    async with aiohttp.ClientSession() as session:
+        print(f"{'scenario':<26}{'prefix_share':>14}{'ttft_p50':>10}{'ttft_p95':>10}{'cache_hit':>11}")
+        for name, build in scenarios.items():
+            rng = random.Random(seed)
+            prompts = [build(rng) for _ in range(requests)]
+
+            before = await read_prefix_counters(session, url)
+            ttfts = sorted([await measure_ttft(session, url, model, p) for p in prompts])
+            after = await read_prefix_counters(session, url)
+
+            hit_rate = "-"
+            if before and after and after[1] > before[1]:
+                hit_rate = f"{(after[0] - before[0]) / (after[1] - before[1]):.2%}"
+
+            p50 = ttfts[len(ttfts) // 2]
+            p95 = ttfts[min(len(ttfts) - 1, int(0.95 * len(ttfts)))]
+            print(
+                f"{name:<26}{shared_prefix_ratio(prompts):>14.2%}"
+                f"{p50 * 1000:>9.1f}ms{p95 * 1000:>8.1f}ms{hit_rate:>11}"
+            )
+
+
+def main():
+    parser_ = argparse.ArgumentParser(description="prefix cache 친화 프롬프트 배치 벤치마크")
+    parser_.add_argument("--url", default=os.getenv("VLLM_URL", "http://localhost:8001"))
+    parser_.add_argument("--model", default=os.getenv("MODEL_NAME", "/mnt/ssd/aya-expanse-8b"))
+    parser_.add_argument("--requests", type=int, default=30, help="시나리오별 요청 수")
+    parser_.add_argument("--legacy", action="store_true", help="변경 전 배치도 함께 측정")
+    parser_.add_argument("--seed", type=int, default=42)
+    args = parser_.parse_args()
+
+    asyncio.run(run(args.url.rstrip("/"), args.model, args.requests, args.legacy, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+에이전트 노드 LLM 우선순위 점검 - 클라이언트에 지정한 대기열 우선순위가 gateway.chat까지 전달되는지 확인
+
+노드 생성 시 클라이언트를 다시 감싸면서 우선순위가 기본값으로 바뀌면 에이전트 요청이
+일반 요청과 같은 대기열에서 기다리고, 세션 모드 추측 호출은 batch가 아니라 일반 요청과 경쟁하게 됩니다.
+vLLM 호출은 가로채서 우선순위만 기록하므로 서버가 필요 없습니다.
+
+실행 (fastapi_project 디렉토리에서):
+    LLM_TYPE=vllm python -m scripts.check_llm_priority
+"""
+import sys
+import asyncio
+
+from app.agents.nodes.create_resume import CreateResumeNode
+from app.agents.nodes.generate_question import GenerateQuestionNode
+from app.agents.speculation import SpeculationManager
+from app.utils.llm_admission import PRIORITY_BATCH, PRIORITY_INTERACTIVE, PRIORITY_NAMES
+from app.utils.llm_client import ChatLLM, create_llm_client
+from app.utils.vllm_gateway import get_gateway
+
+
+async def observed_priority(node) -> int:
+    """노드의 LLM 호출이 gateway.chat에 넘긴 우선순위"""
+    gateway = get_gateway()
+    seen = []
+    original = gateway.chat
+
+    async def record(messages, max_tokens=1024, temperature=0.3, priority=None, **params):
+        seen.append(priority)
+        return "- Q: 점검"
+
+    gateway.chat = record
+    try:
+        await node._safe_llm_call("점검", "점검")
+    finally:
+        gateway.chat = original
+    return seen[0] if seen else None
+
+
+def cases():
+    for priority in (PRIORITY_INTERACTIVE, PRIORITY_BATCH):
+        yield f"GenerateQuestionNode(LLMClient {PRIORITY_NAMES[priority]})", GenerateQuestionNode(
+            create_llm_client(priority=priority)
+        ), priority
+        yield f"CreateResumeNode(LLMClient {PRIORITY_NAMES[priority]})", CreateResumeNode(
+            create_llm_client(priority=priority)
+        ), priority
+        yield f"GenerateQuestionNode(ChatLLM {PRIORITY_NAMES[priority]})", GenerateQuestionNode(
+            ChatLLM(priority=priority)
+        ), priority
+    # 세션 모드 추측 질문 생성은 실제 사용자 요청을 밀어내지 않도록 batch 우선순위여야 함
+    yield "SpeculationManager.question_node", SpeculationManager().question_node, PRIORITY_BATCH
+
+
+async def run() -> bool:
+    ok = True
+    for name, node, expected in cases():
+        actual = await observed_priority(node)
+        passed = actual == expected
+        ok &= passed
+        print(f"{'✅' if passed else '❌'} {name}: expected={expected}, gateway.chat={actual}")
+    return ok
+
+
+def main():
+    if create_llm_client().llm_type != "vllm":
+        print("❌ LLM_TYPE=vllm 에서 실행해주세요 (OpenAI 경로는 대기열 우선순위를 쓰지 않음)")
+        sys.exit(1)
+    sys.exit(0 if asyncio.run(run()) else 1)
+
+
+if __name__ == "__main__":
+    main()
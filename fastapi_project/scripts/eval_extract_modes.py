@@ -0,0 +1,72 @@
+"""
+이력서 추출 출력 모드 비교 (format_instructions vs guided_json)
+
+같은 이력서 묶음을 두 모드로 추출해 파싱 실패율 / 재시도율 / fallback 수 / 평균 응답 시간을 비교합니다.
+입력 디렉토리의 .pdf(텍스트 추출 후 사용) 또는 .txt 파일을 읽습니다.
+
+실행 (fastapi_project 디렉토리에서, VLLM_URL이 가리키는 서버 사용):
+    python -m scripts.eval_extract_modes data/resumes
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+from app.services.llm_handler import extract_info_from_resume, get_extract_metrics
+from app.utils.http_pool import close_http_pool
+from app.utils.pdf_parser import extract_text_with_formatting
+
+
+def load_resumes(directory: str):
+    texts = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if name.lower().endswith(".pdf"):
+            with open(path, "rb") as f:
+                texts.append(extract_text_with_formatting(f.read()))
+        elif name.lower().endswith(".txt"):
+            with open(path, "r", encoding="utf-8") as f:
+                texts.append(f.read())
+    return texts
+
+
+async def run(texts, repeat: int):
+    elapsed = {}
+    for guided in (False, True):
+        mode = "guided" if guided else "format_instructions"
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for text in texts:
+                await extract_info_from_resume(text, guided=guided)
+        elapsed[mode] = (time.perf_counter() - start) / max(1, len(texts) * repeat)
+    await close_http_pool()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이력서 추출 모드별 파싱 실패율 비교")
+    parser.add_argument("directory", help=".pdf / .txt 이력서 디렉토리")
+    parser.add_argument("--repeat", type=int, default=1, help="이력서당 반복 횟수")
+    args = parser.parse_args()
+
+    texts = load_resumes(args.directory)
+    if not texts:
+        print("❌ 이력서 파일이 없습니다.")
+        sys.exit(1)
+
+    elapsed = asyncio.run(run(texts, args.repeat))
+    metrics = get_extract_metrics()
+
+    print(f"\n📊 이력서 {len(texts)}건 x {args.repeat}회")
+    print(f"{'mode':<22}{'parse_fail':>12}{'retry':>10}{'fallback':>10}{'avg_sec':>10}")
+    for mode in ("format_instructions", "guided"):
+        m = metrics[mode]
+        print(
+            f"{mode:<22}{m['parse_failure_rate'] or 0:>12.2%}{m['retry_rate'] or 0:>10.2%}"
+            f"{m['fallbacks']:>10}{elapsed[mode]:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
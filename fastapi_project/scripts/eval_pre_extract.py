@@ -0,0 +1,87 @@
+"""
+규칙 기반 사전 추출 비교 - 전체 텍스트 프롬프트 vs 섹션 축소 프롬프트
+
+이력서마다 두 방식의 프롬프트 토큰 수를 계산하고, 규칙으로 확정한 필드를 보여줍니다.
+--llm 을 주면 실제로 두 방식 모두 추출을 호출해 평균 응답 시간과 필드 일치율도 비교합니다.
+입력 디렉토리의 .pdf(텍스트 추출 후 사용) 또는 .txt 파일을 읽습니다.
+
+실행 (fastapi_project 디렉토리에서, --llm 은 VLLM_URL이 가리키는 서버 사용):
+    python -m scripts.eval_pre_extract data/resumes
+    python -m scripts.eval_pre_extract data/resumes --llm
+"""
+import sys
+import time
+import asyncio
+import argparse
+
+from app.services.llm_handler import (
+    RESUME_EXTRACT_GUIDED,
+    build_extract_messages,
+    extract_info_from_resume,
+)
+from app.services.resume_pre_extract import FIELD_SECTIONS, get_metrics, pre_extract
+from app.utils.http_pool import close_http_pool
+from app.utils.token_budget import count_message_tokens
+from scripts.eval_extract_modes import load_resumes
+
+
+def prompt_tokens(text: str) -> int:
+    return count_message_tokens(build_extract_messages(text, RESUME_EXTRACT_GUIDED))
+
+
+async def compare_llm(cases):
+    """(전체 평균 초, 축소 평균 초, 필드 일치율)"""
+    full_elapsed = reduced_elapsed = 0.0
+    agree = total = 0
+    for text, ruled, llm_text in cases:
+        start = time.perf_counter()
+        full = await extract_info_from_resume(text)
+        full_elapsed += time.perf_counter() - start
+
+        start = time.perf_counter()
+        reduced = await extract_info_from_resume(llm_text)
+        reduced.update(ruled)
+        reduced_elapsed += time.perf_counter() - start
+
+        for field in FIELD_SECTIONS:
+            total += 1
+            agree += full.get(field) == reduced.get(field)
+    await close_http_pool()
+    n = max(1, len(cases))
+    return full_elapsed / n, reduced_elapsed / n, agree / max(1, total)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="규칙 기반 사전 추출 프롬프트 비교")
+    parser.add_argument("directory", help=".pdf / .txt 이력서 디렉토리")
+    parser.add_argument("--llm", action="store_true", help="실제 LLM 호출로 응답 시간/일치율 비교")
+    args = parser.parse_args()
+
+    texts = load_resumes(args.directory)
+    if not texts:
+        print("❌ 이력서 파일이 없습니다.")
+        sys.exit(1)
+
+    cases = []
+    full_tokens = reduced_tokens = 0
+    print(f"{'#':>3}{'full_tok':>10}{'reduced_tok':>13}  ruled_fields")
+    for i, text in enumerate(texts):
+        ruled, llm_text = pre_extract(text)
+        full, reduced = prompt_tokens(text), prompt_tokens(llm_text)
+        full_tokens += full
+        reduced_tokens += reduced
+        cases.append((text, ruled, llm_text))
+        print(f"{i:>3}{full:>10}{reduced:>13}  {ruled}")
+
+    metrics = get_metrics()
+    print(f"\n📊 이력서 {len(texts)}건 - 축소 {metrics['reduced']}건, 전체 텍스트 {metrics['full_text_fallbacks']}건")
+    print(f"프롬프트 토큰 합계: {full_tokens} → {reduced_tokens} ({1 - reduced_tokens / max(1, full_tokens):.1%} 감소)")
+    print(f"규칙 확정 필드: {metrics['fields']}")
+
+    if args.llm:
+        full_sec, reduced_sec, agreement = asyncio.run(compare_llm(cases))
+        print(f"평균 응답 시간: {full_sec:.2f}s → {reduced_sec:.2f}s, 필드 일치율 {agreement:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+피드백 시맨틱 캐시 임계값 오프라인 평가
+
+입력: JSONL (한 줄에 한 쌍)
+    {"question": "...", "answer_a": "...", "answer_b": "...", "label": true}
+    label = 두 답변에 같은 피드백을 재사용해도 되는지 (사람 판정)
+
+FEEDBACK_SEMANTIC_HIT_LOG로 쌓인 적중 로그({"answer", "matched_answer", ...})에
+label을 달아 그대로 입력으로 쓸 수도 있습니다.
+
+실행 (fastapi_project 디렉토리에서):
+    python -m scripts.eval_semantic_cache data/semantic_pairs.jsonl
+"""
+import sys
+import json
+import asyncio
+import argparse
+
+from app.utils.semantic_cache import SemanticFeedbackCache, evaluate_threshold_precision
+
+
+def load_pairs(path: str):
+    pairs = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            answer_a = record.get("answer_a", record.get("answer"))
+            answer_b = record.get("answer_b", record.get("matched_answer"))
+            pairs.append((answer_a, answer_b, bool(record["label"])))
+    return pairs
+
+
+async def score_pairs(pairs):
+    cache = SemanticFeedbackCache()
+    scored = []
+    for answer_a, answer_b, label in pairs:
+        vec_a = await cache.embed(answer_a)
+        vec_b = await cache.embed(answer_b)
+        scored.append((float(vec_a @ vec_b), label))
+    return scored
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시맨틱 캐시 임계값별 precision/recall 평가")
+    parser.add_argument("pairs_path", help="라벨링된 답변 쌍 JSONL 경로")
+    parser.add_argument(
+        "--thresholds",
+        default="0.80,0.85,0.88,0.90,0.92,0.94,0.96",
+        help="쉼표로 구분한 임계값 목록",
+    )
+    args = parser.parse_args()
+
+    pairs = load_pairs(args.pairs_path)
+    if not pairs:
+        print("❌ 평가할 쌍이 없습니다.")
+        sys.exit(1)
+
+    scored = asyncio.run(score_pairs(pairs))
+    thresholds = [float(t) for t in args.thresholds.split(",")]
+
+    print(f"📊 총 {len(scored)}쌍 (positive {sum(1 for _, l in scored if l)}쌍)")
+    print(f"{'threshold':>10} {'hit_ratio':>10} {'precision':>10} {'recall':>10}")
+    for row in evaluate_threshold_precision(scored, thresholds):
+        print(
+            f"{row['threshold']:>10.2f} {str(row['hit_ratio']):>10} "
+            f"{str(row['precision']):>10} {str(row['recall']):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+이력서 일괄 추출 (오프라인) - /resume/extract/batch 와 같은 파이프라인을 서버 없이 실행
+
+다운로드(또는 로컬 파일 읽기) → 프로세스 풀 파싱 → LLM 추론을 단계별 동시 실행 수 안에서 겹쳐 처리하고
+끝나는 순서대로 NDJSON 한 줄씩 출력합니다. 마지막에 상태별 건수를 stderr로 출력합니다.
+
+입력: PDF 디렉토리, 또는 URL/파일 경로를 한 줄에 하나씩 적은 목록 파일
+
+실행 (fastapi_project 디렉토리에서, VLLM_URL이 가리키는 서버 사용):
+    python -m scripts.extract_resumes_batch data/resumes -o results.ndjson
+    python -m scripts.extract_resumes_batch urls.txt > results.ndjson
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+from collections import Counter
+from contextlib import redirect_stdout
+from typing import List
+
+from app.services.resume_extract_service import extract_resume_batch
+from app.utils.cpu_pool import get_cpu_pool
+from app.utils.file import download_pdf_from_url
+from app.utils.http_pool import init_http_pool, close_http_pool
+
+
+def load_sources(path: str) -> List[str]:
+    if os.path.isdir(path):
+        return [
+            os.path.join(path, name)
+            for name in sorted(os.listdir(path))
+            if name.lower().endswith(".pdf")
+        ]
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+async def load_pdf(source: str) -> bytes:
+    """URL이면 다운로드, 아니면 로컬 파일"""
+    if source.startswith(("http://", "https://")):
+        return await download_pdf_from_url(source)
+
+    def read() -> bytes:
+        with open(source, "rb") as f:
+            return f.read()
+
+    return await asyncio.to_thread(read)
+
+
+async def run(sources: List[str], output) -> Counter:
+    await init_http_pool()
+    get_cpu_pool().start()
+    statuses: Counter = Counter()
+    try:
+        async for item in extract_resume_batch(sources, loader=load_pdf):
+            statuses[item["status"]] += 1
+            output.write(json.dumps(item, ensure_ascii=False) + "\n")
+            output.flush()
+    finally:
+        get_cpu_pool().shutdown()
+        await close_http_pool()
+    return statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이력서 일괄 추출 (NDJSON 출력)")
+    parser.add_argument("source", help="PDF 디렉토리 또는 URL/경로 목록 파일")
+    parser.add_argument("-o", "--output", help="결과 NDJSON 파일 (기본: stdout)")
+    args = parser.parse_args()
+
+    sources = load_sources(args.source)
+    if not sources:
+        print("❌ 처리할 이력서가 없습니다.", file=sys.stderr)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    # 파이프라인 진행 로그(print)는 stderr로 보내 stdout NDJSON과 섞이지 않게 함
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        with redirect_stdout(sys.stderr):
+            statuses = asyncio.run(run(sources, output))
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"📊 {len(sources)}건 처리 - {dict(statuses)}, {elapsed:.1f}s "
+        f"({len(sources) / elapsed:.2f}건/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
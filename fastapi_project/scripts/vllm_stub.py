@@ -0,0 +1,141 @@
+"""
+로컬 테스트용 vLLM 스텁 서버 (GPU 없이 replica 라우팅/헤징/장애 동작 확인)
+
+제공 엔드포인트:
+    POST /v1/chat/completions  - 마지막 메시지를 되돌려줌 (stream=true 지원)
+    GET  /health               - 200 (또는 --unhealthy 시 503)
+    GET  /metrics              - vllm:num_requests_running / waiting, prefix cache 적중 수
+
+--prefill-ms-per-kchar 를 주면 vLLM automatic prefix caching을 흉내냅니다.
+프롬프트를 16글자 블록으로 나눠 앞에서부터 이미 본 블록은 캐시 적중으로 보고,
+캐시되지 않은 글자 수에 비례해 첫 토큰 전(prefill) 지연을 둡니다.
+
+실행 (fastapi_project 디렉토리에서, replica 두 개 예시):
+    python -m scripts.vllm_stub --port 8001
+    python -m scripts.vllm_stub --port 8002 --delay 2.0
+    VLLM_URLS=http://localhost:8001,http://localhost:8002 uvicorn app.main:app
+"""
+import json
+import asyncio
+import hashlib
+import argparse
+from collections import OrderedDict
+
+from aiohttp import web
+
+
+PREFIX_BLOCK_CHARS = 16
+PREFIX_CACHE_BLOCKS = 100_000
+
+
+def build_app(
+    delay: float,
+    max_running: int,
+    fail_rate: float,
+    unhealthy: bool,
+    prefill_ms_per_kchar: float = 0.0,
+) -> web.Application:
+    state = {"running": 0, "waiting": 0, "served": 0, "prefix_queries": 0, "prefix_hits": 0}
+    semaphore = asyncio.Semaphore(max_running)
+    prefix_cache: "OrderedDict[str, None]" = OrderedDict()
+
+    def prefill_seconds(messages) -> float:
+        """앞에서부터 연속으로 캐시된 블록까지만 적중 (vLLM 블록 해시 체인과 동일한 방식)"""
+        prompt = "".join(f"<{m.get('role')}>{m.get('content') or ''}" for m in messages)
+        digest = hashlib.sha256()
+        cached = True
+        uncached_chars = 0
+        for i in range(0, len(prompt), PREFIX_BLOCK_CHARS):
+            block = prompt[i : i + PREFIX_BLOCK_CHARS]
+            digest.update(block.encode("utf-8"))
+            key = digest.hexdigest()
+            state["prefix_queries"] += len(block)
+            if cached and key in prefix_cache:
+                prefix_cache.move_to_end(key)
+                state["prefix_hits"] += len(block)
+                continue
+            cached = False
+            uncached_chars += len(block)
+            prefix_cache[key] = None
+        while len(prefix_cache) > PREFIX_CACHE_BLOCKS:
+            prefix_cache.popitem(last=False)
+        return uncached_chars / 1000 * prefill_ms_per_kchar / 1000
+
+    async def chat(request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        text = f"[{request.url.port}] " + (body["messages"][-1]["content"] or "")[:50]
+
+        state["served"] += 1
+        if fail_rate and (state["served"] % round(1 / fail_rate)) == 0:
+            return web.Response(status=503, text="stub failure")
+
+        state["waiting"] += 1
+        async with semaphore:
+            state["waiting"] -= 1
+            state["running"] += 1
+            try:
+                if prefill_ms_per_kchar:
+                    await asyncio.sleep(prefill_seconds(body.get("messages") or []))
+                await asyncio.sleep(delay)
+                if body.get("stream"):
+                    response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+                    await response.prepare(request)
+                    for ch in text:
+                        chunk = {"choices": [{"delta": {"content": ch}}]}
+                        await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                    usage = {"choices": [], "usage": {"prompt_tokens": 0, "completion_tokens": len(text)}}
+                    await response.write(f"data: {json.dumps(usage)}\n\n".encode())
+                    await response.write(b"data: [DONE]\n\n")
+                    return response
+
+                return web.json_response(
+                    {
+                        "choices": [{"message": {"role": "assistant", "content": text}}],
+                        "usage": {"prompt_tokens": 0, "completion_tokens": len(text)},
+                    }
+                )
+            finally:
+                state["running"] -= 1
+
+    async def health(request: web.Request) -> web.Response:
+        return web.Response(status=503 if unhealthy else 200)
+
+    async def metrics(request: web.Request) -> web.Response:
+        return web.Response(
+            text=(
+                f'vllm:num_requests_running{{model_name="stub"}} {float(state["running"])}\n'
+                f'vllm:num_requests_waiting{{model_name="stub"}} {float(state["waiting"])}\n'
+                f'vllm:prefix_cache_queries_total{{model_name="stub"}} {float(state["prefix_queries"])}\n'
+                f'vllm:prefix_cache_hits_total{{model_name="stub"}} {float(state["prefix_hits"])}\n'
+            )
+        )
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", chat)
+    app.router.add_get("/health", health)
+    app.router.add_get("/metrics", metrics)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="vLLM 스텁 서버")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--delay", type=float, default=0.1, help="응답 지연 (초)")
+    parser.add_argument("--max-running", type=int, default=8, help="동시 처리 수 (초과분은 대기열)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="503 응답 비율 (0~1)")
+    parser.add_argument("--unhealthy", action="store_true", help="/health 가 503 반환")
+    parser.add_argument(
+        "--prefill-ms-per-kchar", type=float, default=0.0,
+        help="캐시되지 않은 프롬프트 1000글자당 prefill 지연 (ms, 0이면 prefix cache 흉내 안 냄)",
+    )
+    args = parser.parse_args()
+
+    app = build_app(
+        args.delay, args.max_running, args.fail_rate, args.unhealthy, args.prefill_ms_per_kchar
+    )
+    print(f"🚀 vLLM 스텁 서버 시작 - port={args.port}, delay={args.delay}s")
+    web.run_app(app, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()